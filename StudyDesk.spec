@@ -8,7 +8,7 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('lyy.ico', '.'), ('dicts/*', 'dicts/')],
+    datas=[('lyy.ico', '.'), ('dicts_catalog.json', '.'), ('dicts.pack', '.'), ('dicts_manifest.json', '.')],
     hiddenimports=['win32timezone','requests', 'playsound'],
     hookspath=[],
     hooksconfig={},
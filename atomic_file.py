@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+# 防崩溃的文件持久化：先写临时文件并 fsync，再原子改名覆盖目标；目标原有内容先以硬链接（不支持时复制）保留为 .bak，
+# 改名前后目标文件始终存在。写入时附带 blake2b 校验和，读取时校验，目标文件截断、损坏或校验失败时改读 .bak；
+# 目标文件不存在（如被用户删除）时不从 .bak 恢复。没有校验和的旧文件按原样接受。
+# 校验和的位置：
+#   JSON 文件（配置、会话快照）存在旁边的 <文件名>.sum 中，文件本身仍是普通 JSON，旧版本与其它工具可以直接读写；
+#     文件比 .sum 新且能正常解析时视为被外部修改过，直接接受而不改读 .bak
+#   marshal 等二进制文件在末尾附加一行 "\n#blake2b:<32 位十六进制>\n"
+# 配置与复习数据用 fsync + .bak；可重建的缓存（快照、索引）只需原子替换与校验，跳过 fsync 与 .bak。
+# 写入有磁盘同步，应在后台线程（如 WriteBehind、日志压缩线程）中调用。
+import hashlib
+import json
+import marshal
+import os
+import shutil
+
+_TRAILER_PREFIX = b'\n#blake2b:'
+_TRAILER_LEN = len(_TRAILER_PREFIX) + 32 + 1
+SUM_EXT = '.sum'
+
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest().encode('ascii')
+
+
+def backup_path_for(path):
+    return path + '.bak'
+
+
+def sum_path_for(path):
+    return path + SUM_EXT
+
+
+def _fsync_dir(path):
+    # 让改名本身也落盘；Windows 不支持对目录 fsync，直接跳过
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_file(path, data, fsync):
+    with open(path, 'wb') as f:
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def _keep_backup(path):
+    # 把当前文件保留为 .bak，目标文件本身不动（之后由改名整体替换）
+    bak_tmp = backup_path_for(path) + '.tmp'
+    try:
+        if os.path.exists(bak_tmp):
+            os.remove(bak_tmp)
+        os.link(path, bak_tmp)
+    except OSError:
+        shutil.copyfile(path, bak_tmp)
+    os.replace(bak_tmp, backup_path_for(path))
+
+
+def atomic_write(path, data, backup=True, fsync=True, sidecar=False):
+    # data 为 bytes 或 str（按 UTF-8 编码）；sidecar=True 时校验和写到 .sum 文件，data 原样写入
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    digest = _digest(data)
+    tmp_path = path + '.tmp'
+    _write_file(tmp_path, data if sidecar else data + _TRAILER_PREFIX + digest + b'\n', fsync)
+    if backup and os.path.exists(path):
+        _keep_backup(path)
+        if os.path.exists(sum_path_for(path)):
+            _keep_backup(sum_path_for(path))
+    os.replace(tmp_path, path)
+    if sidecar:
+        # 在目标之后替换：中途退出时新内容与旧校验和不一致，读取时改读 .bak
+        _write_file(tmp_path, digest + b'\n', fsync)
+        os.replace(tmp_path, sum_path_for(path))
+    if fsync:
+        _fsync_dir(path)
+
+
+def _read_one(path):
+    # 返回 (内容, 是否可信, 是否在校验和之后被修改)：校验通过或没有校验和为可信；文件不存在返回 (None, False, False)
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return None, False, False
+    trailer = raw[-_TRAILER_LEN:]
+    if trailer.startswith(_TRAILER_PREFIX) and trailer.endswith(b'\n'):
+        payload = raw[:-_TRAILER_LEN]
+        return payload, trailer[len(_TRAILER_PREFIX):-1] == _digest(payload), False
+    try:
+        with open(sum_path_for(path), 'rb') as f:
+            expected = f.read().strip()
+        edited = os.path.getmtime(path) > os.path.getmtime(sum_path_for(path))
+    except OSError:
+        return raw, True, False
+    return raw, expected == _digest(raw), edited
+
+
+def _parse(path, loads, use_backup):
+    # 目标文件不存在时返回 None；不可用时依次尝试 .bak，
+    # 都不可用时，校验失败但能解析的目标文件仍然接受
+    if not os.path.exists(path):
+        return None
+    suspect = None
+    for candidate in ((path, backup_path_for(path)) if use_backup else (path,)):
+        data, ok, edited = _read_one(candidate)
+        if data is None:
+            continue
+        if not ok and not edited:
+            print(f"文件校验失败: {candidate}")
+            if candidate == path:
+                suspect = data
+            continue
+        try:
+            result = loads(data)
+        except Exception as e:
+            print(f"文件解析失败: {candidate} - {e}")
+            continue
+        if candidate != path:
+            print(f"已从备份恢复: {candidate}")
+        return result
+    if suspect is not None:
+        try:
+            return loads(suspect)
+        except Exception:
+            pass
+    return None
+
+
+def atomic_write_json(path, obj, backup=True, fsync=True, **dump_kwargs):
+    dump_kwargs.setdefault('ensure_ascii', False)
+    atomic_write(path, json.dumps(obj, **dump_kwargs), backup=backup, fsync=fsync, sidecar=True)
+
+
+def read_json(path, default=None, use_backup=True):
+    result = _parse(path, lambda data: json.loads(data.decode('utf-8')), use_backup)
+    return default if result is None else result
+
+
+def atomic_write_marshal(path, obj, backup=False, fsync=False):
+    atomic_write(path, marshal.dumps(obj), backup=backup, fsync=fsync)
+
+
+def read_marshal(path, default=None, use_backup=False):
+    result = _parse(path, marshal.loads, use_backup)
+    return default if result is None else result
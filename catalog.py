@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# 词典注册表：数据保存在 dicts_catalog.json 中，首次使用时才加载，并按 id/url/category/language/tags 建立索引
+# 文件结构：
+#   groups   : {分组变量名: [词典条目, ...]}，与旧 dictionary.py 中的 chinaExam / programming 等列表一一对应
+#   all_dicts: {托盘菜单分类名: 分组变量名}
+import json
+import os
+import sys
+import threading
+
+CATALOG_FILE = 'dicts_catalog.json'
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def catalog_path():
+    try:
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_path, CATALOG_FILE)
+
+
+class DictCatalog:
+    def __init__(self, data):
+        self.version = data.get('version', 1)
+        self.groups = data.get('groups') or {}
+        self.all_dicts = {label: self.groups.get(group, []) for label, group in (data.get('all_dicts') or {}).items()}
+        self._indexes = None
+
+    def _build_indexes(self):
+        by_id, by_url, by_category, by_language, by_tag, menu_of_url = {}, {}, {}, {}, {}, {}
+        for entries in self.groups.values():
+            for entry in entries:
+                # id / url 重复时保留第一次出现的条目
+                by_id.setdefault(entry.get('id'), entry)
+                by_url.setdefault(entry.get('url'), entry)
+                by_category.setdefault(entry.get('category'), []).append(entry)
+                by_language.setdefault(entry.get('language'), []).append(entry)
+                for tag in entry.get('tags') or []:
+                    by_tag.setdefault(tag, []).append(entry)
+        for label, entries in self.all_dicts.items():
+            for entry in entries:
+                menu_of_url.setdefault(entry.get('url'), label)
+        self._indexes = {
+            'id': by_id,
+            'url': by_url,
+            'category': by_category,
+            'language': by_language,
+            'tag': by_tag,
+            'menu': menu_of_url,
+        }
+        return self._indexes
+
+    def _index(self, name):
+        indexes = self._indexes or self._build_indexes()
+        return indexes[name]
+
+    def by_id(self, dict_id):
+        return self._index('id').get(dict_id)
+
+    def by_url(self, url):
+        return self._index('url').get(url)
+
+    def by_category(self, category):
+        return self._index('category').get(category, [])
+
+    def by_language(self, language):
+        return self._index('language').get(language, [])
+
+    def by_tag(self, tag):
+        return self._index('tag').get(tag, [])
+
+    def menu_category_of(self, url):
+        # 返回 url 所在的托盘菜单分类（all_dicts 的键），不在菜单中时返回 None
+        return self._index('menu').get(url)
+
+    def iter_entries(self, menu_only=True):
+        groups = self.all_dicts.values() if menu_only else self.groups.values()
+        for entries in groups:
+            yield from entries
+
+    def iter_urls(self, menu_only=True):
+        seen = set()
+        for entry in self.iter_entries(menu_only):
+            url = entry.get('url')
+            if url and url not in seen:
+                seen.add(url)
+                yield url
+
+
+def load_catalog(path=None):
+    with open(path or catalog_path(), 'r', encoding='utf-8') as f:
+        return DictCatalog(json.load(f))
+
+
+def get_catalog():
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                try:
+                    _catalog = load_catalog()
+                except Exception as e:
+                    print(f"词典目录加载失败: {e}")
+                    _catalog = DictCatalog({})
+    return _catalog
+
+
+def write_catalog(groups, all_dicts, path=None):
+    # 每个词典条目占一行，便于 diff
+    lines = ['{', '  "version": 1,', '  "groups": {']
+    group_items = list(groups.items())
+    for gi, (group, entries) in enumerate(group_items):
+        lines.append(f'    {json.dumps(group, ensure_ascii=False)}: [')
+        for ei, entry in enumerate(entries):
+            lines.append('      ' + json.dumps(entry, ensure_ascii=False) + (',' if ei < len(entries) - 1 else ''))
+        lines.append('    ]' + (',' if gi < len(group_items) - 1 else ''))
+    lines.append('  },')
+    lines.append('  "all_dicts": ' + json.dumps(all_dicts, ensure_ascii=False))
+    lines.append('}')
+    target = path or catalog_path()
+    tmp_path = target + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    os.replace(tmp_path, target)
+
+
+# ---------------------------------------------------------------------------
+# 启动基准：旧方案 import 一个由字面量构成的 Python 模块，新方案读取 JSON 目录
+# 用法: python catalog.py --bench
+
+def _legacy_module_source(data):
+    # 按旧 dictionary.py 的形式生成等价源码（每个分组一个列表字面量 + all_dicts）
+    import pprint
+    parts = []
+    for group, entries in data['groups'].items():
+        parts.append(f"{group} = {pprint.pformat(entries, indent=4, sort_dicts=False)}\n")
+    menu = ',\n'.join(f"    {label!r}: {group}" for label, group in data['all_dicts'].items())
+    parts.append(f"all_dicts = {{\n{menu}\n}}\n")
+    return '\n'.join(parts)
+
+
+def run_startup_benchmark(repeat=20):
+    import marshal
+    import time
+
+    with open(catalog_path(), 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    source = _legacy_module_source(data)
+    code_bytes = marshal.dumps(compile(source, 'dictionary.py', 'exec'))
+
+    def best_of(fn):
+        best = float('inf')
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - t0)
+        return best * 1000
+
+    def cold_import():
+        exec(compile(source, 'dictionary.py', 'exec'), {})
+
+    def warm_import():
+        exec(marshal.loads(code_bytes), {})
+
+    def catalog_load():
+        load_catalog()
+
+    def catalog_load_indexed():
+        cat = load_catalog()
+        cat.by_id('cet4')
+
+    print(f"旧 dictionary.py（{source.count(chr(10))} 行）:")
+    print(f"  无 .pyc 编译 + 执行 : {best_of(cold_import):8.2f} ms")
+    print(f"  有 .pyc 反序列化 + 执行: {best_of(warm_import):8.2f} ms")
+    print(f"新 {CATALOG_FILE}（{os.path.getsize(catalog_path())} 字节）:")
+    print(f"  json 加载           : {best_of(catalog_load):8.2f} ms")
+    print(f"  json 加载 + 建索引   : {best_of(catalog_load_indexed):8.2f} ms")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == '--bench':
+        run_startup_benchmark()
+    else:
+        print("用法: python catalog.py --bench")
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# 在进程池里对 catalog 中的全部词典执行同一个任务（拼写索引、音标索引、词库校验等共用）。
+# 本地没有的词典从 dicts.pack 读取；sources_signature 汇总各来源文件的 size / mtime，
+# 供持久化的跨词典索引判断是否需要重建。
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+
+def dict_sources(base_dir='.', menu_only=False):
+    # 返回 [(url, 文件路径或 None)]，按 catalog 顺序；None 表示从 dicts.pack 读取
+    from catalog import get_catalog
+    from dict_pack import PACK_FILE, get_pack
+    pack = get_pack(os.path.join(base_dir, PACK_FILE))
+    sources = []
+    for url in get_catalog().iter_urls(menu_only=menu_only):
+        full_path = os.path.join(base_dir, url)
+        if os.path.exists(full_path):
+            sources.append((url, full_path))
+        elif pack is not None and url in pack:
+            sources.append((url, None))
+    return sources
+
+
+def source_path(base_dir, full_path):
+    from dict_pack import PACK_FILE
+    return full_path or os.path.join(base_dir, PACK_FILE)
+
+
+def sources_signature(base_dir, sources):
+    h = hashlib.blake2b(digest_size=16)
+    for url, full_path in sources:
+        st = os.stat(source_path(base_dir, full_path))
+        h.update(f'{url}\0{st.st_size}\0{st.st_mtime_ns}\n'.encode('utf-8'))
+    return h.hexdigest()
+
+
+def open_source_words(base_dir, url, full_path):
+    from word_list import WordList
+    if full_path is None:
+        from dict_pack import PACK_FILE, get_pack
+        return WordList(get_pack(os.path.join(base_dir, PACK_FILE)).open_dict(url))
+    return WordList.from_file(full_path)
+
+
+def _run(job):
+    task, base_dir, url, full_path = job
+    try:
+        return url, task(base_dir, url, full_path), None
+    except Exception as e:
+        return url, None, str(e)
+
+
+def _with_words(task, base_dir, url, full_path):
+    return task(url, open_source_words(base_dir, url, full_path))
+
+
+def map_sources(task, base_dir='.', sources=None, workers=None):
+    # task(base_dir, url, full_path) 必须是模块级函数（进程间按名字传递）；返回 [(url, 结果, 错误信息)]
+    if sources is None:
+        sources = dict_sources(base_dir)
+    jobs = [(task, base_dir, url, full_path) for url, full_path in sources]
+    if len(jobs) <= 1:
+        return [_run(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run, jobs, chunksize=4))
+
+
+def scan_dicts(task, base_dir='.', sources=None, workers=None):
+    # 同 map_sources，但 task(url, words) 直接拿到已加载的词表
+    return map_sources(partial(_with_words, task), base_dir, sources, workers)
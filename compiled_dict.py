@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# 编译后的二进制词典格式（.sdd），通过 mmap 按需解码第 N 个词条
+# 文件布局：
+#   header : magic b'SDD1' | uint32 词条数 count            （小端）
+#   offsets: (count + 1) 个 uint32，为 records 区内每个词条的起止位置
+#   records: 每个词条为 UTF-8 字节，字段以 \x1f 分隔：
+#            name \x1f usphone \x1f ukphone \x1f trans(以 \x1e 连接) [\x1f 其它字段的 JSON]
+#            源数据中缺失的字段记为 \x00，解码时不生成该键；
+#            值本身含 \x1f / \x1e / \x00 的字段也记为 \x00，值放在附加字段的 JSON 中
+import json
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b'SDD1'
+COMPILED_EXT = '.sdd'
+_HEADER = struct.Struct('<4sI')
+_OFFSET = struct.Struct('<I')
+_SPAN = struct.Struct('<II')
+FIELD_SEP = '\x1f'
+TRANS_SEP = '\x1e'
+MISSING = '\x00'
+_BASE_FIELDS = ('name', 'trans', 'usphone', 'ukphone')
+
+
+def compiled_path_for(json_path):
+    return os.path.splitext(json_path)[0] + COMPILED_EXT
+
+
+def _has_reserved(text):
+    return FIELD_SEP in text or TRANS_SEP in text or MISSING in text
+
+
+def _trans_fits(trans):
+    # 能否按 \x1e 连接放进 trans 字段并原样解码回来（[''] 会被解码成 []）
+    return isinstance(trans, list) and trans != [''] and not any(_has_reserved(str(t)) for t in trans)
+
+
+def encode_record(word):
+    # 含分隔符或缺失标记（\x1f / \x1e / \x00）的字段值不能直接写进定长字段：
+    # 该字段记为缺失，值改放到附加字段的 JSON 中（JSON 会把这些控制字符转义成 \u001f 等），解码后原样恢复
+    extra = {k: v for k, v in word.items() if k not in _BASE_FIELDS}
+    fields = []
+    for key in ('name', 'usphone', 'ukphone'):
+        value = word.get(key)
+        if value is None:
+            fields.append(MISSING)
+        elif _has_reserved(str(value)):
+            fields.append(MISSING)
+            extra[key] = value
+        else:
+            fields.append(str(value))
+    trans = word.get('trans')
+    if _trans_fits(trans):
+        fields.append(TRANS_SEP.join(str(t) for t in trans))
+    else:
+        # 非标准类型的 trans（如字符串）同样原样放入附加字段
+        fields.append(MISSING)
+        if 'trans' in word:
+            extra['trans'] = trans
+    if extra:
+        fields.append(json.dumps(extra, ensure_ascii=False, separators=(',', ':')))
+    return FIELD_SEP.join(fields).encode('utf-8')
+
+
+def decode_record(raw):
+    fields = raw.decode('utf-8').split(FIELD_SEP, 4)
+    word = {}
+    if fields[0] != MISSING:
+        word['name'] = fields[0]
+    if fields[3] != MISSING:
+        word['trans'] = fields[3].split(TRANS_SEP) if fields[3] else []
+    if fields[1] != MISSING:
+        word['usphone'] = fields[1]
+    if fields[2] != MISSING:
+        word['ukphone'] = fields[2]
+    if len(fields) > 4:
+        word.update(json.loads(fields[4]))
+    return word
+
+
+def write_compiled_dict(words, out_path):
+    records = [encode_record(w) for w in words]
+    offsets = [0]
+    for rec in records:
+        offsets.append(offsets[-1] + len(rec))
+    tmp_path = out_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, len(records)))
+        f.write(struct.pack(f'<{len(offsets)}I', *offsets))
+        for rec in records:
+            f.write(rec)
+    os.replace(tmp_path, out_path)
+    return len(records)
+
+
+def compile_json_dict(json_path, out_path=None):
+    with open(json_path, 'r', encoding='utf-8') as f:
+        words = json.load(f)
+    return write_compiled_dict(words, out_path or compiled_path_for(json_path))
+
+
+class CompiledDict:
+    """mmap 支持的只读词典视图，支持 len / 下标 / 迭代，访问时才解码词条。"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"不是有效的编译词典文件: {path}")
+        self._offsets_at = _HEADER.size
+        self._records_at = self._offsets_at + (self._count + 1) * _OFFSET.size
+
+    def __len__(self):
+        return self._count
+
+    def raw_record(self, index):
+        start, end = _SPAN.unpack_from(self._mm, self._offsets_at + index * _OFFSET.size)
+        return self._mm[self._records_at + start:self._records_at + end]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('词条下标越界')
+        return decode_record(self.raw_record(index))
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    @property
+    def nbytes(self):
+        return len(self._mm)
+
+    def close(self):
+        try:
+            self._mm.close()
+        except Exception:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_compiled_dict(json_path):
+    # 存在且不旧于源 JSON 的编译文件才会被使用；否则返回 None 由调用方回退到 json.load
+    compiled = compiled_path_for(json_path)
+    if not os.path.exists(compiled):
+        return None
+    try:
+        if os.path.exists(json_path) and os.path.getmtime(compiled) < os.path.getmtime(json_path):
+            return None
+        return CompiledDict(compiled)
+    except Exception as e:
+        print(f"编译词典打开失败: {compiled} - {e}")
+        return None
+
+
+def build_compiled_dicts(base_dir='.', force=False):
+    # 将 all_dicts 中引用的 ./dicts/*.json 全部转换为 .sdd
+    from catalog import get_catalog
+    built, skipped, missing = 0, 0, 0
+    for url in get_catalog().iter_urls():
+        json_path = os.path.join(base_dir, url)
+        if not os.path.exists(json_path):
+            missing += 1
+            continue
+        out_path = compiled_path_for(json_path)
+        if not force and os.path.exists(out_path) and os.path.getmtime(out_path) >= os.path.getmtime(json_path):
+            skipped += 1
+            continue
+        try:
+            count = compile_json_dict(json_path, out_path)
+            built += 1
+            print(f"✅ {url} -> {os.path.basename(out_path)} ({count} 词)")
+        except Exception as e:
+            print(f"编译失败: {url} - {e}")
+    print(f"完成：编译 {built}，跳过 {skipped}，缺失 {missing}")
+    return built
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if a != '--force']
+    build_compiled_dicts(args[0] if args else '.', force='--force' in sys.argv)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# 进程内词典缓存：按 url 缓存已加载的词表，超出字节预算时淘汰最久未使用的词典
+import threading
+from collections import OrderedDict
+
+DEFAULT_BUDGET_MB = 64
+
+
+def estimate_nbytes(words):
+    # WordList / CompiledDict 自带 nbytes；普通列表粗略按每个词条 300 字节估算
+    nbytes = getattr(words, 'nbytes', None)
+    if nbytes is not None:
+        return nbytes
+    try:
+        return len(words) * 300
+    except TypeError:
+        return 0
+
+
+class DictCache:
+    def __init__(self, max_bytes=DEFAULT_BUDGET_MB * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # url -> (words, nbytes)
+        self._lock = threading.RLock()
+
+    def __contains__(self, url):
+        with self._lock:
+            return url in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(url)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, url, words, nbytes=None):
+        if nbytes is None:
+            nbytes = estimate_nbytes(words)
+        with self._lock:
+            old = self._entries.pop(url, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+            self._entries[url] = (words, nbytes)
+            self.total_bytes += nbytes
+            self._evict()
+
+    def get_or_load(self, url, loader):
+        words = self.get(url)
+        if words is not None:
+            return words
+        words = loader(url)
+        # 加载失败（空词表）不缓存，下次仍会重试
+        if words:
+            self.put(url, words)
+        return words
+
+    def set_budget(self, max_bytes):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def _evict(self):
+        # 至少保留最近使用的一个词典，即使它本身超出预算
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self.total_bytes -= nbytes
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'total_bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# 词典打包格式（dicts.pack）：把全部词典压缩进一个文件，代替 PyInstaller 打包的数百个零散 JSON
+# 文件布局：
+#   header : magic b'SDPK' | uint8 codec (0=zlib, 1=lzma) | uint32 索引长度
+#   index  : zlib 压缩的 JSON {url: {"count": n, "block_size": b, "blocks": [[offset, length], ...]}}
+#   blocks : 每块独立压缩，解压后为 uint32 词条数 + (n + 1) 个 uint32 偏移 + 记录（格式同 compiled_dict）
+# 读取时只解压用到的块，读一个词条无需解开其它词典或同一词典的其它块
+import json
+import lzma
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+
+from compiled_dict import encode_record, decode_record
+
+PACK_FILE = 'dicts.pack'
+MAGIC = b'SDPK'
+CODEC_ZLIB = 0
+CODEC_LZMA = 1
+DEFAULT_BLOCK_SIZE = 512
+_HEADER = struct.Struct('<4sBI')
+_U32 = struct.Struct('<I')
+
+_packs = {}
+_packs_lock = threading.Lock()
+
+
+def _compress(codec, data):
+    return lzma.compress(data, preset=6) if codec == CODEC_LZMA else zlib.compress(data, 9)
+
+
+def _decompress(codec, data):
+    return lzma.decompress(data) if codec == CODEC_LZMA else zlib.decompress(data)
+
+
+def _encode_block(words):
+    records = [encode_record(w) for w in words]
+    offsets = [0]
+    for rec in records:
+        offsets.append(offsets[-1] + len(rec))
+    return _U32.pack(len(records)) + struct.pack(f'<{len(offsets)}I', *offsets) + b''.join(records)
+
+
+class _Block:
+    __slots__ = ('data', 'records_at')
+
+    def __init__(self, data):
+        count = _U32.unpack_from(data, 0)[0]
+        self.data = data
+        self.records_at = _U32.size * (count + 2)
+
+    def raw_record(self, i):
+        start, end = struct.unpack_from('<II', self.data, _U32.size * (i + 1))
+        return self.data[self.records_at + start:self.records_at + end]
+
+
+class PackedDictView:
+    """dicts.pack 中单个词典的只读视图，按块解压并缓存最近使用的几个块。"""
+
+    MAX_BLOCKS = 4
+
+    def __init__(self, pack, url, meta):
+        self.pack = pack
+        self.url = url
+        self._count = meta['count']
+        self._block_size = meta['block_size']
+        self._blocks = meta['blocks']
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._count
+
+    def _block(self, block_no):
+        with self._lock:
+            block = self._cache.get(block_no)
+            if block is not None:
+                self._cache.move_to_end(block_no)
+                return block
+        offset, length = self._blocks[block_no]
+        block = _Block(self.pack.read_block(offset, length))
+        with self._lock:
+            self._cache[block_no] = block
+            while len(self._cache) > self.MAX_BLOCKS:
+                self._cache.popitem(last=False)
+        return block
+
+    def raw_record(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('词条下标越界')
+        block_no, i = divmod(index, self._block_size)
+        return self._block(block_no).raw_record(i)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        return decode_record(self.raw_record(index))
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    @property
+    def nbytes(self):
+        return sum(len(b.data) for b in list(self._cache.values()))
+
+
+class DictPack:
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.codec, index_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"不是有效的词典包: {path}")
+        index_at = _HEADER.size
+        self.index = json.loads(zlib.decompress(self._mm[index_at:index_at + index_len]).decode('utf-8'))
+        self._data_at = index_at + index_len
+
+    def __contains__(self, url):
+        return url in self.index
+
+    def urls(self):
+        return list(self.index)
+
+    def read_block(self, offset, length):
+        start = self._data_at + offset
+        return _decompress(self.codec, self._mm[start:start + length])
+
+    def open_dict(self, url):
+        meta = self.index.get(url)
+        if meta is None:
+            raise KeyError(url)
+        return PackedDictView(self, url, meta)
+
+
+def get_pack(path):
+    # 同一路径的词典包只打开一次；文件不存在时返回 None
+    with _packs_lock:
+        if path in _packs:
+            return _packs[path]
+        pack = None
+        if os.path.exists(path):
+            try:
+                pack = DictPack(path)
+            except Exception as e:
+                print(f"词典包打开失败: {path} - {e}")
+        _packs[path] = pack
+        return pack
+
+
+def write_pack(dicts, out_path, block_size=DEFAULT_BLOCK_SIZE, codec=CODEC_ZLIB):
+    # dicts: 可迭代的 (url, 词条列表)；返回打包的词典数
+    index, chunks, offset = {}, [], 0
+    for url, words in dicts:
+        blocks = []
+        for start in range(0, len(words), block_size):
+            data = _compress(codec, _encode_block(words[start:start + block_size]))
+            blocks.append([offset, len(data)])
+            chunks.append(data)
+            offset += len(data)
+        index[url] = {'count': len(words), 'block_size': block_size, 'blocks': blocks}
+    index_bytes = zlib.compress(json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), 9)
+    tmp_path = out_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, codec, len(index_bytes)))
+        f.write(index_bytes)
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, out_path)
+    return len(index)
+
+
+def build_pack(base_dir='.', out_path=None, block_size=DEFAULT_BLOCK_SIZE, codec=CODEC_ZLIB):
+    from catalog import get_catalog
+    out_path = out_path or os.path.join(base_dir, PACK_FILE)
+    missing = 0
+
+    def read_dicts():
+        nonlocal missing
+        for url in get_catalog().iter_urls(menu_only=False):
+            full_path = os.path.join(base_dir, url)
+            if not os.path.exists(full_path):
+                missing += 1
+                continue
+            try:
+                with open(full_path, 'r', encoding='utf-8') as f:
+                    words = json.load(f)
+            except Exception as e:
+                print(f"读取失败: {url} - {e}")
+                continue
+            yield url, words
+
+    count = write_pack(read_dicts(), out_path, block_size, codec)
+    print(f"✅ 已打包 {count} 个词典到 {out_path}（{os.path.getsize(out_path) // 1024} KB），缺失 {missing}")
+    return count
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    build_pack(args[0] if args else '.', codec=CODEC_LZMA if '--lzma' in sys.argv else CODEC_ZLIB)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# 同分类词典的后台预加载：界面空闲后在低优先级线程中解析当前分类下的其它词典，放入 DictCache
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _lower_thread_priority():
+    # Windows 下把预加载线程降到最低优先级；其它平台无逐线程优先级接口，忽略
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        kernel32.SetThreadPriority(kernel32.GetCurrentThread(), -2)  # THREAD_PRIORITY_LOWEST
+    except Exception:
+        pass
+
+
+class DictPrefetcher:
+    def __init__(self, cache, loader, size_hint=None, idle_seconds=2.0, max_bytes=None, prefetch_loader=None):
+        self.cache = cache
+        self.loader = loader
+        # 预加载在本线程内同步解析完再放入缓存（不走流式加载），缓存记账的字节数才是真实大小
+        self.prefetch_loader = prefetch_loader or loader
+        self.size_hint = size_hint
+        self.idle_seconds = idle_seconds
+        # 预加载只允许占用缓存预算的一半，避免把用户刚用过的词典挤出去
+        self.max_bytes = max_bytes if max_bytes is not None else cache.max_bytes // 2
+        self.enabled = True
+        self.category = None
+        self._generation = 0
+        self._last_activity = time.monotonic()
+        self._inflight = {}  # url -> threading.Event
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dict-prefetch',
+                                            initializer=_lower_thread_priority)
+
+    def notify_activity(self):
+        self._last_activity = time.monotonic()
+
+    def schedule(self, category, urls, current_url=None):
+        # 切换分类（或重新调度）时旧任务通过 generation 失效
+        if not self.enabled or self._stopped.is_set():
+            return
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self.category = category
+        siblings = [u for u in urls if u and u != current_url]
+        try:
+            self._executor.submit(self._run, generation, siblings)
+        except RuntimeError:
+            pass
+
+    def cancel(self):
+        with self._lock:
+            self._generation += 1
+            self.category = None
+
+    def shutdown(self):
+        self._stopped.set()
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_or_load(self, url):
+        # 该词典正在后台解析时等待其完成，而不是在前台重复解析一次
+        with self._lock:
+            pending = self._inflight.get(url)
+        if pending is not None:
+            pending.wait()
+        return self.cache.get_or_load(url, self.loader)
+
+    def _cancelled(self, generation):
+        return self._stopped.is_set() or generation != self._generation
+
+    def _wait_idle(self, generation):
+        while not self._cancelled(generation):
+            idle_for = time.monotonic() - self._last_activity
+            if idle_for >= self.idle_seconds:
+                return True
+            self._stopped.wait(self.idle_seconds - idle_for)
+        return False
+
+    def _run(self, generation, urls):
+        for url in urls:
+            if not self._wait_idle(generation):
+                return
+            if url in self.cache:
+                continue
+            estimate = 0
+            if self.size_hint is not None:
+                try:
+                    estimate = self.size_hint(url)
+                except Exception:
+                    estimate = 0
+            if self.cache.total_bytes + estimate > self.max_bytes:
+                return
+            done = threading.Event()
+            with self._lock:
+                if self._cancelled(generation) or url in self._inflight:
+                    continue
+                self._inflight[url] = done
+            try:
+                words = self.prefetch_loader(url)
+                if words and not self._stopped.is_set():
+                    self.cache.put(url, words)
+            except Exception as e:
+                print(f"预加载词典失败: {url} - {e}")
+            finally:
+                with self._lock:
+                    self._inflight.pop(url, None)
+                done.set()
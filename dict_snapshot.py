@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# 已解析词典的持久化快照：把 WordList 的紧凑记录（bytes + 偏移数组）用 marshal 存到配置目录，
+# 热启动时直接读快照，跳过 JSON 解码。
+# 快照文件名由词典相对路径决定；文件内记录源文件 size / mtime_ns / 内容哈希用于失效判断：
+#   size 与 mtime 都一致      -> 直接使用
+#   size 一致但 mtime 变化    -> 比较内容哈希（PyInstaller 每次解压都会刷新 mtime）
+#   其它情况                  -> 失效，重新解析并覆盖快照
+import hashlib
+import os
+import tempfile
+
+from atomic_file import atomic_write_marshal, read_marshal
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_DIR = os.path.join(tempfile.gettempdir(), 'study_desk_snapshots')
+
+
+def snapshot_path_for(key, snapshot_dir=SNAPSHOT_DIR):
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+    return os.path.join(snapshot_dir, f"{digest}.snap")
+
+
+def file_digest(path):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load_snapshot(source_path, key=None, snapshot_dir=SNAPSHOT_DIR):
+    # 返回 (buf: bytes, offsets: bytes)；没有可用快照时返回 None
+    snap_path = snapshot_path_for(key or source_path, snapshot_dir)
+    if not os.path.exists(snap_path):
+        return None
+    try:
+        st = os.stat(source_path)
+        data = read_marshal(snap_path)
+        if not isinstance(data, dict) or data.get('version') != SNAPSHOT_VERSION or data.get('size') != st.st_size:
+            return None
+        if data.get('mtime_ns') != st.st_mtime_ns:
+            if data.get('digest') != file_digest(source_path):
+                return None
+            # 内容未变，仅 mtime 不同：更新快照中的 mtime，下次无需再算哈希
+            data['mtime_ns'] = st.st_mtime_ns
+            _write(snap_path, data)
+        return data['buf'], data['offsets']
+    except FileNotFoundError:
+        # 源文件已被删除：快照作废
+        return None
+    except Exception as e:
+        print(f"词典快照读取失败: {snap_path} - {e}")
+        return None
+
+
+def save_snapshot(source_path, buf, offsets, key=None, snapshot_dir=SNAPSHOT_DIR):
+    snap_path = snapshot_path_for(key or source_path, snapshot_dir)
+    try:
+        st = os.stat(source_path)
+        os.makedirs(snapshot_dir, exist_ok=True)
+        _write(snap_path, {
+            'version': SNAPSHOT_VERSION,
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'digest': file_digest(source_path),
+            'buf': bytes(buf),
+            'offsets': bytes(offsets),
+        })
+        return True
+    except Exception as e:
+        print(f"词典快照保存失败: {snap_path} - {e}")
+        return False
+
+
+def _write(snap_path, data):
+    atomic_write_marshal(snap_path, data)
+
+
+def clear_snapshots(snapshot_dir=SNAPSHOT_DIR):
+    if not os.path.isdir(snapshot_dir):
+        return 0
+    removed = 0
+    for name in os.listdir(snapshot_dir):
+        if name.endswith('.snap'):
+            try:
+                os.remove(os.path.join(snapshot_dir, name))
+                removed += 1
+            except OSError:
+                pass
+    return removed
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# 词库校验：在进程池里加载 catalog 中的全部词典，逐个检查
+#   编码（严格 UTF-8、BOM、替换字符、与 .sdd 分隔符冲突的控制字符）
+#   结构（顶层数组；name / trans / usphone / ukphone 的类型与缺失）
+#   词条数与注册表 length 是否一致、重复的 name
+# 并写出清单 dicts_manifest.json（大小、blake2b 校验和、词条数、读取/解析耗时、问题列表），
+# 发布前用来发现损坏或过慢的词典；运行时用清单中的词条数作为加载时的长度提示。
+# 用法: python dict_validator.py [词典根目录] [--output dicts_manifest.json] [--workers N]
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from catalog_scan import dict_sources, map_sources, open_source_words
+
+MANIFEST_FILE = 'dicts_manifest.json'
+MANIFEST_VERSION = 1
+MAX_SAMPLES = 3
+
+_FIELDS = ('name', 'trans', 'usphone', 'ukphone')
+# compiled_dict 用 \x1f / \x1e 分隔字段，\x00 表示缺失字段；含这些字符的值会被挪到附加字段，能正确往返但多半是脏数据
+_RESERVED_CHARS = ('\x00', '\x1e', '\x1f')
+
+
+class _Issues:
+    """按问题类型计数，并保留前几个出错的词条位置。"""
+
+    def __init__(self):
+        self._items = {}
+
+    def add(self, kind, where=None):
+        item = self._items.setdefault(kind, [0, []])
+        item[0] += 1
+        if where is not None and len(item[1]) < MAX_SAMPLES:
+            item[1].append(where)
+
+    def to_list(self):
+        result = []
+        for kind, (count, samples) in self._items.items():
+            text = kind if count == 1 and not samples else f'{kind}：{count} 处'
+            if samples:
+                text += f"（如 {', '.join(str(s) for s in samples)}）"
+            result.append(text)
+        return result
+
+
+def _has_reserved(value):
+    return isinstance(value, str) and any(c in value for c in _RESERVED_CHARS)
+
+
+def check_entries(entries, errors, warnings):
+    # 检查词条结构，返回 name 列表（用于统计重复）
+    names = []
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            errors.add('词条不是对象', f'#{i}')
+            names.append(None)
+            continue
+        name = entry.get('name')
+        if not isinstance(name, str) or not name.strip():
+            errors.add('name 缺失或不是非空字符串', f'#{i}')
+            name = None
+        names.append(name)
+        trans = entry.get('trans')
+        if trans is None:
+            errors.add('trans 缺失', name or f'#{i}')
+        elif not isinstance(trans, list) or not all(isinstance(t, str) for t in trans):
+            errors.add('trans 不是字符串列表', name or f'#{i}')
+        elif not trans:
+            warnings.add('trans 为空', name or f'#{i}')
+        for key in ('usphone', 'ukphone'):
+            value = entry.get(key)
+            if value is None:
+                warnings.add(f'{key} 缺失', name or f'#{i}')
+            elif not isinstance(value, str):
+                errors.add(f'{key} 不是字符串', name or f'#{i}')
+        extra = [k for k in entry if k not in _FIELDS]
+        if extra:
+            warnings.add(f"含额外字段 {', '.join(sorted(extra))}", name or f'#{i}')
+        if any(_has_reserved(v) for v in entry.values()) or \
+                (isinstance(trans, list) and any(_has_reserved(t) for t in trans)):
+            warnings.add('含控制字符 \\x00/\\x1e/\\x1f（编码时改存到附加字段）', name or f'#{i}')
+    return names
+
+
+def _check_duplicates(names, warnings):
+    seen = set()
+    for name in names:
+        if name is None:
+            continue
+        if name in seen:
+            warnings.add('name 重复', name)
+        seen.add(name)
+
+
+def validate_dict(base_dir, url, full_path):
+    # 进程池任务：校验单个词典，返回清单条目
+    from catalog import get_catalog
+    from compiled_dict import compiled_path_for, open_compiled_dict
+    catalog_entry = get_catalog().by_url(url) or {}
+    errors, warnings = _Issues(), _Issues()
+    report = {'name': catalog_entry.get('name', ''), 'expected': catalog_entry.get('length')}
+    if full_path is None:
+        # 只存在于 dicts.pack 中：没有原始 JSON，校验解包后的记录
+        report['source'] = 'pack'
+        t0 = time.perf_counter()
+        words = open_source_words(base_dir, url, None)
+        entries = [words[i].to_dict() for i in range(len(words))]
+        report['parse_ms'] = round((time.perf_counter() - t0) * 1000, 2)
+        h = hashlib.blake2b(digest_size=16)
+        for i in range(len(words.source)):
+            h.update(words.source.raw_record(i))
+        report['blake2b'] = h.hexdigest()
+    else:
+        report['source'] = 'file'
+        t0 = time.perf_counter()
+        with open(full_path, 'rb') as f:
+            raw = f.read()
+        report['read_ms'] = round((time.perf_counter() - t0) * 1000, 2)
+        report['size'] = len(raw)
+        report['blake2b'] = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        compiled = open_compiled_dict(full_path)
+        report['compiled'] = compiled is not None
+        if compiled is not None:
+            compiled.close()
+        if not report['compiled'] and os.path.exists(compiled_path_for(full_path)):
+            warnings.add('.sdd 比 JSON 旧，需要重新编译')
+        if raw.startswith(b'\xef\xbb\xbf'):
+            warnings.add('文件带 UTF-8 BOM')
+            raw = raw[3:]
+        t0 = time.perf_counter()
+        try:
+            text = raw.decode('utf-8')
+        except UnicodeDecodeError as e:
+            errors.add(f'不是有效的 UTF-8：字节偏移 {e.start}')
+            text = raw.decode('utf-8', errors='replace')
+        if '�' in text:
+            warnings.add('含替换字符 U+FFFD')
+        try:
+            entries = json.loads(text)
+        except ValueError as e:
+            errors.add(f'JSON 解析失败：{e}')
+            entries = []
+        report['parse_ms'] = round((time.perf_counter() - t0) * 1000, 2)
+        if not isinstance(entries, list):
+            errors.add('顶层不是数组')
+            entries = []
+    report['count'] = len(entries)
+    _check_duplicates(check_entries(entries, errors, warnings), warnings)
+    expected = report['expected']
+    if expected is not None and expected != len(entries):
+        errors.add(f'词条数 {len(entries)} 与注册表 length {expected} 不一致')
+    report['errors'] = errors.to_list()
+    report['warnings'] = warnings.to_list()
+    return report
+
+
+def validate_catalog(base_dir='.', output=None, workers=None):
+    from catalog import get_catalog
+    t0 = time.perf_counter()
+    sources = dict_sources(base_dir)
+    reports = {}
+    for url, report, error in map_sources(validate_dict, base_dir, sources, workers):
+        if error:
+            report = {'errors': [f'校验失败：{error}'], 'warnings': []}
+        reports[url] = report
+    # 按 catalog 顺序输出，本地与词典包中都没有的词典记为缺失
+    dicts = {}
+    for entry in get_catalog().iter_entries(menu_only=False):
+        url = entry.get('url')
+        if not url or url in dicts:
+            continue
+        dicts[url] = reports.get(url) or {
+            'name': entry.get('name', ''), 'expected': entry.get('length'), 'source': 'missing',
+            'errors': ['文件缺失（本地与 dicts.pack 中都没有）'], 'warnings': []}
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'elapsed_s': round(time.perf_counter() - t0, 2),
+        'summary': {
+            'dicts': len(dicts),
+            'with_errors': sum(1 for r in dicts.values() if r['errors']),
+            'with_warnings': sum(1 for r in dicts.values() if r['warnings']),
+            'words': sum(r.get('count', 0) for r in dicts.values()),
+        },
+        'dicts': dicts,
+    }
+    if output:
+        tmp_path = output + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, output)
+    return manifest
+
+
+def load_manifest(path):
+    # 返回 {url: 清单条目}；清单不存在或损坏时返回空字典
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') != MANIFEST_VERSION:
+            return {}
+        return manifest.get('dicts') or {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"词库清单读取失败: {path} - {e}")
+        return {}
+
+
+def _print_report(manifest):
+    summary = manifest['summary']
+    for url, report in manifest['dicts'].items():
+        for text in report['errors']:
+            print(f"❌ {url}: {text}")
+        for text in report['warnings']:
+            print(f"⚠️  {url}: {text}")
+    slowest = sorted(((r['parse_ms'], url) for url, r in manifest['dicts'].items() if 'parse_ms' in r),
+                     reverse=True)[:5]
+    if slowest:
+        print('解析最慢的词典：')
+        for ms, url in slowest:
+            print(f'  {ms:9.1f} ms  {url}')
+    print(f"共 {summary['dicts']} 个词典、{summary['words']} 个词条；"
+          f"{summary['with_errors']} 个有错误，{summary['with_warnings']} 个有警告；耗时 {manifest['elapsed_s']} s")
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    output, workers = None, None
+    if '--output' in args:
+        i = args.index('--output')
+        output = args[i + 1]
+        del args[i:i + 2]
+    if '--workers' in args:
+        i = args.index('--workers')
+        workers = int(args[i + 1])
+        del args[i:i + 2]
+    base = args[0] if args else '.'
+    result = validate_catalog(base, output or os.path.join(base, MANIFEST_FILE), workers)
+    _print_report(result)
+    sys.exit(1 if result['summary']['with_errors'] else 0)
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+
+# 流式读取顶层为数组的 JSON 词典：边读边解析，先同步交出前几百个词条，其余在后台线程继续填充。
+# len() 只计入已经解析出的词条，随后台解析增长；访问已解析范围外的下标时阻塞到该下标被解析出来，
+# 解析完成后仍越界则抛出 IndexError。
+# 传入 table（word_table.WordTable）时边解析边驻留：只保存单词 id / 释义 id，与其它词典共享记录字节。
+import json
+import os
+import threading
+import weakref
+from array import array
+
+from compiled_dict import encode_record, decode_record
+
+CHUNK_SIZE = 64 * 1024
+FIRST_BATCH = 300
+_WHITESPACE = ' \t\r\n'
+_DELIMITERS = _WHITESPACE + ',]'
+
+
+def iter_json_array(f, chunk_size=CHUNK_SIZE):
+    # f 为文本模式文件对象；逐个产出顶层数组中的元素
+    decoder = json.JSONDecoder()
+    buf = ''
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buf, pos, eof
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+        buf = buf[pos:] + chunk
+        pos = 0
+
+    def skip_ws():
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf) or eof:
+                return
+            fill()
+
+    fill()
+    skip_ws()
+    if pos >= len(buf) or buf[pos] != '[':
+        raise ValueError('词典文件顶层不是 JSON 数组')
+    pos += 1
+    expect_value = True
+    while True:
+        skip_ws()
+        if pos >= len(buf):
+            raise ValueError('JSON 数组未结束')
+        ch = buf[pos]
+        if ch == ']':
+            return
+        if ch == ',' and not expect_value:
+            pos += 1
+            expect_value = True
+            continue
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+                # 对象、数组、字符串以闭合符号结束；数字等标量可能被截断在缓冲区末尾（如 "2.5" 只读到 "2."），
+                # 后面紧跟分隔符或已读到文件末尾才算完整，否则再读一些
+                if buf[end - 1] in '}]"' or eof or (end < len(buf) and buf[end] in _DELIMITERS):
+                    break
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            fill()
+        pos = end
+        expect_value = False
+        yield value
+
+
+class StreamingRecords:
+    """后台解析中的词条记录序列（记录格式同 compiled_dict），可直接作为 WordList 的 source。"""
+
+    def __init__(self, path, length_hint=None, first_batch=FIRST_BATCH, on_done=None, table=None):
+        self.path = path
+        # 注册表或清单中的词条数，只用于显示加载进度，不参与 len()
+        self.length_hint = length_hint or 0
+        self._size = os.path.getsize(path)
+        self.error = None
+        self.table = table
+        self._count = 0
+        if table is None:
+            self._buf = bytearray()
+            self._offsets = array('I', [0])
+        else:
+            # 同 word_table.InternedDict：对象被回收时释放引用的表项
+            self._head_ids, self._tail_ids = array('I'), array('I')
+            self.added_bytes = 0
+            weakref.finalize(self, table.release_ids, self._head_ids, self._tail_ids)
+        self._done = False
+        self._cond = threading.Condition()
+        self._on_done = on_done
+        self._file = open(path, 'r', encoding='utf-8')
+        self._iter = iter_json_array(self._file)
+        # 前 first_batch 个词条同步解析，保证窗口能立即显示
+        self._consume(first_batch)
+        if not self._done:
+            threading.Thread(target=self._consume, daemon=True).start()
+
+    def _consume(self, limit=None):
+        n = 0
+        try:
+            table = self.table
+            for word in self._iter:
+                rec = encode_record(word)
+                if table is not None:
+                    head_id, tail_id, added = table.intern_raw(rec)
+                with self._cond:
+                    if table is None:
+                        self._buf += rec
+                        self._offsets.append(len(self._buf))
+                    else:
+                        self._head_ids.append(head_id)
+                        self._tail_ids.append(tail_id)
+                        self.added_bytes += added
+                    self._count += 1
+                    self._cond.notify_all()
+                n += 1
+                if limit is not None and n >= limit:
+                    return
+        except Exception as e:
+            self.error = e
+            print(f"词典流式解析失败: {self.path} - {e}")
+        self._finish()
+
+    def _finish(self):
+        try:
+            self._file.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._done = True
+            if self.table is None:
+                self._buf = bytes(self._buf)
+            self._cond.notify_all()
+        if self._on_done and self.error is None:
+            try:
+                self._on_done(self)
+            except Exception as e:
+                print(f"流式加载回调失败: {e}")
+
+    @property
+    def done(self):
+        return self._done
+
+    @property
+    def parsed(self):
+        return self._count
+
+    def wait(self, timeout=None):
+        with self._cond:
+            return self._cond.wait_for(lambda: self._done, timeout)
+
+    def wait_parsed(self, count, timeout=None):
+        # 阻塞到至少解析出 count 个词条或解析结束
+        with self._cond:
+            return self._cond.wait_for(lambda: self._done or self._count >= count, timeout)
+
+    def __len__(self):
+        return self.parsed
+
+    def raw_record(self, index):
+        if index < 0:
+            raise IndexError('词条下标越界')
+        with self._cond:
+            self._cond.wait_for(lambda: self._done or index < self._count)
+            if index >= self._count:
+                raise IndexError('词条下标越界')
+            if self.table is not None:
+                return self.table.raw_record(self._head_ids[index], self._tail_ids[index])
+            return bytes(self._buf[self._offsets[index]:self._offsets[index + 1]])
+
+    def __getitem__(self, index):
+        return decode_record(self.raw_record(index))
+
+    def to_buffers(self):
+        # 返回 (记录字节, 偏移数组字节)，用于写 dict_snapshot 快照；驻留模式下临时拼出连续的记录
+        self.wait()
+        if self.table is None:
+            return bytes(self._buf), self._offsets.tobytes()
+        offsets = array('I', [0])
+        records = []
+        for i in range(self._count):
+            rec = self.raw_record(i)
+            records.append(rec)
+            offsets.append(offsets[-1] + len(rec))
+        return b''.join(records), offsets.tobytes()
+
+    @property
+    def nbytes(self):
+        # 解析完成前按文件大小估算：DictCache 在 put 时记账，不能只算已解析的前几百个词条；
+        # 驻留模式同 InternedDict：id 数组加上本词典首次放入表中的记录字节
+        if self.table is None:
+            actual = len(self._buf) + self._offsets.itemsize * len(self._offsets)
+        else:
+            actual = self._head_ids.itemsize * len(self._head_ids) * 2 + self.added_bytes
+        return actual if self._done else max(actual, self._size)
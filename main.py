@@ -18,13 +18,37 @@ from PIL import Image, ImageDraw
 from pynput import mouse, keyboard
 import pystray
 from pystray import Menu as menu, MenuItem as item
-from datetime import datetime
 
-from dictionary import all_dicts
+from catalog import get_catalog
+from word_list import WordList
+from word_table import WordTable, intern_word_list
+from dict_cache import DictCache, DEFAULT_BUDGET_MB
+from dict_prefetch import DictPrefetcher
+from word_search import WordSearch, build_search_db, has_cjk
+from dict_pack import PACK_FILE, get_pack
+from session_snapshot import load_session, save_session
+from paged_list import PagedWordList, open_paged_json
+from compiled_dict import compiled_path_for
+from review_journal import ReviewJournal
+from review_store import LEGACY_DICT_ID, SQLiteReviewStore
+from review_columns import ReviewColumns
+from write_behind import WriteBehind
+from atomic_file import atomic_write, read_json
+from study_views import StudyViews, VIEW_ALL, VIEW_LABELS
+from word_index import PrefixIndex
+from trans_index import load_trans_index
+from fuzzy_index import build_fuzzy_index, load_fuzzy_index
+from dict_validator import MANIFEST_FILE, load_manifest
+from phonetic_index import build_catalog_phonetic_index, load_catalog_phonetic_index, load_phonetic_index
 
 APP_TITLE = 'StudyDesk'
 
+# 启动计时起点，用于统计 time-to-first-word
+_startup_t0 = time.perf_counter()
+startup_metrics = {}
+
 shuffle_mode = {'value': False}
+study_view = {'value': VIEW_ALL}  # 学习筛选视图：all / unmarked / forgotten / known
 topmost_timer = {'enabled': True}
 pronunciation_type = {'value': 1}  # 1: 英音，2: 美音
 
@@ -43,74 +67,161 @@ DEFAULT_HOTKEYS = {
     'next': '<ctrl>+<alt>+right',
     'prev': '<ctrl>+<alt>+left',
     'known': '<ctrl>+<alt>+k',
-    'forgot': '<ctrl>+<alt>+f'
+    'forgot': '<ctrl>+<alt>+f',
+    'search': '<ctrl>+<alt>+q',
+    'jump': '<ctrl>+<alt>+j'
 }
 user_hotkeys = DEFAULT_HOTKEYS.copy()
 
-# 复习数据文件（按词条统计熟记/忘记次数）
+# 复习数据（按词条统计熟记/忘记次数），列式存放：review_data.counts(name) -> (known, forgot) 或 None
+# study_desk_review.json 为旧版本的 JSON 复习数据，首次启动时迁移
 REVIEW_DATA_PATH = os.path.join(tempfile.gettempdir(), 'study_desk_review.json')
-review_data = {}
+REVIEW_COLUMNS_PATH = os.path.join(tempfile.gettempdir(), 'study_desk_review.cols')
+review_data = ReviewColumns()
+# 复习记录的存储后端（配置 review_backend）：
+#   sqlite  -> SQLiteReviewStore，写线程批量事务写入 study_desk_review.db，支持按词典统计（默认）
+#   journal -> ReviewJournal，标记追加到 study_desk_review.journal，定期压缩成 study_desk_review.cols 列式快照
+review_settings = {'backend': 'sqlite'}
+review_store = None
 
 audio_cache_dir = os.path.join(tempfile.gettempdir(), "study_desk_cache")
 os.makedirs(audio_cache_dir, exist_ok=True)
 
 CONFIG_FILE_PATH = os.path.join(tempfile.gettempdir(), 'study_desk_config.json')
+last_config_text = None
 current_dict_path = {'value': ''}
 
+# 已加载词典的 LRU 缓存（按 url），预算可在配置文件 dict_cache_mb 中修改
+dict_cache = DictCache(DEFAULT_BUDGET_MB * 1024 * 1024)
+# 所有已加载词典共享的单词驻留表，缓存中的每个词典只保存 8 字节/词条的 id 数组
+word_table = WordTable()
+# 不小于该大小且没有编译文件/快照的 JSON 词典改为流式加载，先显示前几百个词条
+STREAM_THRESHOLD = 1024 * 1024
+
+# 分页模式：不小于 min_mb 的 JSON 词表只在当前下标 ±window 范围内保留解码后的词条，会保存到配置文件
+paging_settings = {
+    'window': 256,
+    'min_mb': 8
+}
+
+# 同分类词典的后台预加载（在 __main__ 中创建）
+dict_prefetcher = None
+
 # 全局托盘图标句柄（可能在单独线程中创建）
 icon = None
 
 # 全局 hotkey listener handle (pynput.GlobalHotKeys)
 gh_listener = None
 
+# dict_validator.py 生成的词库清单（url -> 大小、校验和、词条数等），首次加载词典时读取
+dict_manifest = None
+
+# 全词典搜索索引（SQLite FTS5），首次打开搜索框时创建；每次运行在后台增量更新一次
+word_search = None
+search_index_building = threading.Event()
+search_index_refreshed = False
+
+# 跨全部词典的拼写纠错索引（“你是不是要找”），首次打开搜索框时读取或在后台建立
+fuzzy_index = None
+fuzzy_index_building = threading.Event()
+fuzzy_index_error = None
+
+# 跨全部词典的音标索引，搜索框输入以 '/' 开头的音标查询时读取或在后台建立
+phonetic_index = None
+phonetic_index_building = threading.Event()
+# 建立失败的原因；失败后本次运行不再重试，搜索框显示错误而不是一直等待
+phonetic_index_error = None
+
 def save_review_data():
+    # 退出时调用：等待未写入的标记落盘并关闭存储
     try:
-        with open(REVIEW_DATA_PATH, 'w', encoding='utf-8') as f:
-            json.dump(review_data, f, ensure_ascii=False, indent=2)
+        if review_store is not None:
+            review_store.close()
     except Exception as e:
         print(f"保存复习数据失败: {e}")
 
 def load_review_data():
-    global review_data
-    if not os.path.exists(REVIEW_DATA_PATH):
-        review_data = {}
-        return
+    # 复习数据库打不开（损坏、无权限等）时本次运行改用日志后端；日志也读不出时只在内存中记录，不再写盘
+    global review_data, review_store
+    if review_settings.get('backend') != 'journal':
+        review_store = SQLiteReviewStore(legacy_path=REVIEW_COLUMNS_PATH, legacy_json_path=REVIEW_DATA_PATH)
+        try:
+            review_data = review_store.load()
+            return
+        except Exception as e:
+            print(f"复习数据库打开失败，本次运行改用日志存储: {e}")
+            try:
+                review_store.close()
+            except Exception:
+                pass
+    review_store = ReviewJournal(REVIEW_COLUMNS_PATH, legacy_path=REVIEW_DATA_PATH)
     try:
-        with open(REVIEW_DATA_PATH, 'r', encoding='utf-8') as f:
-            review_data = json.load(f) or {}
+        review_data = review_store.load()
     except Exception as e:
         print(f"加载复习数据失败: {e}")
-        review_data = {}
+        review_data = review_store.data
 
 def save_config():
+    # 只标记配置已改动，由 config_writer 在滚动停下或满写入间隔后合并成一次写盘
+    config_writer.mark_dirty()
+
+def close_config():
+    # 退出前调用：等待进行中的写入，同步写入尚未保存的配置并停止写线程
+    config_writer.close()
+
+def write_config():
+    # 与上次写入的内容相同则跳过（返回 False，不计入写入次数）
+    global last_config_text
     config = {
         'pronunciation_type': pronunciation_type['value'],
         'shuffle_mode': shuffle_mode['value'],
+        'study_view': study_view['value'],
         'topmost_enabled': topmost_timer['enabled'],
         'current_dict': current_dict_path.get('value', ''),
         'current_index': app.index if 'app' in globals() else 0,
         'visual_settings': visual_settings,
-        'hotkeys': user_hotkeys
+        'hotkeys': user_hotkeys,
+        'dict_cache_mb': dict_cache.max_bytes // (1024 * 1024),
+        'prefetch_enabled': dict_prefetcher.enabled if dict_prefetcher else True,
+        'startup_metrics': startup_metrics,
+        'paging': paging_settings,
+        'review_backend': review_settings['backend'],
+        'config_write_interval': config_writer.interval
     }
+    text = json.dumps(config, ensure_ascii=False, indent=2)
+    if text == last_config_text:
+        return False
     try:
-        with open(CONFIG_FILE_PATH, 'w', encoding='utf-8') as f:
-            json.dump(config, f, ensure_ascii=False, indent=2)
+        atomic_write(CONFIG_FILE_PATH, text, sidecar=True)
+        last_config_text = text
     except Exception as e:
         print(f"配置保存失败: {e}")
+    # 完整词典加载完成后才更新会话快照，避免把“加载中”占位写进去
+    if 'app' in globals() and not app.loading:
+        save_session(current_dict_path.get('value', ''), app.words, app.index)
+
+# 配置的延迟合并写入：滚动停下 0.5 秒后、或持续滚动时每 config_write_interval 秒最多写一次
+config_writer = WriteBehind(write_config)
 
 def load_config():
-    if not os.path.exists(CONFIG_FILE_PATH):
+    # 配置文件损坏（如写到一半断电）时自动改读 study_desk_config.json.bak
+    cfg = read_json(CONFIG_FILE_PATH)
+    if not isinstance(cfg, dict):
         return {}
     try:
-        with open(CONFIG_FILE_PATH, 'r', encoding='utf-8') as f:
-            cfg = json.load(f)
-            # merge visual settings if present
-            if 'visual_settings' in cfg:
-                visual_settings.update(cfg.get('visual_settings') or {})
-            # load user hotkeys if present
-            if 'hotkeys' in cfg:
-                user_hotkeys.update(cfg.get('hotkeys') or {})
-            return cfg
+        # merge visual settings if present
+        if 'visual_settings' in cfg:
+            visual_settings.update(cfg.get('visual_settings') or {})
+        # load user hotkeys if present
+        if 'hotkeys' in cfg:
+            user_hotkeys.update(cfg.get('hotkeys') or {})
+        if 'paging' in cfg:
+            paging_settings.update(cfg.get('paging') or {})
+        if cfg.get('review_backend') in ('sqlite', 'journal'):
+            review_settings['backend'] = cfg['review_backend']
+        if isinstance(cfg.get('config_write_interval'), (int, float)) and cfg['config_write_interval'] > 0:
+            config_writer.interval = cfg['config_write_interval']
+        return cfg
     except Exception as e:
         print(f"配置加载失败: {e}")
         return {}
@@ -156,23 +267,15 @@ def play_pronunciation(word):
 def mark_word_known(word_name):
     if not word_name:
         return
-    entry = review_data.get(word_name, {'known': 0, 'forgot': 0, 'last': None})
-    entry['known'] = entry.get('known', 0) + 1
-    entry['last'] = datetime.utcnow().isoformat()
-    review_data[word_name] = entry
-    save_review_data()
+    review_store.mark(word_name, 'known', int(time.time()), current_dict_path.get('value', ''))
 
 def mark_word_forgot(word_name):
     if not word_name:
         return
-    entry = review_data.get(word_name, {'known': 0, 'forgot': 0, 'last': None})
-    entry['forgot'] = entry.get('forgot', 0) + 1
-    entry['last'] = datetime.utcnow().isoformat()
-    review_data[word_name] = entry
-    save_review_data()
+    review_store.mark(word_name, 'forgot', int(time.time()), current_dict_path.get('value', ''))
 
 class TransparentWordWindow:
-    def __init__(self, root, words, start_index=0):
+    def __init__(self, root, words, start_index=0, loading=False):
         self.root = root
         self.root.title(APP_TITLE)
         self.root.overrideredirect(True)
@@ -199,6 +302,19 @@ class TransparentWordWindow:
 
         self.words = words or []
         self.index = start_index if 0 <= start_index < len(self.words) else 0
+        # 流式加载中的词表尚未解析到目标下标时先记在这里，解析完成后再跳过去
+        self.pending_index = None
+        # 为 True 时 self.words 是会话快照（或为空），完整词典仍在后台加载
+        self.loading = loading
+        # 当前词典上的筛选视图（StudyViews），首次进入非“全部”视图时构建
+        self.views = None
+        # 当前词典的单词名前缀索引（PrefixIndex）、中文释义索引（TransIndex）与音标索引（PhoneticIndex），
+        # 词典加载后在后台线程构建
+        self.prefix_index = None
+        self.trans_index = None
+        self.phonetic_index = None
+        # 不建立上述索引的原因（如分页模式），跳转框显示它而不是等待索引
+        self.index_error = None
 
         self.update_display()
 
@@ -217,54 +333,200 @@ class TransparentWordWindow:
             self.show()
 
     def on_word_click(self, event):
-        current_word = self.words[self.index].get('name', '') if self.words else ''
+        current_word = self.words[self.index].name if self.words else ''
         play_pronunciation(current_word)
 
-    def update_display(self):
+    def update_display(self, play=True):
         if not self.words:
-            self.canvas.itemconfig(self.word_text, text='（词典为空）')
+            self.canvas.itemconfig(self.word_text, text='（加载中…）' if self.loading else '（词典为空）')
             self.canvas.itemconfig(self.phone_text, text='')
             self.canvas.itemconfig(self.trans_text, text='')
             self.canvas.itemconfig(self.status_text, text='')
             return
 
-        word = self.words[self.index]
-        name = word.get('name', '')
+        # 显示文本在加载时预先生成（大词典按需生成并缓存），滚动时只做 itemconfig
+        name, phone_line, trans_line = self.words.display(self.index)
         self.canvas.itemconfig(self.word_text, text=name)
-        self.canvas.itemconfig(
-            self.phone_text,
-            text=f"US: /{word.get('usphone', '')}/   UK: /{word.get('ukphone', '')}/"
-        )
-        self.canvas.itemconfig(
-            self.trans_text,
-            text='；'.join(word.get('trans', []))
-        )
+        self.canvas.itemconfig(self.phone_text, text=phone_line)
+        self.canvas.itemconfig(self.trans_text, text=trans_line)
 
         # 显示复习标记
-        entry = review_data.get(name)
-        if entry:
-            status = f"熟记:{entry.get('known',0)} 忘记:{entry.get('forgot',0)}"
-            self.canvas.itemconfig(self.status_text, text=status, fill='green')
+        counts = review_data.counts(name)
+        if counts:
+            status = f"熟记:{counts[0]} 忘记:{counts[1]}"
+            fill = 'green'
         else:
-            self.canvas.itemconfig(self.status_text, text='未标记', fill='gray')
+            status = '未标记'
+            fill = 'gray'
+        view = study_view['value']
+        if view != VIEW_ALL and self.views is not None:
+            status += f"   [{VIEW_LABELS[view]} {self.views.count(view)}]"
+        if not words_complete(self.words):
+            hint = getattr(self.words.source, 'length_hint', 0)
+            status += f"   [加载中 {len(self.words)}{f'/{hint}' if hint else ''}]"
+        self.canvas.itemconfig(self.status_text, text=status, fill=fill)
+
+        if dict_prefetcher:
+            dict_prefetcher.notify_activity()
 
         # 异步播放发音以避免阻塞 UI
-        threading.Thread(target=play_pronunciation, args=(name,), daemon=True).start()
+        if play:
+            threading.Thread(target=play_pronunciation, args=(name,), daemon=True).start()
+
+    def get_views(self):
+        # 流式加载的词表解析完成前长度还在增长，不建视图（on_words_complete 之后再建）；
+        # 分页模式的大词表不建视图（需要遍历整个词表并保存全部单词名），筛选时按普通方式移动
+        if self.views is None and self.words and not self.loading and words_complete(self.words) \
+                and not isinstance(self.words, PagedWordList):
+            self.views = StudyViews(self.words, review_data)
+        return self.views
+
+    def filtered_move(self, direction):
+        # 非“全部”视图下在视图成员之间移动；返回 False 表示按普通方式移动
+        view = study_view['value']
+        if view == VIEW_ALL:
+            return False
+        views = self.get_views()
+        if views is None:
+            return False
+        if shuffle_mode['value']:
+            new_index = views.random_index(view, exclude=self.index)
+        elif direction > 0:
+            new_index = views.next_index(view, self.index)
+        else:
+            new_index = views.prev_index(view, self.index)
+        if new_index is not None:
+            self.index = new_index
+        self.update_display()
+        save_config()
+        return True
+
+    def set_study_view(self, view):
+        study_view['value'] = view
+        if view != VIEW_ALL:
+            views = self.get_views()
+            if views is not None and not views.contains(view, self.index):
+                new_index = views.next_index(view, self.index, inclusive=True)
+                if new_index is not None:
+                    self.index = new_index
+        self.update_display()
+        save_config()
 
     def on_mousewheel(self, event):
         if not self.words:
             return
-        self.index = (self.index - 1) % len(self.words) if event.delta > 0 else (self.index + 1) % len(self.words)
+        if self.filtered_move(-1 if event.delta > 0 else 1):
+            return
+        self.index = self.step_index(-1 if event.delta > 0 else 1)
         self.update_display()
         save_config()
 
-    def update_word_list(self, new_list, dict_path=''):
+    def step_index(self, delta):
+        # 顺序移动一个词条。流式解析未完成时 len() 只是已解析的条数：向后越过它时等待该词条解析出来，
+        # 解析结束后仍越界才回绕到开头；在开头向前移动时停在原处，等长度确定后才能回绕到末尾
+        words = self.words
+        new_index = self.index + delta
+        if not words_complete(words):
+            if new_index < 0:
+                return self.index
+            words.source.wait_parsed(new_index + 1)
+            if new_index < len(words):
+                return new_index
+        return new_index % len(words)
+
+    def update_word_list(self, new_list, dict_path='', start_index=0):
+        self.loading = False
         self.words = new_list or []
-        self.index = 0
+        self.views = None
+        self.build_word_indexes(dict_path)
+        self.set_start_index(start_index)
         current_dict_path['value'] = dict_path
+        self.align_to_view()
         self.update_display()
         save_config()
 
+    def set_start_index(self, index):
+        self.pending_index = None
+        if 0 <= index < len(self.words):
+            self.index = index
+        else:
+            self.index = 0
+            if index > 0 and not words_complete(self.words):
+                self.pending_index = index
+
+    def align_to_view(self):
+        if study_view['value'] != VIEW_ALL and self.get_views() is not None \
+                and not self.views.contains(study_view['value'], self.index):
+            self.index = self.views.next_index(study_view['value'], self.index, inclusive=True) or 0
+
+    def on_words_complete(self, words):
+        # 流式解析完成（Tk 线程）：长度已经确定，跳到之前记下的下标并重新对齐视图
+        if self.words is not words:
+            return
+        pending = self.pending_index
+        self.set_start_index(self.index if pending is None else pending)
+        self.views = None
+        self.align_to_view()
+        self.update_display(play=pending is not None)
+
+    def finish_loading(self, new_list, dict_path):
+        # 后台加载完成：用完整词典替换会话快照，保留当前下标（期间用户已切换词典则丢弃）
+        if not self.loading or dict_path != current_dict_path.get('value'):
+            return
+        self.loading = False
+        shown = self.words[self.index].name if self.words else None
+        self.words = new_list or []
+        self.views = None
+        self.build_word_indexes(dict_path)
+        self.set_start_index(self.index)
+        current = self.words[self.index].name if self.words else None
+        self.update_display(play=current != shown)
+
+    def build_word_indexes(self, dict_path):
+        # 在后台线程中构建；流式加载的词表先等到解析完成，再按最终长度建索引并通知界面
+        self.prefix_index = None
+        self.trans_index = None
+        self.phonetic_index = None
+        self.index_error = None
+        words = self.words
+        if not words:
+            return
+        if isinstance(words, PagedWordList):
+            # 索引会把整个词表的单词名与倒排表留在内存里，与分页模式的初衷相反；可用全词典搜索代替
+            self.index_error = '分页模式的大词表不建立跳转索引，请使用全词典搜索'
+            return
+
+        def _build():
+            if not words_complete(words):
+                words.source.wait()
+                try:
+                    self.root.after(0, self.on_words_complete, words)
+                except RuntimeError:
+                    return
+            try:
+                index = PrefixIndex(words)
+            except Exception as e:
+                print(f"前缀索引构建失败: {e}")
+                if self.words is words:
+                    self.index_error = f'索引建立失败：{e}'
+                return
+            if self.words is not words:
+                return
+            self.prefix_index = index
+            try:
+                source_path = index_source_path(dict_path)
+                trans_index = load_trans_index(dict_path, source_path, words)
+                phonetic = load_phonetic_index(dict_path, source_path, words)
+            except Exception as e:
+                print(f"释义/音标索引构建失败: {e}")
+                if self.words is words:
+                    self.index_error = f'释义/音标索引建立失败：{e}'
+                return
+            if self.words is words:
+                self.trans_index = trans_index
+                self.phonetic_index = phonetic
+        threading.Thread(target=_build, daemon=True).start()
+
     def show(self):
         try:
             self.root.deiconify()
@@ -280,7 +542,10 @@ class TransparentWordWindow:
             pass
 
     def quit(self):
-        save_config()
+        close_config()
+        save_review_data()
+        if dict_prefetcher:
+            dict_prefetcher.shutdown()
         try:
             if 'icon' in globals() and icon:
                 icon.stop()
@@ -300,26 +565,30 @@ class TransparentWordWindow:
     def show_next_word(self):
         if not self.words:
             return
+        if self.filtered_move(1):
+            return
         if shuffle_mode['value'] and len(self.words) > 1:
             new_index = self.index
             while new_index == self.index:
                 new_index = random.randint(0, len(self.words) - 1)
             self.index = new_index
         else:
-            self.index = (self.index + 1) % len(self.words)
+            self.index = self.step_index(1)
         self.update_display()
         save_config()
 
     def show_prev_word(self):
         if not self.words:
             return
+        if self.filtered_move(-1):
+            return
         if shuffle_mode['value'] and len(self.words) > 1:
             new_index = self.index
             while new_index == self.index:
                 new_index = random.randint(0, len(self.words) - 1)
             self.index = new_index
         else:
-            self.index = (self.index - 1) % len(self.words)
+            self.index = self.step_index(-1)
         self.update_display()
         save_config()
 
@@ -336,15 +605,19 @@ class TransparentWordWindow:
     def mark_current_known(self):
         if not self.words:
             return
-        name = self.words[self.index].get('name', '')
+        name = self.words[self.index].name
         mark_word_known(name)
+        if self.views is not None:
+            self.views.update(name, review_data.counts(name))
         self.update_display()
 
     def mark_current_forgot(self):
         if not self.words:
             return
-        name = self.words[self.index].get('name', '')
+        name = self.words[self.index].name
         mark_word_forgot(name)
+        if self.views is not None:
+            self.views.update(name, review_data.counts(name))
         self.update_display()
 
     def open_settings(self):
@@ -411,6 +684,8 @@ class TransparentWordWindow:
             hk_prev = tk.StringVar(value=humanize_hotkey(user_hotkeys.get('prev', DEFAULT_HOTKEYS['prev'])))
             hk_known = tk.StringVar(value=humanize_hotkey(user_hotkeys.get('known', DEFAULT_HOTKEYS['known'])))
             hk_forgot = tk.StringVar(value=humanize_hotkey(user_hotkeys.get('forgot', DEFAULT_HOTKEYS['forgot'])))
+            hk_search = tk.StringVar(value=humanize_hotkey(user_hotkeys.get('search', DEFAULT_HOTKEYS['search'])))
+            hk_jump = tk.StringVar(value=humanize_hotkey(user_hotkeys.get('jump', DEFAULT_HOTKEYS['jump'])))
 
             add_hotkey_row(0, "切换 显示/隐藏:", hk_toggle)
             add_hotkey_row(1, "打开 设置页:", hk_settings)
@@ -418,6 +693,8 @@ class TransparentWordWindow:
             add_hotkey_row(3, "上一个 词:", hk_prev)
             add_hotkey_row(4, "标记 熟记:", hk_known)
             add_hotkey_row(5, "标记 忘记:", hk_forgot)
+            add_hotkey_row(6, "搜索 单词:", hk_search)
+            add_hotkey_row(7, "跳转 单词:", hk_jump)
 
             # 复习操作按钮
             frm_review = tk.LabelFrame(dlg, text="当前词操作")
@@ -439,6 +716,8 @@ class TransparentWordWindow:
                     user_hotkeys['prev'] = normalize_hotkey_string(hk_prev.get())
                     user_hotkeys['known'] = normalize_hotkey_string(hk_known.get())
                     user_hotkeys['forgot'] = normalize_hotkey_string(hk_forgot.get())
+                    user_hotkeys['search'] = normalize_hotkey_string(hk_search.get())
+                    user_hotkeys['jump'] = normalize_hotkey_string(hk_jump.get())
                 except Exception as e:
                     print(f"热键格式化失败: {e}")
 
@@ -454,6 +733,188 @@ class TransparentWordWindow:
         # 确保在主线程创建对话框
         self.root.after(0, _open)
 
+    def jump_to(self, url, index):
+        # 跳转到任意词典中的某个词条；不是当前词典时先切换词典
+        if url != current_dict_path.get('value'):
+            new_words = dict_prefetcher.get_or_load(url) if dict_prefetcher else load_dict_from_file(url)
+            self.update_word_list(new_words, url, start_index=index)
+            schedule_prefetch(url)
+            return
+        if 0 <= index < len(self.words):
+            self.index = index
+            self.update_display()
+            save_config()
+
+    def open_search(self):
+        # 跨全部词典搜索单词（英文前缀或中文释义），回车/双击跳转
+        def _open():
+            store = get_word_search()
+            dlg = tk.Toplevel(self.root)
+            dlg.title("搜索单词")
+            dlg.transient(self.root)
+            dlg.attributes('-topmost', True)
+            query_var = tk.StringVar()
+            ent = tk.Entry(dlg, textvariable=query_var, width=40)
+            ent.grid(row=0, column=0, padx=6, pady=6, sticky='ew')
+            lst = tk.Listbox(dlg, width=60, height=12)
+            lst.grid(row=1, column=0, padx=6, pady=(0, 6), sticky='nsew')
+            hint = tk.Label(dlg, text='', fg='gray')
+            hint.grid(row=2, column=0, padx=6, pady=(0, 6), sticky='w')
+            results = []
+            poll = {'pending': False}   # 同一时刻只保留一个等待索引建好的定时刷新
+
+            def refresh_later(delay):
+                if not poll['pending']:
+                    poll['pending'] = True
+                    dlg.after(delay, lambda: dlg.winfo_exists() and (poll.update(pending=False) or refresh()))
+
+            def refresh(*_):
+                query = query_var.get()
+                if query.lstrip().startswith('/'):
+                    refresh_phonetic(query)
+                    return
+                results[:] = store.search(query, limit=50) if store else []
+                lst.delete(0, tk.END)
+                for r in results:
+                    entry = get_catalog().by_url(r['url']) or {}
+                    lst.insert(tk.END, f"{r['name']}  {r['trans']}  [{entry.get('name', r['url'])}]")
+                # 英文查询结果较少时补充拼写相近的单词
+                fuzzy = get_fuzzy_index() if len(results) < 5 and query.strip() and not has_cjk(query) else None
+                if fuzzy is not None:
+                    shown = {r['name'].lower() for r in results}
+                    for r in fuzzy.suggest(query, limit=10):
+                        if r['name'] in shown:
+                            continue
+                        entry = get_catalog().by_url(r['url']) or {}
+                        results.append(r)
+                        lst.insert(tk.END, f"你是不是要找：{r['name']}  [{entry.get('name', r['url'])}]")
+                if search_index_building.is_set():
+                    hint.config(text='正在建立搜索索引，结果可能不完整…', fg='gray')
+                elif store is None:
+                    hint.config(text='搜索索引不可用', fg='red')
+                else:
+                    hint.config(text=f'{len(results)} 条结果', fg='gray')
+
+            def refresh_phonetic(query):
+                # 以 '/' 开头按音标查找：/æ/ 包含，/*ʃən/ 结尾，/ɪk*/ 开头
+                phonetic = get_phonetic_index()
+                results[:] = phonetic.search(query, limit=200) if phonetic else []
+                lst.delete(0, tk.END)
+                for r in results:
+                    entry = get_catalog().by_url(r['url']) or {}
+                    lst.insert(tk.END, f"{r['name']}  [{entry.get('name', r['url'])}]")
+                if phonetic is None and phonetic_index_error:
+                    hint.config(text=f'音标索引建立失败：{phonetic_index_error}', fg='red')
+                elif phonetic is None:
+                    hint.config(text='正在建立音标索引…', fg='gray')
+                    refresh_later(500)
+                else:
+                    hint.config(text=f'{len(results)} 条结果', fg='gray')
+
+            def choose(*_):
+                sel = lst.curselection()
+                pick = results[sel[0]] if sel else (results[0] if results else None)
+                if pick:
+                    dlg.destroy()
+                    self.jump_to(pick['url'], pick['index'])
+
+            query_var.trace_add('write', refresh)
+            ent.bind('<Return>', choose)
+            lst.bind('<Double-Button-1>', choose)
+            dlg.bind('<Escape>', lambda e: dlg.destroy())
+            refresh()
+            ent.focus_force()
+
+        self.root.after(0, _open)
+
+    def show_review_stats(self):
+        # 当前词典的熟记/忘记统计与最近忘记的单词，迁移来的旧记录单独列一行；JSON 日志后端不区分词典，只统计全部
+        if hasattr(review_store, 'dict_counts'):
+            dict_id = current_dict_path.get('value', '')
+            counts = review_store.dict_counts(dict_id)
+            recent = review_store.recently_forgotten(10, dict_id)
+            entry = get_catalog().by_url(dict_id) or {}
+            lines = [f"{entry.get('name', dict_id) or '当前词典'}：已复习 {counts['words']} 个单词，"
+                     f"熟记 {counts['known']} 次，忘记 {counts['forgot']} 次"]
+            legacy = review_store.dict_counts(LEGACY_DICT_ID)
+            if legacy['words'] and dict_id != LEGACY_DICT_ID:
+                lines.append(f"升级前的记录（未区分词典）：{legacy['words']} 个单词，"
+                             f"熟记 {legacy['known']} 次，忘记 {legacy['forgot']} 次")
+        else:
+            words, known, forgot = review_data.totals()
+            recent = review_data.recently_forgotten(10)
+            lines = [f"全部词典：已复习 {words} 个单词，熟记 {known} 次，忘记 {forgot} 次"]
+        if recent:
+            lines.append('最近忘记：' + '、'.join(r['word'] for r in recent))
+        messagebox.showinfo("复习统计", '\n'.join(lines))
+
+    def open_jump(self):
+        # 在当前词典内按单词前缀/子串、中文释义或音标（以 '/' 开头，如 /*ʃən/）跳转，回车/双击跳到选中项
+        def _open():
+            dlg = tk.Toplevel(self.root)
+            dlg.title("跳转到单词")
+            dlg.transient(self.root)
+            dlg.attributes('-topmost', True)
+            query_var = tk.StringVar()
+            ent = tk.Entry(dlg, textvariable=query_var, width=30)
+            ent.grid(row=0, column=0, padx=6, pady=6, sticky='ew')
+            lst = tk.Listbox(dlg, width=50, height=10)
+            lst.grid(row=1, column=0, padx=6, pady=(0, 6), sticky='nsew')
+            hint = tk.Label(dlg, text='', fg='gray')
+            hint.grid(row=2, column=0, padx=6, pady=(0, 6), sticky='w')
+            matches = []
+            poll = {'pending': False}   # 同一时刻只保留一个等待索引建好的定时刷新
+
+            def refresh(*_):
+                query = query_var.get()
+                by_phone = query.lstrip().startswith('/')
+                by_meaning = not by_phone and has_cjk(query)
+                if by_phone:
+                    index = self.phonetic_index
+                    matches[:] = index.search(query, limit=200) if index else []
+                elif by_meaning:
+                    index = self.trans_index
+                    matches[:] = index.search(query) if index else []
+                else:
+                    index = self.prefix_index
+                    matches[:] = index.lookup(query) if index else []
+                lst.delete(0, tk.END)
+                for i in matches:
+                    word = self.words[i]
+                    text = f"{i + 1}. {word.name}"
+                    if by_phone:
+                        text += f"  /{word.usphone or word.ukphone}/"
+                    elif by_meaning:
+                        text += f"  {'；'.join(word.trans)}"
+                    lst.insert(tk.END, text)
+                if index is None and self.index_error:
+                    hint.config(text=self.index_error, fg='red')
+                elif index is None:
+                    hint.config(text='正在建立索引…' if self.words else '当前没有词典', fg='gray')
+                    if self.words and not poll['pending']:
+                        poll['pending'] = True
+                        dlg.after(200, lambda: dlg.winfo_exists() and (poll.update(pending=False) or refresh()))
+                else:
+                    hint.config(text=f'{len(matches)} 条匹配', fg='gray')
+
+            def choose(*_):
+                sel = lst.curselection()
+                pick = matches[sel[0]] if sel else (matches[0] if matches else None)
+                if pick is not None:
+                    dlg.destroy()
+                    self.jump_to(current_dict_path.get('value'), pick)
+
+            query_var.trace_add('write', refresh)
+            ent.bind('<Return>', choose)
+            ent.bind('<Down>', lambda e: (lst.focus_set(), lst.selection_set(0)) if matches else None)
+            lst.bind('<Return>', choose)
+            lst.bind('<Double-Button-1>', choose)
+            dlg.bind('<Escape>', lambda e: dlg.destroy())
+            refresh()
+            ent.focus_force()
+
+        self.root.after(0, _open)
+
 def humanize_hotkey(pynput_style):
     # 将 '<ctrl>+<alt>+s' -> 'ctrl+alt+s' 便于显示/编辑
     try:
@@ -534,14 +995,146 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
-def load_dict_from_file(path):
+def open_packed_dict(path):
+    # 零散的词典文件不存在时（如 onefile 打包只带了 dicts.pack），从词典包中按块读取
+    pack = get_pack(resource_path(PACK_FILE))
+    if pack is not None and path in pack:
+        return WordList(pack.open_dict(path))
+    return None
+
+def dict_exists(path):
+    if os.path.exists(resource_path(path)):
+        return True
+    pack = get_pack(resource_path(PACK_FILE))
+    return pack is not None and path in pack
+
+def load_dict_from_file(path, stream=True):
+    # 优先使用 compiled_dict.py 生成的 .sdd 文件（mmap 按需解码），切换词典耗时与词典大小无关；
+    # 否则读取 dict_snapshot 的持久化快照（热启动跳过 JSON 解码），最后才解析 JSON 并写入快照；
+    # 记录均为紧凑编码，由 WordList 在访问时才生成 Word 对象。
+    # 本地没有该文件时从 dicts.pack 读取；超大的 JSON 词表使用分页模式
+    # stream=False 时在调用线程内完整解析（后台预加载使用）
     try:
-        with open(resource_path(path), 'r', encoding='utf-8') as f:
-            return json.load(f)
+        full_path = resource_path(path)
+        if not os.path.exists(full_path):
+            packed = open_packed_dict(path)
+            if packed is not None:
+                return packed
+        # 超大的 JSON 词表（且没有 .sdd）走分页模式，内存占用不随词表大小增长
+        elif not os.path.exists(compiled_path_for(full_path)) \
+                and os.path.getsize(full_path) >= paging_settings.get('min_mb', 8) * 1024 * 1024:
+            return open_paged_json(full_path, window=int(paging_settings.get('window', 256)))
+        words = WordList.from_file(full_path, snapshot_key=path,
+                                   stream_threshold=STREAM_THRESHOLD if stream else None, length_hint=dict_length_hint(path, full_path),
+                                   intern_table=word_table)
+        words = intern_word_list(words, word_table)
+        words.prepare_display()
+        return words
     except Exception as e:
         print(f"词典加载失败: {path} - {e}")
         return []
 
+def index_source_path(path):
+    # 判断持久化索引是否过期所依据的文件：原始 JSON，其次 .sdd（打包时可能只带编译文件），最后是 dicts.pack
+    full_path = resource_path(path)
+    for candidate in (full_path, compiled_path_for(full_path), resource_path(PACK_FILE)):
+        if os.path.exists(candidate):
+            return candidate
+    raise FileNotFoundError(f'找不到词典文件: {path}')
+
+def words_complete(words):
+    # 流式加载（StreamingRecords）的词表在后台解析完成前返回 False，其它词表总是 True
+    return getattr(getattr(words, 'source', None), 'done', True)
+
+def dict_length_hint(path, full_path):
+    # dict_validator 生成的清单中记录了实际词条数，文件大小与清单一致时优先使用；否则用注册表中的 length
+    global dict_manifest
+    if dict_manifest is None:
+        dict_manifest = load_manifest(resource_path(MANIFEST_FILE))
+    report = dict_manifest.get(path)
+    if report and report.get('count') and report.get('size') == os.path.getsize(full_path):
+        return report['count']
+    return (get_catalog().by_url(path) or {}).get('length')
+
+def get_word_search():
+    # 每次运行首次打开搜索框时在后台线程增量导入全部词典：未改动的词典按 size / mtime 跳过，
+    # 新增、修改过的词典和上次退出时没导完的词典会被（重新）导入
+    global word_search, search_index_refreshed
+    if word_search is None:
+        try:
+            word_search = WordSearch()
+        except Exception as e:
+            print(f"搜索索引打开失败: {e}")
+            return None
+    if not search_index_refreshed and not search_index_building.is_set():
+        search_index_refreshed = True
+        search_index_building.set()
+        def _build():
+            try:
+                build_search_db(resource_path('.'))
+            finally:
+                search_index_building.clear()
+        threading.Thread(target=_build, daemon=True).start()
+    return word_search
+
+def get_fuzzy_index():
+    # 持久化的索引过期或不存在时在后台重建（进程池读取各词典），建好之前返回 None
+    if fuzzy_index is None and fuzzy_index_error is None and not fuzzy_index_building.is_set():
+        fuzzy_index_building.set()
+        def _load():
+            global fuzzy_index, fuzzy_index_error
+            try:
+                base_dir = resource_path('.')
+                fuzzy_index = load_fuzzy_index(base_dir) or build_fuzzy_index(base_dir)
+            except Exception as e:
+                fuzzy_index_error = str(e)
+                print(f"拼写索引建立失败: {e}")
+            finally:
+                fuzzy_index_building.clear()
+        threading.Thread(target=_load, daemon=True).start()
+    return fuzzy_index
+
+def get_phonetic_index():
+    # 同 get_fuzzy_index：持久化的索引过期或不存在时在后台重建，建好之前返回 None
+    if phonetic_index is None and phonetic_index_error is None and not phonetic_index_building.is_set():
+        phonetic_index_building.set()
+        def _load():
+            global phonetic_index, phonetic_index_error
+            try:
+                base_dir = resource_path('.')
+                phonetic_index = load_catalog_phonetic_index(base_dir) or build_catalog_phonetic_index(base_dir)
+            except Exception as e:
+                phonetic_index_error = str(e)
+                print(f"音标索引建立失败: {e}")
+            finally:
+                phonetic_index_building.clear()
+        threading.Thread(target=_load, daemon=True).start()
+    return phonetic_index
+
+def dict_file_size(path):
+    try:
+        return os.path.getsize(resource_path(path))
+    except OSError:
+        # 词典包中的词典按块解压，常驻内存很小
+        return 0
+
+def find_dict_category(url):
+    catalog = get_catalog()
+    category = catalog.menu_category_of(url)
+    if category is None:
+        return None, []
+    return category, [e.get('url') for e in catalog.all_dicts[category]]
+
+def schedule_prefetch(url):
+    # 空闲后预加载 url 所在分类的其它词典；切换分类时旧任务自动取消
+    if not dict_prefetcher:
+        return
+    category, urls = find_dict_category(url)
+    if category:
+        dict_prefetcher.schedule(category, urls, url)
+    else:
+        dict_prefetcher.cancel()
+
 def create_image():
     img = Image.new('RGB', (64, 64), color=(255, 255, 255))
     d = ImageDraw.Draw(img)
@@ -562,13 +1155,22 @@ def create_tray_icon(app_window):
         save_config()
 
     def load_and_update_dict(path, icon_obj=None, item=None):
-        new_words = load_dict_from_file(path)
+        new_words = dict_prefetcher.get_or_load(path)
         app_window.update_word_list(new_words, path)
+        schedule_prefetch(path)
 
     def toggle_remove_topmost(icon_obj, item):
         topmost_timer['enabled'] = not topmost_timer['enabled']
         save_config()
 
+    def toggle_prefetch(icon_obj, item):
+        dict_prefetcher.enabled = not dict_prefetcher.enabled
+        if dict_prefetcher.enabled:
+            schedule_prefetch(current_dict_path['value'])
+        else:
+            dict_prefetcher.cancel()
+        save_config()
+
     def open_about_page(icon_obj=None, item=None):
         import webbrowser
         webbrowser.open("https://github.com/muieay")
@@ -582,25 +1184,34 @@ def create_tray_icon(app_window):
                 pass
         return create_image()
 
+    def make_view_item(view):
+        return item(VIEW_LABELS[view],
+                    lambda icon_obj, it: app_window.root.after(0, app_window.set_study_view, view),
+                    checked=lambda it: study_view['value'] == view, radio=True)
+
     def build_dict_menu():
         def make_item(entry):
             return item(entry["name"], partial(load_and_update_dict, entry["url"]))
-        return [item(category, menu(*[make_item(e) for e in entries])) for category, entries in all_dicts.items()]
+        return [item(category, menu(*[make_item(e) for e in entries])) for category, entries in get_catalog().all_dicts.items()]
 
     menu_structure = menu(
         item('显示', on_show),
         item('隐藏', on_hide),
         item('关于', open_about_page),
         item('设置', lambda icon_obj, it: app_window.root.after(0, app_window.open_settings)),
+        item('复习统计', lambda icon_obj, it: app_window.root.after(0, app_window.show_review_stats)),
         item('置顶', toggle_remove_topmost, checked=lambda item: topmost_timer['enabled']),
         item('词典', menu(*build_dict_menu())),
+        item('预加载', toggle_prefetch, checked=lambda item: dict_prefetcher.enabled),
         item('发音', menu(
             item('英音', lambda icon_obj, it: set_pronunciation(1)),
             item('美音', lambda icon_obj, it: set_pronunciation(2))
         )),
         item('模式', menu(
             item('顺序', lambda icon_obj, it: set_shuffle_mode(False)),
-            item('随机', lambda icon_obj, it: set_shuffle_mode(True))
+            item('随机', lambda icon_obj, it: set_shuffle_mode(True)),
+            menu.SEPARATOR,
+            *[make_view_item(view) for view in VIEW_LABELS]
         )),
         item('退出', on_quit)
     )
@@ -701,7 +1312,9 @@ def hotkey_action_factory(app_window):
             'next': app_window.show_next_word,
             'prev': app_window.show_prev_word,
             'known': app_window.mark_current_known,
-            'forgot': app_window.mark_current_forgot
+            'forgot': app_window.mark_current_forgot,
+            'search': app_window.open_search,
+            'jump': app_window.open_jump
         }
         for name, handler in actions.items():
             raw = user_hotkeys.get(name, DEFAULT_HOTKEYS.get(name, ''))
@@ -741,25 +1354,31 @@ if __name__ == "__main__":
     except Exception:
         pass
 
-    load_review_data()
     config = load_config()
+    load_review_data()
     pronunciation_type['value'] = config.get('pronunciation_type', 1)
     shuffle_mode['value'] = config.get('shuffle_mode', False)
+    study_view['value'] = config.get('study_view', VIEW_ALL) if config.get('study_view') in VIEW_LABELS else VIEW_ALL
     topmost_timer['enabled'] = config.get('topmost_enabled', True)
+    dict_cache.set_budget(int(config.get('dict_cache_mb', DEFAULT_BUDGET_MB)) * 1024 * 1024)
+    dict_prefetcher = DictPrefetcher(dict_cache, load_dict_from_file, size_hint=dict_file_size,
+                                     prefetch_loader=partial(load_dict_from_file, stream=False))
+    dict_prefetcher.enabled = config.get('prefetch_enabled', True)
 
     # hotkeys 已在 load_config 中合并到 user_hotkeys
 
     dict_path = config.get('current_dict')
-    if not dict_path or not os.path.exists(resource_path(dict_path)):
+    if not dict_path or not dict_exists(dict_path):
         # 选取第一个内置字典
         try:
-            dict_path = next(iter(all_dicts.values()))[0]['url']
+            dict_path = next(iter(get_catalog().all_dicts.values()))[0]['url']
         except Exception:
             dict_path = ''
     current_dict_path['value'] = dict_path
 
-    initial_words = load_dict_from_file(dict_path) if dict_path else []
+    # 完整词典在后台线程加载；窗口先显示上次会话快照中 current_index 附近的词条
     start_index = config.get('current_index', 0)
+    initial_words = (load_session(dict_path, start_index) or []) if dict_path else []
 
     root = tk.Tk()
     # 兼容打包环境，隐藏主窗口图标
@@ -768,7 +1387,34 @@ if __name__ == "__main__":
     except Exception:
         pass
 
-    app = TransparentWordWindow(root, initial_words, start_index=start_index)
+    app = TransparentWordWindow(root, initial_words, start_index=start_index, loading=bool(dict_path))
+
+    def record_first_word():
+        if app.words and app.words[app.index].name:
+            startup_metrics['first_word_ms'] = round((time.perf_counter() - _startup_t0) * 1000, 1)
+            print(f"首个单词显示耗时: {startup_metrics['first_word_ms']} ms")
+
+    def on_dict_loaded(words):
+        startup_metrics['full_dict_ms'] = round((time.perf_counter() - _startup_t0) * 1000, 1)
+        app.finish_loading(words, dict_path)
+        if 'first_word_ms' not in startup_metrics:
+            record_first_word()
+        print(f"完整词典加载耗时: {startup_metrics['full_dict_ms']} ms")
+        schedule_prefetch(dict_path)
+
+    def load_initial_dict():
+        words = dict_cache.get_or_load(dict_path, load_dict_from_file)
+        if not words_complete(words):
+            # 在后台等到上次的下标被解析出来，窗口期间继续显示会话快照
+            words.source.wait_parsed(start_index + 1)
+        try:
+            root.after(0, on_dict_loaded, words)
+        except RuntimeError:
+            pass
+
+    root.after_idle(record_first_word)
+    if dict_path:
+        threading.Thread(target=load_initial_dict, daemon=True).start()
 
     # 启动全局热键监听（守护线程）
     start_hotkeys_listener(app)
@@ -778,7 +1424,7 @@ if __name__ == "__main__":
 
     window_width, window_height = 700, 150
     set_window_to_bottom_right(root, window_width, window_height)
-    root.protocol("WM_DELETE_WINDOW", lambda: [save_config(), save_review_data(), root.destroy()])
+    root.protocol("WM_DELETE_WINDOW", lambda: [close_config(), save_review_data(), dict_prefetcher.shutdown(), root.destroy()])
     # 将 visual 设置应用到初始窗口
     app.apply_visual_settings()
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+# 超大词表的分页模式：只在当前下标 ±N 范围内保留解码后的 Word，其余词条留在磁盘上，
+# 随滚动按页读取、淘汰窗口外的页，内存占用与词表大小基本无关。
+# 窗口以界面当前显示的下标（display() 设置的 focus）为中心；窗口外的访问（如遍历）直接解码，不缓存、不触发淘汰。
+# 磁盘数据可以是 .sdd / dicts.pack 视图，也可以是原始 JSON（首次打开时扫描出每个元素的字节偏移并持久化）
+import json
+import mmap
+import os
+import re
+import threading
+from array import array
+
+from atomic_file import atomic_write_marshal, read_marshal
+from dict_snapshot import SNAPSHOT_DIR, snapshot_path_for
+from word_list import Word, render_word
+
+DEFAULT_PAGE_SIZE = 128
+DEFAULT_WINDOW = 256
+OFFSETS_VERSION = 1
+
+# 字符串整体作为一个 token（正则在 C 层处理转义），其余只关心结构字符
+_STRUCT_RE = re.compile(rb'"(?:[^"\\]|\\.)*"|[\[\]{},]', re.DOTALL)
+
+
+def scan_json_array_offsets(buf):
+    # 返回顶层数组每个元素的 (starts, ends) 字节偏移
+    starts, ends = array('Q'), array('Q')
+    depth = 0
+    elem_start = None
+    for m in _STRUCT_RE.finditer(buf):
+        tok = m.group()
+        if tok[0] == 0x22:  # '"'
+            continue
+        if tok in (b'[', b'{'):
+            depth += 1
+            if depth == 1:
+                elem_start = m.end()
+            continue
+        if tok in (b']', b'}'):
+            depth -= 1
+            if depth == 0:
+                if buf[elem_start:m.start()].strip():
+                    starts.append(elem_start)
+                    ends.append(m.start())
+                return starts, ends
+            continue
+        if tok == b',' and depth == 1:
+            starts.append(elem_start)
+            ends.append(m.start())
+            elem_start = m.end()
+    raise ValueError('JSON 数组未结束')
+
+
+class JsonIndexedRecords:
+    """按字节偏移随机读取 JSON 数组元素；偏移表缓存在快照目录，文件 size/mtime 变化时重建。"""
+
+    def __init__(self, path, snapshot_dir=SNAPSHOT_DIR):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._starts, self._ends = self._load_offsets(snapshot_dir)
+
+    def _load_offsets(self, snapshot_dir):
+        st = os.stat(self.path)
+        cache_path = snapshot_path_for(os.path.abspath(self.path) + '#offsets', snapshot_dir)
+        try:
+            data = read_marshal(cache_path)
+            if isinstance(data, dict) and data.get('version') == OFFSETS_VERSION and data.get('size') == st.st_size \
+                    and data.get('mtime_ns') == st.st_mtime_ns:
+                starts, ends = array('Q'), array('Q')
+                starts.frombytes(data['starts'])
+                ends.frombytes(data['ends'])
+                return starts, ends
+        except Exception:
+            pass
+        starts, ends = scan_json_array_offsets(self._mm)
+        try:
+            os.makedirs(snapshot_dir, exist_ok=True)
+            atomic_write_marshal(cache_path, {'version': OFFSETS_VERSION, 'size': st.st_size,
+                                              'mtime_ns': st.st_mtime_ns,
+                                              'starts': starts.tobytes(), 'ends': ends.tobytes()})
+        except Exception as e:
+            print(f"词表偏移索引保存失败: {e}")
+        return starts, ends
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        return json.loads(self._mm[self._starts[index]:self._ends[index]].decode('utf-8'))
+
+    @property
+    def nbytes(self):
+        return self._starts.itemsize * len(self._starts) * 2
+
+
+class PagedWordList:
+    """与 WordList 接口一致的分页词表，只保留 index ± window 范围内的页。"""
+
+    def __init__(self, source, window=DEFAULT_WINDOW, page_size=DEFAULT_PAGE_SIZE):
+        self._source = source
+        self.window = max(0, window)
+        self.page_size = max(1, page_size)
+        self._pages = {}  # 页号 -> [Word, ...]
+        self._lock = threading.Lock()
+        self.focus = 0    # 界面当前显示的下标
+        self.page_loads = 0
+        self.page_evictions = 0
+
+    def __len__(self):
+        return len(self._source)
+
+    def _load_page(self, page_no):
+        start = page_no * self.page_size
+        end = min(len(self._source), start + self.page_size)
+        self.page_loads += 1
+        return [Word.from_dict(self._source[i]) for i in range(start, end)]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self._source)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError('词条下标越界')
+        page_no, offset = divmod(index, self.page_size)
+        with self._lock:
+            page = self._pages.get(page_no)
+            if page is None:
+                lo, hi = self._window_pages(self.focus)
+                if not lo <= page_no <= hi:
+                    return Word.from_dict(self._source[index])
+                page = self._load_page(page_no)
+                self._pages[page_no] = page
+            return page[offset]
+
+    def _window_pages(self, index):
+        return max(0, index - self.window) // self.page_size, (index + self.window) // self.page_size
+
+    def set_focus(self, index):
+        # 移动窗口中心并淘汰窗口外的页
+        with self._lock:
+            self.focus = index
+            lo, hi = self._window_pages(index)
+            for page_no in [p for p in self._pages if p < lo or p > hi]:
+                del self._pages[page_no]
+                self.page_evictions += 1
+
+    def __iter__(self):
+        # 单次顺序遍历：逐条解码，不进入页缓存
+        for i in range(len(self)):
+            yield Word.from_dict(self._source[i])
+
+    def display(self, index):
+        # 只有界面显示当前单词时调用，以它为窗口中心
+        self.set_focus(index)
+        return render_word(self[index])
+
+    def prepare_display(self):
+        pass
+
+    @property
+    def source(self):
+        return self._source
+
+    @property
+    def decoded_count(self):
+        return sum(len(p) for p in self._pages.values())
+
+    @property
+    def nbytes(self):
+        return getattr(self._source, 'nbytes', 0) + self.decoded_count * 200
+
+
+def open_paged_json(path, window=DEFAULT_WINDOW, page_size=DEFAULT_PAGE_SIZE):
+    return PagedWordList(JsonIndexedRecords(path), window=window, page_size=page_size)
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# 按音标查词：把 usphone / ukphone 规范化成紧凑的音素符号串（每个音素一个字符），
+# 词典的 usphone 是 KK 音标（e = eɪ，o = oʊ，ɛ 为 bed 中的元音），ukphone 与查询按 IPA 处理，规范化时分别对待。
+# 再对首尾补 '^' / '$' 的符号串建 1~3 元组倒排表，支持“包含 /æ/”“以 /ʃən/ 结尾”“以 /ɪk/ 开头”这类查询。
+# 查询时按查询串的 n 元组求交得到候选，再用子串匹配校验。
+# 当前词典的索引按词典持久化到快照目录；全部词典的索引由进程池读取各词典后去重合并，单独持久化。
+import os
+import re
+import sys
+import tempfile
+import time
+from array import array
+
+from atomic_file import atomic_write_marshal, read_marshal
+from catalog_scan import dict_sources, scan_dicts, sources_signature
+from dict_snapshot import SNAPSHOT_DIR, snapshot_path_for
+
+PHONETIC_INDEX_PATH = os.path.join(tempfile.gettempdir(), 'study_desk_phonetic.idx')
+INDEX_VERSION = 3
+MAX_GRAM = 3
+
+MODE_CONTAINS = 'contains'
+MODE_STARTS = 'starts'
+MODE_ENDS = 'ends'
+
+# 多个字符表示的音素合并成一个符号；美式/英式写法差异统一到同一个符号
+_COMPOUNDS = [
+    ('tʃ', 'ʧ'), ('dʒ', 'ʤ'),
+    ('aɪ', 'Ⓐ'), ('eɪ', 'Ⓔ'), ('ɔɪ', 'Ⓞ'), ('oɪ', 'Ⓞ'), ('aʊ', 'Ⓦ'),
+    ('əʊ', 'Ⓠ'), ('oʊ', 'Ⓠ'), ('əu', 'Ⓠ'), ('ou', 'Ⓠ'),
+    # IPA 中单独的 o 是 ɔ 的写法；KK 中的 o 在 _KK_RE 里先并入 oʊ
+    ('o', 'ɔ'),
+    ('ɪə', 'Ⓘ'), ('eə', 'Ⓡ'), ('ɛə', 'Ⓡ'), ('ʊə', 'Ⓤ'),
+]
+_REPLACE = str.maketrans({
+    'ɡ': 'g', 'ε': 'e', 'ɛ': 'e', '3': 'ɜ', ':': '', 'ː': '', 'ʳ': 'r',
+    'ɝ': 'ɜ', 'ɚ': 'ə',
+})
+# 重音、音节分隔、空白与括号（括号内的可省读音素保留）
+_DROP_RE = re.compile(r"[\s'ˈˌ‘’.\-()​]")
+_VARIANT_SPLIT_RE = re.compile(r'[;；,/|]')
+_COMPOUND_RE = re.compile('|'.join(re.escape(a) for a, _ in sorted(_COMPOUNDS, key=lambda c: -len(c[0]))))
+_COMPOUND_MAP = dict(_COMPOUNDS)
+# KK 音标里单独的 e / o 是双元音 eɪ / oʊ（如 sake /sek/、remote /rɪ'mot/），须在 ɛ -> e 之前替换
+_KK_RE = re.compile('e(?![ɪə])|o(?![ʊuɪ])')
+_KK_MAP = {'e': 'Ⓔ', 'o': 'Ⓠ'}
+
+
+def normalize_ipa(text, kk=False):
+    # 返回规范化后的音素串列表（一个音标字段里可能用 ';' 写了几种读法）；kk=True 按 KK 音标（usphone）处理
+    variants = []
+    for part in _VARIANT_SPLIT_RE.split(text or ''):
+        part = _DROP_RE.sub('', part)
+        if kk:
+            part = _KK_RE.sub(lambda m: _KK_MAP[m.group()], part)
+        part = part.translate(_REPLACE)
+        part = _COMPOUND_RE.sub(lambda m: _COMPOUND_MAP[m.group()], part)
+        if part and part not in variants:
+            variants.append(part)
+    return variants
+
+
+def parse_query(query):
+    # "/*ʃən/" -> 以 ʃən 结尾；"/ɪk*/" -> 以 ɪk 开头；其余为包含。返回 (mode, 规范化后的符号串)
+    query = (query or '').strip().strip('/').strip()
+    mode = MODE_CONTAINS
+    if query.startswith('*') and not query.endswith('*'):
+        mode = MODE_ENDS
+    elif query.endswith('*') and not query.startswith('*'):
+        mode = MODE_STARTS
+    variants = normalize_ipa(query.strip('*'))
+    return mode, variants[0] if variants else ''
+
+
+def _grams(text):
+    grams = set()
+    for n in range(1, MAX_GRAM + 1):
+        grams.update(text[i:i + n] for i in range(len(text) - n + 1))
+    return grams
+
+
+def _query_grams(pattern):
+    # 校验前用于求交的 n 元组：短查询用自身，长查询用全部三元组
+    if len(pattern) <= MAX_GRAM:
+        return [pattern]
+    return list({pattern[i:i + MAX_GRAM] for i in range(len(pattern) - MAX_GRAM + 1)})
+
+
+class PhoneticIndex:
+    """第 i 项的规范化音素串为 phones[i]（多种读法用 '|' 连接，首尾带 '^' / '$'）。"""
+
+    def __init__(self, phones, postings):
+        self.phones = phones
+        self._postings = postings
+
+    @classmethod
+    def build(cls, phone_pairs):
+        # phone_pairs: 可迭代的 (usphone, ukphone)
+        phones = []
+        postings = {}
+        for i, (us, uk) in enumerate(phone_pairs):
+            variants = normalize_ipa(us, kk=True)
+            variants += [v for v in normalize_ipa(uk) if v not in variants]
+            padded = ['^' + v + '$' for v in variants]
+            phones.append('|'.join(padded))
+            grams = set()
+            for p in padded:
+                grams |= _grams(p)
+            for gram in grams:
+                lst = postings.get(gram)
+                if lst is None:
+                    postings[gram] = lst = array('I')
+                lst.append(i)
+        return cls(phones, postings)
+
+    def __len__(self):
+        return len(self.phones)
+
+    def posting(self, gram):
+        lst = self._postings.get(gram)
+        if isinstance(lst, bytes):
+            arr = array('I')
+            arr.frombytes(lst)
+            self._postings[gram] = lst = arr
+        return lst or ()
+
+    def search(self, query, limit=50):
+        # 返回满足查询的项编号（按编号顺序）
+        mode, pattern = parse_query(query)
+        if not pattern:
+            return []
+        if mode == MODE_STARTS:
+            pattern = '^' + pattern
+        elif mode == MODE_ENDS:
+            pattern = pattern + '$'
+        lists = sorted((self.posting(g) for g in _query_grams(pattern)), key=len)
+        if not lists or not lists[0]:
+            return []
+        candidates = set(lists[0])
+        for lst in lists[1:]:
+            candidates.intersection_update(lst)
+            if not candidates:
+                return []
+        result = []
+        phones = self.phones
+        for i in sorted(candidates):
+            if pattern in phones[i]:
+                result.append(i)
+                if len(result) >= limit:
+                    break
+        return result
+
+    def to_data(self):
+        return {'phones': self.phones,
+                'postings': {g: (l if isinstance(l, bytes) else l.tobytes()) for g, l in self._postings.items()}}
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(data['phones'], data['postings'])
+
+
+def _phone_pairs(words):
+    for i in range(len(words)):
+        word = words[i]
+        yield word.usphone or '', word.ukphone or ''
+
+
+def load_phonetic_index(key, source_path, words, snapshot_dir=SNAPSHOT_DIR):
+    # 当前词典的音标索引；source_path 用于判断持久化的索引是否过期（JSON 文件或 dicts.pack）
+    st = os.stat(source_path)
+    cache_path = snapshot_path_for(key + '#phonetic', snapshot_dir)
+    try:
+        data = read_marshal(cache_path)
+        if isinstance(data, dict) and data.get('version') == INDEX_VERSION and data.get('size') == st.st_size \
+                and data.get('mtime_ns') == st.st_mtime_ns and data.get('count') == len(words):
+            return PhoneticIndex.from_data(data['index'])
+    except Exception as e:
+        print(f"音标索引读取失败: {cache_path} - {e}")
+    index = PhoneticIndex.build(_phone_pairs(words))
+    try:
+        os.makedirs(snapshot_dir, exist_ok=True)
+        atomic_write_marshal(cache_path, {'version': INDEX_VERSION, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+                                          'count': len(words), 'index': index.to_data()})
+    except Exception as e:
+        print(f"音标索引保存失败: {e}")
+    return index
+
+
+class CatalogPhoneticIndex:
+    """全部词典去重后的音标索引；每项记录单词名及其首次出现的位置（词典 url + 下标）。"""
+
+    def __init__(self, index, names, urls, loc_url, loc_index, signature=''):
+        self.index = index
+        self.names = names
+        self.urls = urls
+        self.loc_url = loc_url
+        self.loc_index = loc_index
+        self.signature = signature
+
+    def __len__(self):
+        return len(self.names)
+
+    def search(self, query, limit=50):
+        # 返回 [{'name', 'url', 'index'}]
+        return [{'name': self.names[i], 'url': self.urls[self.loc_url[i]], 'index': self.loc_index[i]}
+                for i in self.index.search(query, limit)]
+
+    def save(self, path=PHONETIC_INDEX_PATH):
+        atomic_write_marshal(path, {'version': INDEX_VERSION, 'signature': self.signature, 'names': self.names,
+                                    'urls': self.urls, 'loc_url': self.loc_url.tobytes(),
+                                    'loc_index': self.loc_index.tobytes(), 'index': self.index.to_data()})
+
+    @classmethod
+    def load(cls, path=PHONETIC_INDEX_PATH):
+        data = read_marshal(path)
+        if not isinstance(data, dict) or data.get('version') != INDEX_VERSION:
+            raise ValueError('音标索引版本不匹配或文件已损坏')
+        loc_url, loc_index = array('I'), array('I')
+        loc_url.frombytes(data['loc_url'])
+        loc_index.frombytes(data['loc_index'])
+        return cls(PhoneticIndex.from_data(data['index']), data['names'], data['urls'],
+                   loc_url, loc_index, data['signature'])
+
+
+def _collect_phones(url, words):
+    # 进程池任务：读取一个词典的 (name, usphone, ukphone)
+    return [(word.name, word.usphone or '', word.ukphone or '') for word in words]
+
+
+def build_catalog_phonetic_index(base_dir='.', path=PHONETIC_INDEX_PATH, workers=None):
+    sources = dict_sources(base_dir)
+    signature = sources_signature(base_dir, sources)
+    names, pairs, urls = [], [], []
+    loc_url, loc_index = array('I'), array('I')
+    seen = set()
+    for url, rows, error in scan_dicts(_collect_phones, base_dir, sources, workers):
+        if error:
+            print(f"读取失败: {url} - {error}")
+            continue
+        url_id = len(urls)
+        urls.append(url)
+        for i, (name, us, uk) in enumerate(rows):
+            key = (name or '').strip().lower()
+            if not key or key in seen or not (us or uk):
+                continue
+            seen.add(key)
+            names.append(name)
+            pairs.append((us, uk))
+            loc_url.append(url_id)
+            loc_index.append(i)
+    index = CatalogPhoneticIndex(PhoneticIndex.build(pairs), names, urls, loc_url, loc_index, signature)
+    if path:
+        index.save(path)
+    return index
+
+
+def load_catalog_phonetic_index(base_dir='.', path=PHONETIC_INDEX_PATH):
+    # 持久化的索引与当前词典文件一致时返回它，否则返回 None
+    if not os.path.exists(path):
+        return None
+    try:
+        index = CatalogPhoneticIndex.load(path)
+        if index.signature != sources_signature(base_dir, dict_sources(base_dir)):
+            return None
+        return index
+    except Exception as e:
+        print(f"音标索引读取失败: {path} - {e}")
+        return None
+
+
+if __name__ == '__main__':
+    # 用法: python phonetic_index.py [词典根目录] [查询...]，例如 "/*ʃən/"、"/æ/"、"/ɪk*/"
+    base = sys.argv[1] if len(sys.argv) > 1 else '.'
+    t0 = time.perf_counter()
+    catalog_index = load_catalog_phonetic_index(base)
+    if catalog_index is None:
+        catalog_index = build_catalog_phonetic_index(base)
+        print(f'已建立音标索引：{len(catalog_index)} 个单词，{time.perf_counter() - t0:.1f} s')
+    else:
+        print(f'已读取音标索引：{len(catalog_index)} 个单词，{(time.perf_counter() - t0) * 1000:.1f} ms')
+    for q in sys.argv[2:]:
+        t0 = time.perf_counter()
+        hits = catalog_index.search(q, limit=1000)
+        elapsed = (time.perf_counter() - t0) * 1000
+        print(f'{q}: {len(hits)} 条，{elapsed:.2f} ms -> {[h["name"] for h in hits[:10]]}')
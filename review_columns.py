@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# 列式复习数据：每个已复习单词占一行，known / forgot 为 array('I')，last 为 array('q') 的 UTC 秒级时间戳（0 表示无），
+# 另有 name -> 行号 的 dict 索引。相比每词一个 {'known', 'forgot', 'last': ISO 字符串} 的 dict，
+# 内存从每词约 350 字节降到约 150 字节（主要是单词名与索引项）；快照用 marshal 存成几段连续字节，约为 JSON 的 1/3。
+# 行只追加不删除；写入由复习存储在自己的锁内完成，界面线程只读 counts()，不需要加锁。
+# 用法: python review_columns.py --bench [词数]   比较 dict 与列式表示的内存占用与快照大小
+import heapq
+import json
+import sys
+import tracemalloc
+from array import array
+from datetime import datetime, timezone
+
+from atomic_file import atomic_write_marshal, read_marshal
+
+COLUMNS_VERSION = 1
+
+
+def to_epoch(value):
+    # ISO-8601（旧数据中 datetime.utcnow().isoformat() 写入的无时区 UTC 时间）或数字 -> 秒级时间戳
+    if not value:
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        when = datetime.fromisoformat(value)
+    except ValueError:
+        return 0
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return int(when.timestamp())
+
+
+def to_iso(ts):
+    # 秒级时间戳 -> 与旧数据一致的无时区 UTC ISO 字符串；0 返回 None
+    if not ts:
+        return None
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None).isoformat()
+
+
+class ReviewColumns:
+    def __init__(self):
+        self.names = []
+        self.rows = {}
+        self.known = array('I')
+        self.forgot = array('I')
+        self.last = array('q')
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.rows
+
+    def row(self, name):
+        return self.rows.get(name)
+
+    def counts(self, name):
+        # 返回 (known, forgot)；未复习过返回 None。update_display 与学习视图走这里，不创建 dict
+        row = self.rows.get(name)
+        if row is None:
+            return None
+        return self.known[row], self.forgot[row]
+
+    def get(self, name):
+        # 返回 {'known', 'forgot', 'last': ISO 字符串} 的副本；只用于统计与导出
+        row = self.rows.get(name)
+        if row is None:
+            return None
+        return {'known': self.known[row], 'forgot': self.forgot[row], 'last': to_iso(self.last[row])}
+
+    def _append(self, name):
+        # 先追加各列再登记索引，无锁读取的线程不会看到超出列长度的行号
+        row = len(self.names)
+        self.names.append(name)
+        self.known.append(0)
+        self.forgot.append(0)
+        self.last.append(0)
+        self.rows[name] = row
+        return row
+
+    def set(self, name, known, forgot, last):
+        row = self.rows.get(name)
+        if row is None:
+            row = self._append(name)
+        self.known[row] = known
+        self.forgot[row] = forgot
+        self.last[row] = last
+        return row
+
+    def mark(self, name, field, when):
+        # field 为 'known' 或 'forgot'，when 为秒级时间戳；返回行号
+        row = self.rows.get(name)
+        if row is None:
+            row = self._append(name)
+        column = self.known if field == 'known' else self.forgot
+        column[row] += 1
+        self.last[row] = when
+        return row
+
+    def records(self):
+        # 逐行返回 (name, known, forgot, last)
+        return zip(self.names, self.known, self.forgot, self.last)
+
+    def totals(self):
+        # 返回 (已复习词数, 熟记总次数, 忘记总次数)
+        return len(self.names), sum(self.known), sum(self.forgot)
+
+    def recently_forgotten(self, limit=20):
+        # 忘记次数多于熟记次数的单词，最近复习的在前
+        rows = heapq.nlargest(limit, (row for row in range(len(self.names)) if self.forgot[row] > self.known[row]),
+                              key=self.last.__getitem__)
+        return [{'word': self.names[row], 'known': self.known[row], 'forgot': self.forgot[row],
+                 'last': to_iso(self.last[row])} for row in rows]
+
+    def copy(self):
+        other = ReviewColumns()
+        other.names = list(self.names)
+        other.rows = dict(self.rows)
+        other.known = array('I', self.known)
+        other.forgot = array('I', self.forgot)
+        other.last = array('q', self.last)
+        return other
+
+    # ---- 持久化 ----
+
+    def to_data(self):
+        # 单词名用 \x00 连接成一个字符串（与 .sdd 一样，\x00 不会出现在词条中）
+        return {'version': COLUMNS_VERSION, 'names': '\x00'.join(self.names), 'known': self.known.tobytes(),
+                'forgot': self.forgot.tobytes(), 'last': self.last.tobytes()}
+
+    @classmethod
+    def from_data(cls, data):
+        if data.get('version') != COLUMNS_VERSION:
+            raise ValueError('复习数据版本不匹配')
+        columns = cls()
+        columns.names = data['names'].split('\x00') if data['names'] else []
+        columns.known.frombytes(data['known'])
+        columns.forgot.frombytes(data['forgot'])
+        columns.last.frombytes(data['last'])
+        if not len(columns.names) == len(columns.known) == len(columns.forgot) == len(columns.last):
+            raise ValueError('复习数据列长度不一致')
+        columns.rows = {name: row for row, name in enumerate(columns.names)}
+        return columns
+
+    @classmethod
+    def from_dict(cls, review_data):
+        # 从旧的 {name: {'known', 'forgot', 'last'}} 迁移
+        columns = cls()
+        for name, entry in (review_data or {}).items():
+            if isinstance(entry, dict):
+                columns.set(name, int(entry.get('known', 0) or 0), int(entry.get('forgot', 0) or 0),
+                            to_epoch(entry.get('last')))
+        return columns
+
+    def save(self, path, backup=True, fsync=True):
+        atomic_write_marshal(path, self.to_data(), backup=backup, fsync=fsync)
+
+    @classmethod
+    def load(cls, path):
+        # 快照不存在时返回 None；损坏时由 read_marshal 改读 .bak
+        data = read_marshal(path, use_backup=True)
+        if data is None:
+            return None
+        if not isinstance(data, dict):
+            raise ValueError('复习数据格式错误')
+        return cls.from_data(data)
+
+
+def bench(size=50000):
+    import os
+    import tempfile
+    import time
+    stamp = '2026-01-01T00:00:00.'
+    # 两种表示各自新建单词名，内存统计包含名字本身
+    tracemalloc.start()
+    as_dict = {f'word{i}': {'known': i % 5, 'forgot': i % 3, 'last': f'{stamp}{i:06d}'} for i in range(size)}
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    tracemalloc.start()
+    columns = ReviewColumns()
+    for i in range(size):
+        columns.set(f'word{i}', i % 5, i % 3, 1767225600 + i)
+    columns_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'review.cols')
+        columns.save(path, backup=False)
+        t0 = time.perf_counter()
+        ReviewColumns.load(path)
+        load_ms = (time.perf_counter() - t0) * 1000
+        cols_size = os.path.getsize(path)
+    json_size = len(json.dumps(as_dict, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    print(f'{size} 个单词：内存 dict {dict_bytes / size:.0f} B/词，列式 {columns_bytes / size:.0f} B/词；'
+          f'快照 JSON {json_size / size:.0f} B/词，列式 {cols_size / size:.0f} B/词（加载 {load_ms:.1f} ms）')
+
+
+if __name__ == '__main__':
+    if '--bench' in sys.argv:
+        rest = [a for a in sys.argv[1:] if a != '--bench']
+        bench(int(rest[0]) if rest else 50000)
+    else:
+        print('用法: python review_columns.py --bench [词数]')
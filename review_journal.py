@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# 复习记录的追加日志：每次标记只在日志末尾追加一行 [name, known, forgot, last]（该词标记后的完整状态，last 为秒级时间戳），
+# 不再整体重写复习数据。日志由后台线程批量 flush + fsync；内存中的数据为 ReviewColumns（列式）。
+# 日志行数超过阈值时在后台压缩：先把日志改名为 .old 并换新日志，再把内存中的数据原子地写成列式快照，最后删除 .old。
+# 每行记录的是状态而不是增量，重复回放结果不变，所以压缩中途退出也不会把次数算重。
+# 加载顺序：快照 -> .old（若压缩未完成）-> 日志；末尾写了一半的行直接忽略。
+# 列式快照不存在时从旧的 study_desk_review.json（legacy_path）迁移，下一次压缩即写成列式快照。
+# 用法: python review_journal.py --bench [词数]   比较整体重写与追加日志的单次标记耗时
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from atomic_file import read_json
+from review_columns import ReviewColumns, to_epoch
+
+FSYNC_INTERVAL = 1.0
+COMPACT_EVERY = 5000
+
+
+class ReviewJournal:
+    def __init__(self, snapshot_path, journal_path=None, legacy_path=None, fsync_interval=FSYNC_INTERVAL,
+                 compact_every=COMPACT_EVERY):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or os.path.splitext(snapshot_path)[0] + '.journal'
+        self.legacy_path = legacy_path
+        self.fsync_interval = fsync_interval
+        self.compact_every = compact_every
+        self.data = ReviewColumns()
+        self.records = 0        # 当前日志中的行数
+        self._file = None
+        self._dirty = False
+        self._closed = False
+        self._compacting = False
+        self._lock = threading.RLock()
+        self._wake = threading.Condition(self._lock)
+        self._thread = None
+
+    # ---- 加载 ----
+
+    @classmethod
+    def read(cls, snapshot_path, journal_path=None, legacy_path=None):
+        # 只读地回放快照与日志，返回 ReviewColumns（用于迁移到其它存储）
+        return cls(snapshot_path, journal_path, legacy_path)._read()[0]
+
+    def _read(self):
+        # 快照校验失败时改读上一份快照 .bak（只会丢失上一轮压缩前后那段日志中的记录）
+        data = None
+        try:
+            data = ReviewColumns.load(self.snapshot_path)
+        except Exception as e:
+            print(f"加载复习数据失败: {e}")
+        if data is None:
+            data = ReviewColumns()
+            if self.legacy_path:
+                legacy = read_json(self.legacy_path, {})
+                if isinstance(legacy, dict):
+                    data = ReviewColumns.from_dict(legacy)
+                    if len(data):
+                        print(f"已从 {self.legacy_path} 迁移 {len(data)} 条复习记录")
+        self._replay(self.journal_path + '.old', data)
+        return data, self._replay(self.journal_path, data)
+
+    def load(self):
+        # 返回复习数据 ReviewColumns（之后由 mark 原地更新，调用方可长期持有）
+        data, self.records = self._read()
+        with self._lock:
+            self.data = data
+            self._file = open(self.journal_path, 'a', encoding='utf-8')
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        if os.path.exists(self.journal_path + '.old') or (len(data) and not os.path.exists(self.snapshot_path)):
+            # 上次压缩没有完成，或刚从旧 JSON / .bak 恢复：立即重新写出快照
+            self.compact()
+        return data
+
+    @staticmethod
+    def _replay(path, data):
+        if not os.path.exists(path):
+            return 0
+        count = 0
+        loads = json.loads
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                try:
+                    name, known, forgot, last = loads(line)
+                    # 旧版本日志中的 last 是 ISO 字符串
+                    data.set(name, known, forgot, last if isinstance(last, int) else to_epoch(last))
+                except Exception:
+                    # 崩溃时写了一半的最后一行
+                    continue
+                count += 1
+        return count
+
+    # ---- 写入 ----
+
+    def mark(self, name, field, when, dict_id=''):
+        # field 为 'known' 或 'forgot'，when 为秒级时间戳；返回行号（日志不区分词典，dict_id 仅为与 SQLite 存储接口一致）
+        with self._lock:
+            data = self.data
+            row = data.mark(name, field, when)
+            if self._file is not None:
+                self._file.write(json.dumps([name, data.known[row], data.forgot[row], when],
+                                            ensure_ascii=False, separators=(',', ':')) + '\n')
+                self.records += 1
+                self._dirty = True
+                if self.records >= self.compact_every:
+                    self._wake.notify()
+            return row
+
+    def flush(self, fsync=True):
+        with self._lock:
+            if self._file is None or not self._dirty:
+                return
+            self._file.flush()
+            if fsync:
+                os.fsync(self._file.fileno())
+            self._dirty = False
+
+    def _run(self):
+        # 后台线程：每 fsync_interval 秒把新记录落盘一次；日志过长时压缩
+        while True:
+            with self._lock:
+                self._wake.wait(self.fsync_interval)
+                if self._closed:
+                    return
+                need_compact = self.records >= self.compact_every and not self._compacting
+            try:
+                self.flush()
+                if need_compact:
+                    self.compact()
+            except Exception as e:
+                print(f"复习日志写入失败: {e}")
+
+    # ---- 压缩 ----
+
+    def compact(self):
+        # 把当前数据写成快照并清空日志；在调用线程中同步完成（通常是后台线程或退出时）
+        with self._lock:
+            if self._compacting or self._file is None:
+                return
+            self._compacting = True
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            old_path = self.journal_path + '.old'
+            if os.path.exists(old_path):
+                # 上一次压缩未完成：把未完成的部分并进来，快照里已经包含这些记录
+                with open(old_path, 'a', encoding='utf-8') as dst, \
+                        open(self.journal_path, 'r', encoding='utf-8', errors='replace') as src:
+                    dst.write(src.read())
+                os.remove(self.journal_path)
+            else:
+                os.replace(self.journal_path, old_path)
+            self._file = open(self.journal_path, 'a', encoding='utf-8')
+            self.records = 0
+            self._dirty = False
+            snapshot = self.data.copy()
+        try:
+            snapshot.save(self.snapshot_path)
+            os.remove(old_path)
+        except Exception as e:
+            print(f"复习数据压缩失败: {e}")
+        finally:
+            with self._lock:
+                self._compacting = False
+
+    def close(self):
+        # 退出时调用：落盘并压缩，之后不再接受写入
+        try:
+            if self.records:
+                self.compact()
+            else:
+                self.flush()
+        finally:
+            with self._lock:
+                self._closed = True
+                self._wake.notify()
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+
+
+# ---------------------------------------------------------------------------
+# 基准：预先写入 N 个已复习单词，分别测量“整体重写 JSON（indent=2）”与“追加日志”的单次标记耗时，
+# 以及快照 + 日志尾部的回放耗时
+
+def _rewrite_mark(path, data, name, when):
+    entry = data.setdefault(name, {'known': 0, 'forgot': 0, 'last': None})
+    entry['known'] += 1
+    entry['last'] = when
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def bench(sizes=(1000, 10000, 50000), marks=200):
+    print(f"{'已复习词数':>10} {'整体重写 ms/次':>16} {'追加日志 µs/次':>16} {'加载(快照+日志) ms':>18}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            data = {f'word{i}': {'known': 1, 'forgot': 0, 'last': '2026-01-01T00:00:00'} for i in range(size)}
+            rewrite_path = os.path.join(tmp, 'rewrite.json')
+            t0 = time.perf_counter()
+            for i in range(marks):
+                _rewrite_mark(rewrite_path, data, f'word{i}', '2026-01-02T00:00:00')
+            rewrite_ms = (time.perf_counter() - t0) / marks * 1000
+
+            snapshot_path = os.path.join(tmp, 'review.cols')
+            ReviewColumns.from_dict(data).save(snapshot_path)
+            journal = ReviewJournal(snapshot_path, compact_every=10 ** 9)
+            journal.load()
+            t0 = time.perf_counter()
+            for i in range(marks * 10):
+                journal.mark(f'word{i % size}', 'forgot', 1767312000)
+            journal_us = (time.perf_counter() - t0) / (marks * 10) * 1e6
+            journal.flush()
+            t0 = time.perf_counter()
+            ReviewJournal._replay(journal.journal_path, ReviewColumns.load(snapshot_path))
+            replay_ms = (time.perf_counter() - t0) * 1000
+            journal.close()
+        print(f'{size:>13} {rewrite_ms:>18.2f} {journal_us:>18.1f} {replay_ms:>20.1f}')
+
+
+if __name__ == '__main__':
+    if '--bench' in sys.argv:
+        rest = [a for a in sys.argv[1:] if a != '--bench']
+        bench((int(rest[0]),) if rest else (1000, 10000, 50000))
+    else:
+        print('用法: python review_journal.py --bench [词数]')
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# SQLite 复习存储：reviews(word, dict_id, known, forgot, last) 表，WAL 模式。
+# 界面线程标记单词时只更新内存中的 review_data（跨词典汇总的 ReviewColumns）并把标记放进队列，立即返回；
+# 唯一的写线程取出队列中积压的全部标记，在一个事务里批量 UPSERT。
+# 按词典统计、最近忘记的单词等查询走索引，不再扫描整个复习数据。
+# 库中的 last 仍为 ISO 字符串（按文本排序即按时间排序），内存中为秒级时间戳。
+# 首次打开空数据库时从日志后端的数据（列式快照或旧的 study_desk_review.json，及其追加日志）迁移已有记录；
+# 旧记录不知道属于哪个词典，dict_id 记为空串（LEGACY_DICT_ID），统计时单独列出。
+import os
+import queue
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+from review_columns import ReviewColumns, to_epoch, to_iso
+
+REVIEW_DB_PATH = os.path.join(tempfile.gettempdir(), 'study_desk_review.db')
+MAX_BATCH = 500
+LEGACY_DICT_ID = ''
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews(
+    word TEXT NOT NULL,
+    dict_id TEXT NOT NULL DEFAULT '',
+    known INTEGER NOT NULL DEFAULT 0,
+    forgot INTEGER NOT NULL DEFAULT 0,
+    last TEXT,
+    PRIMARY KEY (word, dict_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS reviews_dict ON reviews(dict_id);
+CREATE INDEX IF NOT EXISTS reviews_forgotten ON reviews(last) WHERE forgot > known;
+"""
+
+_UPSERT = """
+INSERT INTO reviews(word, dict_id, known, forgot, last) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(word, dict_id) DO UPDATE SET
+    known = known + excluded.known,
+    forgot = forgot + excluded.forgot,
+    last = excluded.last
+"""
+
+_STOP = object()
+
+
+def _connect(db_path):
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
+
+class SQLiteReviewStore:
+    def __init__(self, db_path=REVIEW_DB_PATH, legacy_path=None, legacy_json_path=None):
+        # legacy_path 为日志后端的列式快照，legacy_json_path 为更早的 JSON 复习数据
+        self.db_path = db_path
+        self.legacy_path = legacy_path
+        self.legacy_json_path = legacy_json_path
+        self.data = ReviewColumns()
+        self.batches = 0
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._conn = None       # 只给写线程使用
+        self._reader = None     # 统计查询使用，WAL 下与写线程互不阻塞
+        self._reader_lock = threading.Lock()
+        self._thread = None
+
+    def load(self):
+        # 返回按单词汇总（跨词典）的复习数据 ReviewColumns，之后由 mark 原地更新
+        self._conn = _connect(self.db_path)
+        self._conn.executescript(_SCHEMA)
+        if self.legacy_path and self._conn.execute('SELECT 1 FROM reviews LIMIT 1').fetchone() is None:
+            self._migrate(self.legacy_path)
+        data = ReviewColumns()
+        for word, known, forgot, last in self._conn.execute(
+                'SELECT word, SUM(known), SUM(forgot), MAX(last) FROM reviews GROUP BY word'):
+            data.set(word, known, forgot, to_epoch(last))
+        self._reader = _connect(self.db_path)
+        with self._lock:
+            self.data = data
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return data
+
+    def _migrate(self, legacy_path):
+        from review_journal import ReviewJournal
+        legacy = ReviewJournal.read(legacy_path, legacy_path=self.legacy_json_path)
+        rows = [(word, LEGACY_DICT_ID, known, forgot, to_iso(last)) for word, known, forgot, last in legacy.records()]
+        if not rows:
+            return
+        with self._conn:
+            self._conn.executemany(_UPSERT, rows)
+        print(f"已从复习日志迁移 {len(rows)} 条复习记录")
+
+    def mark(self, name, field, when, dict_id=''):
+        # 界面线程调用：更新内存数据并排队写库（when 为秒级时间戳），返回行号
+        with self._lock:
+            row = self.data.mark(name, field, when)
+        known = 1 if field == 'known' else 0
+        self._queue.put((name, dict_id or '', known, 1 - known, to_iso(when)))
+        return row
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            batch = []
+            stop = item is _STOP
+            if not stop:
+                batch.append(item)
+            # 把已经积压的标记一起取出，合并到同一个事务
+            while not stop and len(batch) < MAX_BATCH:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+            if batch:
+                try:
+                    with self._conn:
+                        self._conn.executemany(_UPSERT, batch)
+                    self.batches += 1
+                except sqlite3.Error as e:
+                    print(f"复习记录写入失败: {e}")
+            for _ in range(len(batch) + (1 if stop else 0)):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def flush(self):
+        # 等待队列中的标记全部写入
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self):
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        for conn in (self._conn, self._reader):
+            if conn is not None:
+                conn.close()
+        self._conn = self._reader = None
+
+    # ---- 统计查询 ----
+
+    def _query(self, sql, params=()):
+        # 只读连接在 WAL 下读到已提交的数据，不等待写线程（最多差一个尚未提交的批次，通常是几毫秒内的标记）
+        with self._reader_lock:
+            return self._reader.execute(sql, params).fetchall()
+
+    def counts_by_dict(self):
+        # 返回 {dict_id: {'words', 'known', 'forgot'}}
+        return {d: {'words': n, 'known': k, 'forgot': f} for d, n, k, f in self._query(
+            'SELECT dict_id, COUNT(*), SUM(known), SUM(forgot) FROM reviews GROUP BY dict_id')}
+
+    def dict_counts(self, dict_id):
+        # dict_id 传 LEGACY_DICT_ID 时返回迁移来的、不区分词典的旧记录
+        row = self._query('SELECT COUNT(*), COALESCE(SUM(known), 0), COALESCE(SUM(forgot), 0) '
+                          'FROM reviews WHERE dict_id = ?', (dict_id,))[0]
+        return {'words': row[0], 'known': row[1], 'forgot': row[2]}
+
+    def recently_forgotten(self, limit=20, dict_id=None):
+        # 忘记次数多于熟记次数的单词，最近复习的在前（走 reviews_forgotten 部分索引）
+        if dict_id is None:
+            rows = self._query('SELECT word, dict_id, known, forgot, last FROM reviews '
+                               'WHERE forgot > known ORDER BY last DESC LIMIT ?', (limit,))
+        else:
+            rows = self._query('SELECT word, dict_id, known, forgot, last FROM reviews '
+                               'WHERE forgot > known AND dict_id = ? ORDER BY last DESC LIMIT ?', (dict_id, limit))
+        return [{'word': w, 'dict_id': d, 'known': k, 'forgot': f, 'last': t} for w, d, k, f, t in rows]
+
+
+if __name__ == '__main__':
+    # 基准: python review_store.py [标记次数]，测量界面线程上的单次标记耗时与写线程的批次数
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteReviewStore(os.path.join(tmp, 'review.db'))
+        store.load()
+        t0 = time.perf_counter()
+        for i in range(n):
+            store.mark(f'word{i % 5000}', 'forgot' if i % 3 else 'known', 1767225600 + i, f'dict{i % 7}')
+        mark_us = (time.perf_counter() - t0) / n * 1e6
+        t0 = time.perf_counter()
+        store.flush()
+        drain_ms = (time.perf_counter() - t0) * 1000
+        t0 = time.perf_counter()
+        counts = store.counts_by_dict()
+        recent = store.recently_forgotten(10)
+        query_ms = (time.perf_counter() - t0) * 1000
+        print(f'{n} 次标记：界面线程 {mark_us:.1f} µs/次，写线程 {store.batches} 个事务，剩余写入 {drain_ms:.1f} ms')
+        print(f'统计查询 {query_ms:.2f} ms：{len(counts)} 个词典，最近忘记 {[r["word"] for r in recent[:5]]}')
+        store.close()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# 上次会话快照：保存当前词典中 current_index 附近的几个词条，
+# 启动时窗口先用它显示上次的单词，完整词典在后台线程加载完成后再替换
+import os
+import tempfile
+
+from atomic_file import atomic_write_json, read_json
+from word_list import Word, render_word
+
+SESSION_FILE_PATH = os.path.join(tempfile.gettempdir(), 'study_desk_session.json')
+SESSION_NEIGHBOURS = 5
+
+LOADING_WORD = Word('', ('加载中…',), '', '')
+
+
+class SessionWordList:
+    """长度与完整词典一致，快照范围内的下标返回真实词条，其余返回“加载中”占位。"""
+
+    def __init__(self, base, words, length):
+        self.base = base
+        self.words = [Word.from_dict(w) for w in words]
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('词条下标越界')
+        offset = index - self.base
+        if 0 <= offset < len(self.words):
+            return self.words[offset]
+        return LOADING_WORD
+
+    def __iter__(self):
+        for i in range(self.length):
+            yield self[i]
+
+    def display(self, index):
+        word = self[index]
+        if word is LOADING_WORD:
+            return '', '', '加载中…'
+        return render_word(word)
+
+
+def save_session(dict_url, words, index, path=SESSION_FILE_PATH):
+    if not dict_url or not words:
+        return
+    try:
+        length = len(words)
+        base = max(0, index - SESSION_NEIGHBOURS)
+        end = min(length, index + SESSION_NEIGHBOURS + 1)
+        data = {
+            'dict': dict_url,
+            'index': index,
+            'length': length,
+            'base': base,
+            'words': [words[i].to_dict() for i in range(base, end)],
+        }
+        atomic_write_json(path, data, backup=False, fsync=False, separators=(',', ':'))
+    except Exception as e:
+        print(f"会话快照保存失败: {e}")
+
+
+def load_session(dict_url, index, path=SESSION_FILE_PATH):
+    # 只有词典与下标都和配置一致时才使用快照，否则返回 None
+    if not os.path.exists(path):
+        return None
+    try:
+        data = read_json(path, use_backup=False)
+        if not isinstance(data, dict) or data.get('dict') != dict_url or data.get('index') != index:
+            return None
+        return SessionWordList(data['base'], data['words'], data['length'])
+    except Exception as e:
+        print(f"会话快照读取失败: {e}")
+        return None
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# 学习筛选视图：在当前词典上按复习记录划分 未标记 / 忘记 / 熟记 三组。
+# 每个视图是一个与词典等长的 bytearray 成员标记（1 字节/词条，不复制词条），
+# 翻页用 bytearray.find / rfind 在 C 层查找下一个成员；标记单词时只翻转对应字节，O(1) 更新。
+import random
+
+VIEW_ALL = 'all'
+VIEW_UNMARKED = 'unmarked'
+VIEW_FORGOTTEN = 'forgotten'
+VIEW_KNOWN = 'known'
+
+VIEW_LABELS = {
+    VIEW_ALL: '全部',
+    VIEW_UNMARKED: '未标记',
+    VIEW_FORGOTTEN: '忘记多于熟记',
+    VIEW_KNOWN: '熟记',
+}
+
+_ONE = b'\x01'
+
+
+def classify(counts):
+    # counts 为 review_data.counts(name) 返回的 (known, forgot)，未复习过为 None
+    if counts is None:
+        return VIEW_UNMARKED
+    known, forgot = counts
+    if forgot > known:
+        return VIEW_FORGOTTEN
+    return VIEW_KNOWN
+
+
+class StudyViews:
+    def __init__(self, words, review_data):
+        n = len(words)
+        self._members = {v: bytearray(n) for v in (VIEW_UNMARKED, VIEW_FORGOTTEN, VIEW_KNOWN)}
+        self._counts = dict.fromkeys(self._members, 0)
+        self._view_of = bytearray(n)   # 每个词条当前所属视图的编号
+        self._codes = list(self._members)
+        self._positions = {}           # name -> 下标（重名时为下标列表）
+        for i in range(n):
+            name = words[i].name
+            existing = self._positions.get(name)
+            if existing is None:
+                self._positions[name] = i
+            elif isinstance(existing, list):
+                existing.append(i)
+            else:
+                self._positions[name] = [existing, i]
+            view = classify(review_data.counts(name))
+            self._members[view][i] = 1
+            self._counts[view] += 1
+            self._view_of[i] = self._codes.index(view)
+
+    def count(self, view):
+        return self._counts.get(view, 0)
+
+    def contains(self, view, index):
+        members = self._members.get(view)
+        return members is None or (0 <= index < len(members) and members[index] == 1)
+
+    def update(self, name, counts):
+        # 复习记录变化后把 name 对应的词条移到新的视图，O(1)（重名时为 O(重名数)）
+        positions = self._positions.get(name)
+        if positions is None:
+            return
+        new_view = classify(counts)
+        code = self._codes.index(new_view)
+        for i in positions if isinstance(positions, list) else (positions,):
+            old_code = self._view_of[i]
+            if old_code == code:
+                continue
+            old_view = self._codes[old_code]
+            self._members[old_view][i] = 0
+            self._counts[old_view] -= 1
+            self._members[new_view][i] = 1
+            self._counts[new_view] += 1
+            self._view_of[i] = code
+
+    def next_index(self, view, index, inclusive=False):
+        members = self._members[view]
+        if not self._counts[view]:
+            return None
+        found = members.find(_ONE, index if inclusive else index + 1)
+        return found if found >= 0 else members.find(_ONE)
+
+    def prev_index(self, view, index):
+        members = self._members[view]
+        if not self._counts[view]:
+            return None
+        found = members.rfind(_ONE, 0, max(0, index))
+        return found if found >= 0 else members.rfind(_ONE)
+
+    def random_index(self, view, exclude=None):
+        members = self._members[view]
+        total = self._counts[view]
+        if not total:
+            return None
+        # 成员较多时随机探测即可命中；较稀疏时按第 k 个成员定位
+        for _ in range(32):
+            i = random.randrange(len(members))
+            if members[i] and (i != exclude or total == 1):
+                return i
+        k = random.randrange(total)
+        i = members.find(_ONE)
+        for _ in range(k):
+            i = members.find(_ONE, i + 1)
+        if i == exclude and total > 1:
+            return self.next_index(view, i)
+        return i
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# 原子写入、校验与 .bak 恢复：python -m pytest test_atomic_file.py
+import json
+import os
+
+from atomic_file import (atomic_write, atomic_write_json, atomic_write_marshal, backup_path_for, read_json,
+                         read_marshal, sum_path_for)
+
+
+def _write_twice(path, write):
+    write(path, {'version': 1})
+    write(path, {'version': 2})
+
+
+def _age(path, seconds=10):
+    # 把文件时间往前调，避免依赖文件系统的时间精度
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns - seconds * 10 ** 9, st.st_mtime_ns - seconds * 10 ** 9))
+
+
+def test_json_stays_plain_json(tmp_path):
+    path = str(tmp_path / 'config.json')
+    _write_twice(path, atomic_write_json)
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == {'version': 2}
+    with open(backup_path_for(path), encoding='utf-8') as f:
+        assert json.load(f) == {'version': 1}
+    assert os.path.exists(sum_path_for(path))
+    assert read_json(path) == {'version': 2}
+
+
+def test_truncated_json_restores_backup(tmp_path):
+    path = str(tmp_path / 'config.json')
+    _write_twice(path, atomic_write_json)
+    with open(path, 'r+b') as f:
+        f.truncate(5)
+    _age(path)
+    assert read_json(path) == {'version': 1}
+
+
+def test_checksum_mismatch_restores_backup(tmp_path):
+    # 内容被改坏但仍能解析，且不比校验和新（不是外部编辑）
+    path = str(tmp_path / 'config.json')
+    _write_twice(path, atomic_write_json)
+    with open(path, 'r+b') as f:
+        f.write(b'{"version": 7}')
+    _age(path)
+    assert read_json(path) == {'version': 1}
+
+
+def test_external_edit_is_kept(tmp_path):
+    path = str(tmp_path / 'config.json')
+    _write_twice(path, atomic_write_json)
+    _age(sum_path_for(path))
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'version': 3}, f)
+    assert read_json(path) == {'version': 3}
+
+
+def test_missing_file_is_not_restored(tmp_path):
+    path = str(tmp_path / 'config.json')
+    _write_twice(path, atomic_write_json)
+    os.remove(path)
+    assert read_json(path, {}) == {}
+    assert not os.path.exists(path)
+
+
+def test_file_without_checksum_is_accepted(tmp_path):
+    path = str(tmp_path / 'config.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'version': 0}, f)
+    assert read_json(path) == {'version': 0}
+
+
+def test_trailer_json_from_previous_version(tmp_path):
+    path = str(tmp_path / 'config.json')
+    atomic_write(path, json.dumps({'version': 5}))
+    assert read_json(path) == {'version': 5}
+
+
+def test_marshal_trailer_mismatch_restores_backup(tmp_path):
+    path = str(tmp_path / 'data.idx')
+    for version in (1, 2):
+        atomic_write_marshal(path, {'version': version}, backup=True)
+    with open(path, 'r+b') as f:
+        raw = bytearray(f.read())
+        raw[-44] ^= 0x01    # 改动校验行之前的最后一个字节
+        f.seek(0)
+        f.write(raw)
+    assert read_marshal(path, use_backup=True) == {'version': 1}
+
+
+def test_truncated_marshal_without_backup(tmp_path):
+    path = str(tmp_path / 'data.idx')
+    atomic_write_marshal(path, {'names': ['a'] * 100})
+    with open(path, 'r+b') as f:
+        f.truncate(20)
+    assert read_marshal(path) is None
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+# .sdd 编译词典的编码与读取：python -m pytest test_compiled_dict.py
+import json
+
+import pytest
+
+from compiled_dict import compile_json_dict, decode_record, encode_record, open_compiled_dict
+
+WORDS = [
+    {'name': 'plain', 'trans': ['普通', '词条'], 'usphone': 'plen', 'ukphone': 'pleɪn'},
+    {'name': 'field\x1fsep', 'trans': ['含\x1f字段分隔符'], 'usphone': 'a\x1fb', 'ukphone': 'ok'},
+    {'name': 'trans\x1esep', 'trans': ['含\x1e释义分隔符', '第二条'], 'usphone': 'x', 'ukphone': 'y\x1e'},
+    {'name': 'nul\x00', 'trans': ['\x00'], 'usphone': '\x00', 'ukphone': ''},
+    {'name': 'empty trans', 'trans': [''], 'usphone': '', 'ukphone': ''},
+    {'name': 'no trans', 'usphone': 'u', 'ukphone': 'k', 'sentence': 'extra\x1ffield'},
+    {'name': 'all', 'trans': ['\x1f\x1e\x00', ''], 'usphone': '\x1e', 'ukphone': '\x1f', 'tag': 1},
+]
+
+
+@pytest.mark.parametrize('word', WORDS, ids=lambda w: repr(w['name']))
+def test_record_round_trip(word):
+    assert decode_record(encode_record(word)) == word
+
+
+def test_compiled_dict_round_trip(tmp_path):
+    json_path = tmp_path / 'dict.json'
+    json_path.write_text(json.dumps(WORDS, ensure_ascii=False), encoding='utf-8')
+    assert compile_json_dict(str(json_path)) == len(WORDS)
+    with open_compiled_dict(str(json_path)) as compiled:
+        assert len(compiled) == len(WORDS)
+        assert list(compiled) == WORDS
+        assert compiled[-1] == WORDS[-1]
+    assert compiled._mm.closed
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+# 词典包的读取：python -m pytest test_dict_pack.py
+import pytest
+
+from dict_pack import CODEC_LZMA, CODEC_ZLIB, DictPack, write_pack
+
+WORDS = [{'name': f'word{i}', 'trans': [f'释义{i}'], 'usphone': 'u', 'ukphone': 'k'} for i in range(10)]
+
+
+@pytest.fixture(params=[CODEC_ZLIB, CODEC_LZMA])
+def view(tmp_path, request):
+    path = str(tmp_path / 'dicts.pack')
+    # 4 个词条一块，最后一块只有 2 个词条
+    write_pack([('./dicts/a.json', WORDS), ('./dicts/empty.json', [])], path, block_size=4, codec=request.param)
+    return DictPack(path).open_dict('./dicts/a.json')
+
+
+def test_index_and_iteration(view):
+    assert len(view) == 10
+    assert view[0] == WORDS[0]
+    assert view[9] == WORDS[9]
+    assert list(view) == WORDS
+    assert view[2:6] == WORDS[2:6]
+
+
+def test_negative_index(view):
+    assert view[-1] == WORDS[-1]
+    assert view[-10] == WORDS[0]
+
+
+@pytest.mark.parametrize('index', [10, 11, 12, -11])
+def test_out_of_range_raises(view, index):
+    with pytest.raises(IndexError):
+        view[index]
+
+
+def test_empty_dict(tmp_path):
+    path = str(tmp_path / 'dicts.pack')
+    write_pack([('./dicts/empty.json', [])], path)
+    view = DictPack(path).open_dict('./dicts/empty.json')
+    assert len(view) == 0 and list(view) == []
+    with pytest.raises(IndexError):
+        view[0]
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# dict_snapshot 的失效判断：python -m unittest test_dict_snapshot
+import os
+import shutil
+import tempfile
+import unittest
+
+from atomic_file import read_marshal
+from dict_snapshot import load_snapshot, save_snapshot, snapshot_path_for
+
+BUF = b'apple\x1fUS\x1fUK\x1f\xe8\x8b\xb9\xe6\x9e\x9c'
+OFFSETS = b'\x00\x00\x00\x00\x14\x00\x00\x00'
+
+
+class SnapshotInvalidationTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.snapshot_dir = os.path.join(self.tmp, 'snapshots')
+        self.source = os.path.join(self.tmp, 'dict.json')
+        self._write_source('[{"name": "apple"}]')
+        self.assertTrue(save_snapshot(self.source, BUF, OFFSETS, key='dict.json', snapshot_dir=self.snapshot_dir))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _write_source(self, text, mtime_ns=None):
+        with open(self.source, 'w', encoding='utf-8') as f:
+            f.write(text)
+        if mtime_ns is not None:
+            os.utime(self.source, ns=(mtime_ns, mtime_ns))
+
+    def _load(self):
+        return load_snapshot(self.source, key='dict.json', snapshot_dir=self.snapshot_dir)
+
+    def _shift_mtime(self):
+        # 显式设置一个不同的 mtime，避免依赖文件系统的时间精度
+        return os.stat(self.source).st_mtime_ns + 5 * 10 ** 9
+
+    def test_unchanged_source_uses_snapshot(self):
+        self.assertEqual(self._load(), (BUF, OFFSETS))
+
+    def test_edited_content_invalidates(self):
+        self._write_source('[{"name": "apple"}, {"name": "banana"}]', self._shift_mtime())
+        self.assertIsNone(self._load())
+
+    def test_touch_only_keeps_snapshot_and_records_new_mtime(self):
+        mtime_ns = self._shift_mtime()
+        os.utime(self.source, ns=(mtime_ns, mtime_ns))
+        self.assertEqual(self._load(), (BUF, OFFSETS))
+        data = read_marshal(snapshot_path_for('dict.json', self.snapshot_dir))
+        self.assertEqual(data['mtime_ns'], mtime_ns)
+
+    def test_same_size_rewrite_invalidates(self):
+        self._write_source('[{"name": "apply"}]', self._shift_mtime())
+        self.assertEqual(os.path.getsize(self.source), len('[{"name": "apple"}]'))
+        self.assertIsNone(self._load())
+
+    def test_deleted_source_invalidates(self):
+        os.remove(self.source)
+        self.assertIsNone(self._load())
+
+
+if __name__ == '__main__':
+    unittest.main()
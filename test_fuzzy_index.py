@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# 拼写纠错索引与逐个计算编辑距离的结果对比：python -m pytest test_fuzzy_index.py
+import json
+import os
+import random
+
+import pytest
+
+from fuzzy_index import NameIndex, levenshtein
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _brute_force(names, query, max_distance):
+    names = sorted(set(names), key=lambda n: (len(n), n))
+    found = [(levenshtein(query, name), i) for i, name in enumerate(names)]
+    return sorted((d, i) for d, i in found if d <= max_distance)
+
+
+def _dict_names():
+    names = []
+    for file_name in ('CET4_T.json', 'CET6_T.json'):
+        with open(os.path.join(BASE_DIR, file_name), encoding='utf-8') as f:
+            names += [w['name'].strip().lower() for w in json.load(f) if w.get('name')]
+    return names
+
+
+def _typos(names, rng, count):
+    # 对随机单词做 0~3 次随机编辑，另加一些很短的查询
+    alphabet = 'abcdefghijklmnopqrstuvwxyz'
+    queries = ['a', 'ab', 'x', 'the', 'qz']
+    for _ in range(count):
+        word = list(rng.choice(names))
+        for _ in range(rng.randint(0, 3)):
+            pos = rng.randint(0, len(word))
+            op = rng.choice('ids')
+            if op == 'i':
+                word.insert(pos, rng.choice(alphabet))
+            elif word and pos < len(word):
+                if op == 'd':
+                    del word[pos]
+                else:
+                    word[pos] = rng.choice(alphabet)
+        if word:
+            queries.append(''.join(word))
+    return queries
+
+
+@pytest.mark.parametrize('max_distance', [1, 2])
+def test_matches_brute_force_on_bundled_dicts(max_distance):
+    names = _dict_names()
+    index = NameIndex.build(names, max_distance=max_distance)
+    for query in _typos(names, random.Random(max_distance), 40):
+        assert index.search(query, max_distance) == _brute_force(names, query, max_distance), query
+
+
+def test_repeated_letters_query():
+    names = ['aaaaaaa', 'aaaa', 'banana', 'aaaaaaaaaa']
+    index = NameIndex.build(names)
+    hits = [(d, index.names[i]) for d, i in index.search('aaaaaa')]
+    assert hits == [(1, 'aaaaaaa'), (2, 'aaaa')]
+    assert index.search('aaaaaa') == _brute_force(names, 'aaaaaa', 2)
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+# 流式解析：python -m pytest test_json_stream.py
+import io
+import json
+
+import pytest
+
+from json_stream import StreamingRecords, iter_json_array
+from word_list import WordList
+
+
+def _write_dict(tmp_path, count):
+    path = tmp_path / 'dict.json'
+    words = [{'name': f'word{i}', 'trans': [f'释义{i}'], 'usphone': 'wɝd', 'ukphone': 'wɜːd'} for i in range(count)]
+    path.write_text(json.dumps(words, ensure_ascii=False), encoding='utf-8')
+    return str(path), words
+
+
+@pytest.mark.parametrize('text', [
+    '[1, 2.5, 3]',
+    '[1,2.5,-3e10,"ab",true,null,{"a":[1,2]},12345678]',
+    '[ 1 , 22 ]',
+    '[1.5]',
+    '["a\\"]b", [1, [2]], 1e5, "中文"]',
+    '[]',
+])
+def test_values_split_at_every_chunk_boundary(text):
+    for chunk_size in range(1, len(text) + 1):
+        assert list(iter_json_array(io.StringIO(text), chunk_size)) == json.loads(text), chunk_size
+
+
+def test_truncated_array_raises():
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO('[{"name": "a"}, {"na'), 4))
+
+
+def test_index_past_parsed_waits_for_record(tmp_path):
+    path, words = _write_dict(tmp_path, 500)
+    records = StreamingRecords(path, length_hint=500, first_batch=2)
+    word_list = WordList(records)
+    assert word_list[499].name == 'word499'
+    records.wait()
+    assert len(word_list) == 500
+    with pytest.raises(IndexError):
+        word_list[500]
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# 分页模式的大词表：python -m pytest test_paged_list.py
+import json
+
+import pytest
+
+from paged_list import JsonIndexedRecords, PagedWordList, scan_json_array_offsets
+from word_list import Word
+
+WORDS = [{'name': f'w{i}', 'trans': [f'释义 {i}', '含 ] } , " 的字符串'], 'usphone': 'u', 'ukphone': 'k'}
+         for i in range(1000)]
+
+
+@pytest.fixture
+def json_path(tmp_path):
+    path = tmp_path / 'big.json'
+    path.write_text(json.dumps(WORDS, ensure_ascii=False, indent=1), encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('text', ['[]', '[ ]', '[{"a": 1}]', '[{"a": "]"}, {"b": [1, {"c": "\\\\\\""}]}]', '[1, "x", [2]]'])
+def test_scan_offsets(text):
+    buf = text.encode('utf-8')
+    starts, ends = scan_json_array_offsets(buf)
+    assert [json.loads(buf[s:e]) for s, e in zip(starts, ends)] == json.loads(text)
+
+
+def test_indexed_records_reuse_persisted_offsets(json_path, tmp_path):
+    snapshot_dir = str(tmp_path / 'snapshots')
+    first = JsonIndexedRecords(json_path, snapshot_dir)
+    second = JsonIndexedRecords(json_path, snapshot_dir)
+    assert len(first) == len(second) == len(WORDS)
+    assert second[0] == WORDS[0] and second[999] == WORDS[999]
+
+
+def test_only_window_pages_stay_decoded(json_path, tmp_path):
+    words = PagedWordList(JsonIndexedRecords(json_path, str(tmp_path)), window=64, page_size=32)
+    for i in range(0, 1000, 7):
+        assert words.display(i)[0] == f'w{i}'
+        lo, hi = words._window_pages(i)
+        assert all(lo <= p <= hi for p in words._pages)
+        assert words.decoded_count <= (64 * 2 // 32 + 2) * 32
+    assert words.page_evictions > 0
+
+
+def test_access_outside_window_is_not_cached(json_path, tmp_path):
+    words = PagedWordList(JsonIndexedRecords(json_path, str(tmp_path)), window=64, page_size=32)
+    words.display(0)
+    cached = set(words._pages)
+    assert words[900] == Word.from_dict(WORDS[900])
+    assert words[-1] == Word.from_dict(WORDS[-1])
+    assert [w.name for w in words] == [w['name'] for w in WORDS]
+    assert set(words._pages) == cached
+    with pytest.raises(IndexError):
+        words[1000]
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+# 音标规范化与查询：python -m pytest test_phonetic_index.py
+from phonetic_index import PhoneticIndex, normalize_ipa
+
+# (usphone KK, ukphone IPA)
+PAIRS = [
+    ("rɪ'mot", "rɪ'məʊt"),    # remote
+    ('sek', 'seɪk'),           # sake
+    ("'kɛtl", "'ketl"),        # kettle
+    ('hɑt', 'hɒt'),            # hot
+    ('bɔɪ', 'bɔɪ'),            # boy
+    ('lɔ', 'lɔː'),             # law
+]
+
+
+def test_kk_bare_vowels_are_diphthongs():
+    assert normalize_ipa("rɪ'mot", kk=True) == normalize_ipa("rɪ'məʊt")
+    assert normalize_ipa('sek', kk=True) == normalize_ipa('seɪk')
+    assert normalize_ipa("'kɛtl", kk=True) == normalize_ipa("'ketl")
+
+
+def test_ipa_bare_o_is_open_o():
+    assert normalize_ipa('lo') == normalize_ipa('lɔ')
+    assert normalize_ipa('lo', kk=True) == normalize_ipa('ləʊ')
+
+
+def test_search_uses_kk_for_usphone():
+    index = PhoneticIndex.build(PAIRS)
+    assert index.search('/oʊ/') == [0]
+    assert index.search('/ɔ/') == [5]
+    assert index.search('/ɔɪ/') == [4]
+    assert index.search('/eɪ/') == [1]
+    assert index.search('/e/') == [2]
+    assert index.search('/*ɔ/') == [5]
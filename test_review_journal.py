@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# 复习记录追加日志：python -m pytest test_review_journal.py
+import json
+import os
+
+from review_columns import ReviewColumns, to_epoch
+from review_journal import ReviewJournal
+
+
+def _journal(tmp_path, **kwargs):
+    return ReviewJournal(str(tmp_path / 'review.cols'), legacy_path=str(tmp_path / 'review.json'), **kwargs)
+
+
+def test_marks_survive_restart(tmp_path):
+    journal = _journal(tmp_path)
+    journal.load()
+    journal.mark('apple', 'known', 100)
+    journal.mark('apple', 'forgot', 200)
+    journal.mark('pear', 'forgot', 300)
+    journal.flush()
+    # 不调用 close，模拟进程被杀：只剩日志
+    data = _journal(tmp_path).load()
+    assert data.counts('apple') == (1, 1)
+    assert data.counts('pear') == (0, 1)
+    assert data.last[data.row('apple')] == 200
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    journal = _journal(tmp_path)
+    journal.load()
+    journal.mark('apple', 'known', 100)
+    journal.flush()
+    with open(journal.journal_path, 'a', encoding='utf-8') as f:
+        f.write('["pear", 1, 0')
+    assert _journal(tmp_path).load().counts('pear') is None
+
+
+def test_compaction_writes_snapshot_and_empties_journal(tmp_path):
+    journal = _journal(tmp_path, compact_every=10)
+    journal.load()
+    for i in range(25):
+        journal.mark(f'w{i % 5}', 'known', i)
+    journal.close()
+    assert os.path.getsize(journal.journal_path) == 0
+    assert not os.path.exists(journal.journal_path + '.old')
+    snapshot = ReviewColumns.load(journal.snapshot_path)
+    assert snapshot.totals() == (5, 25, 0)
+    assert _journal(tmp_path).load().totals() == (5, 25, 0)
+
+
+def test_interrupted_compaction_does_not_double_count(tmp_path):
+    journal = _journal(tmp_path)
+    journal.load()
+    journal.mark('apple', 'known', 1)
+    journal.compact()
+    journal.mark('apple', 'known', 2)
+    journal.close()
+    # 重放的是状态而不是增量：.old 里的行即使已经写进快照，再回放一次结果也不变
+    with open(journal.journal_path + '.old', 'w', encoding='utf-8') as f:
+        f.write(json.dumps(['apple', 2, 0, 2]) + '\n')
+    data = _journal(tmp_path).load()
+    assert data.counts('apple') == (2, 0)
+
+
+def test_migrates_legacy_json(tmp_path):
+    with open(tmp_path / 'review.json', 'w', encoding='utf-8') as f:
+        json.dump({'apple': {'known': 3, 'forgot': 1, 'last': '2026-01-01T00:00:00'}}, f)
+    journal = _journal(tmp_path)
+    data = journal.load()
+    assert data.counts('apple') == (3, 1)
+    assert data.last[data.row('apple')] == to_epoch('2026-01-01T00:00:00')
+    journal.close()
+    assert os.path.exists(journal.snapshot_path)
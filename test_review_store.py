@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+# SQLite 复习存储：python -m pytest test_review_store.py
+import pytest
+
+from review_journal import ReviewJournal
+from review_store import LEGACY_DICT_ID, SQLiteReviewStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteReviewStore(str(tmp_path / 'review.db'))
+    store.load()
+    yield store
+    store.close()
+
+
+def test_marks_are_counted_per_dict(store):
+    for i in range(300):
+        store.mark(f'w{i % 30}', 'forgot' if i % 3 else 'known', 1000 + i, f'dict{i % 2}')
+    store.flush()
+    counts = store.counts_by_dict()
+    assert counts['dict0']['known'] + counts['dict0']['forgot'] == 150
+    assert sum(c['words'] for c in counts.values()) == 30
+    # 内存中的汇总跨词典合并
+    assert store.data.totals() == (30, 100, 200)
+
+
+def test_recently_forgotten_orders_by_last(store):
+    store.mark('old', 'forgot', 100, 'a')
+    store.mark('new', 'forgot', 200, 'a')
+    store.mark('known', 'known', 300, 'a')
+    store.mark('other', 'forgot', 400, 'b')
+    store.flush()
+    assert [r['word'] for r in store.recently_forgotten(10, 'a')] == ['new', 'old']
+    assert [r['word'] for r in store.recently_forgotten(10)] == ['other', 'new', 'old']
+
+
+def test_reload_sums_across_dicts(tmp_path):
+    path = str(tmp_path / 'review.db')
+    store = SQLiteReviewStore(path)
+    store.load()
+    store.mark('apple', 'known', 1, 'a')
+    store.mark('apple', 'forgot', 2, 'b')
+    store.close()
+    reopened = SQLiteReviewStore(path)
+    data = reopened.load()
+    assert data.counts('apple') == (1, 1)
+    assert data.last[data.row('apple')] == 2
+    reopened.close()
+
+
+def test_migrates_journal_as_legacy_records(tmp_path):
+    journal = ReviewJournal(str(tmp_path / 'review.cols'))
+    journal.load()
+    journal.mark('apple', 'forgot', 5)
+    journal.close()
+    store = SQLiteReviewStore(str(tmp_path / 'review.db'), legacy_path=journal.snapshot_path)
+    data = store.load()
+    assert data.counts('apple') == (0, 1)
+    assert store.dict_counts(LEGACY_DICT_ID) == {'words': 1, 'known': 0, 'forgot': 1}
+    assert store.dict_counts('./dicts/CET4_T.json')['words'] == 0
+    store.close()
+
+
+def test_failed_load_can_be_closed(tmp_path):
+    # 数据库打不开时 main.load_review_data 关闭它并改用日志存储
+    store = SQLiteReviewStore(str(tmp_path))
+    with pytest.raises(Exception):
+        store.load()
+    store.close()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# 学习筛选视图：python -m pytest test_study_views.py
+from review_columns import ReviewColumns
+from study_views import VIEW_FORGOTTEN, VIEW_KNOWN, VIEW_UNMARKED, StudyViews
+from word_list import WordList
+
+NAMES = ['a', 'b', 'c', 'd', 'e', 'b']   # 'b' 重名
+
+
+def _views():
+    review = ReviewColumns()
+    review.set('a', 2, 0, 1)    # 熟记
+    review.set('b', 0, 3, 2)    # 忘记（两处）
+    review.set('d', 1, 1, 3)    # 次数相同算熟记
+    words = WordList.from_json_words([{'name': n} for n in NAMES])
+    return StudyViews(words, review), review
+
+
+def _members(views, view):
+    return [i for i in range(len(NAMES)) if views.contains(view, i)]
+
+
+def test_initial_classification():
+    views, _ = _views()
+    assert _members(views, VIEW_KNOWN) == [0, 3]
+    assert _members(views, VIEW_FORGOTTEN) == [1, 5]
+    assert _members(views, VIEW_UNMARKED) == [2, 4]
+    assert views.count(VIEW_FORGOTTEN) == 2
+
+
+def test_navigation_wraps():
+    views, _ = _views()
+    assert views.next_index(VIEW_UNMARKED, 2) == 4
+    assert views.next_index(VIEW_UNMARKED, 4) == 2
+    assert views.next_index(VIEW_UNMARKED, 2, inclusive=True) == 2
+    assert views.prev_index(VIEW_FORGOTTEN, 1) == 5
+    assert views.prev_index(VIEW_FORGOTTEN, 5) == 1
+
+
+def test_update_moves_every_duplicate():
+    views, review = _views()
+    review.mark('b', 'known', 4)
+    review.mark('b', 'known', 5)
+    review.mark('b', 'known', 6)
+    review.mark('b', 'known', 7)
+    views.update('b', review.counts('b'))
+    assert _members(views, VIEW_FORGOTTEN) == []
+    assert _members(views, VIEW_KNOWN) == [0, 1, 3, 5]
+    assert views.next_index(VIEW_FORGOTTEN, 0) is None
+    assert views.random_index(VIEW_FORGOTTEN) is None
+
+
+def test_random_index_respects_exclude():
+    views, _ = _views()
+    for _ in range(50):
+        assert views.random_index(VIEW_UNMARKED, exclude=2) == 4
+    views.update('c', (1, 0))
+    assert views.random_index(VIEW_UNMARKED, exclude=4) == 4
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+# 中文释义反查：python -m pytest test_trans_index.py
+import json
+import os
+
+import pytest
+
+from trans_index import TransIndex, index_path_for, load_trans_index
+from word_list import WordList
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(BASE_DIR, 'CET4_T.json')
+
+
+@pytest.fixture(scope='module')
+def words():
+    with open(SOURCE, encoding='utf-8') as f:
+        return WordList.from_json_words(json.load(f))
+
+
+@pytest.mark.parametrize('query', ['放弃', '学习', '能力', '经济', '水'])
+def test_finds_every_entry_containing_query(words, query):
+    index = TransIndex(words)
+    found = set(index.search(query, limit=len(words)))
+    expected = {i for i in range(len(words)) if query in '；'.join(words[i].trans)}
+    assert expected <= found
+
+
+def test_exact_gloss_ranks_first():
+    words = WordList.from_json_words([
+        {'name': 'abandonment', 'trans': ['n. 放弃；遗弃']},
+        {'name': 'give', 'trans': ['v. 给；放弃了某些东西']},
+        {'name': 'abandon', 'trans': ['vt. 放弃']},
+    ])
+    assert TransIndex(words).search('放弃') == [2, 0, 1]
+
+
+def test_persisted_index_is_reused_and_invalidated(words, tmp_path):
+    snapshot_dir = str(tmp_path)
+    source = tmp_path / 'dict.json'
+    source.write_bytes(open(SOURCE, 'rb').read())
+    built = load_trans_index('dict.json', str(source), words, snapshot_dir)
+    assert os.path.exists(index_path_for('dict.json', snapshot_dir))
+    loaded = load_trans_index('dict.json', str(source), words, snapshot_dir)
+    # 从快照读取的倒排表在查询时才展开
+    assert all(isinstance(v, bytes) for v in loaded._postings.values())
+    assert loaded.search('放弃') == built.search('放弃')
+    st = os.stat(source)
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    rebuilt = load_trans_index('dict.json', str(source), words, snapshot_dir)
+    assert not any(isinstance(v, bytes) for v in rebuilt._postings.values())
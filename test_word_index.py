@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+# 单词名前缀/子串索引与逐个比较的结果对比：python -m pytest test_word_index.py
+import json
+import os
+
+import pytest
+
+from word_index import PrefixIndex
+from word_list import WordList
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture(scope='module')
+def words():
+    with open(os.path.join(BASE_DIR, 'CET4_T.json'), encoding='utf-8') as f:
+        return WordList.from_json_words(json.load(f) + [{'name': 'Apple'}, {'name': 'apple'}])
+
+
+@pytest.fixture(scope='module')
+def index(words):
+    return PrefixIndex(words)
+
+
+QUERIES = ['a', 'ab', 'con', 'tion', 'ing', 'x', 'APP', ' the ', 'zzz', 'q']
+
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_prefix_matches_brute_force(words, index, query):
+    names = [w.name.lower() for w in words]
+    key = query.strip().lower()
+    expected = sorted((i for i, n in enumerate(names) if n.startswith(key)), key=lambda i: (names[i], i))
+    assert index.find_prefix(query, limit=50) == expected[:50]
+
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_substring_matches_brute_force(words, index, query):
+    names = [w.name.lower() for w in words]
+    key = query.strip().lower()
+    assert index.find_substring(query, limit=50) == [i for i, n in enumerate(names) if key in n][:50]
+
+
+def test_lookup_puts_prefix_first_without_duplicates(index):
+    matches = index.lookup('able', limit=30)
+    assert len(matches) == len(set(matches))
+    assert matches[:len(index.find_prefix('able', 30))] == index.find_prefix('able', 30)
+
+
+def test_exact_returns_first_in_dict_order(words, index):
+    assert words[index.exact('APPLE')].name == 'Apple'
+    assert index.exact('no-such-word') is None
+    assert index.find_substring('a\nb') == []
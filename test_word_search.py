@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+# 全词典搜索索引：python -m pytest test_word_search.py
+from word_search import WordSearch
+
+
+def _insert(store, name, trans, url='./dicts/a.json', idx=0):
+    store._conn.execute('INSERT INTO words(name, trans, url, idx, display_trans) VALUES (?, ?, ?, ?, ?)',
+                        (name, trans, url, idx, trans))
+
+
+def test_search_not_blocked_by_import_transaction(tmp_path):
+    db_path = str(tmp_path / 'words.db')
+    writer, reader = WordSearch(db_path), WordSearch(db_path)
+    assert reader._conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+    with writer._conn:
+        _insert(writer, 'apple', '苹 果')
+    writer._conn.execute('BEGIN IMMEDIATE')
+    _insert(writer, 'apply', '申 请', idx=1)
+    # 写事务未提交时查询立即返回已提交的数据
+    assert [r['name'] for r in reader.search('app')] == ['apple']
+    writer._conn.commit()
+    assert sorted(r['name'] for r in reader.search('app')) == ['apple', 'apply']
+    assert [r['name'] for r in reader.search('申请')] == ['apply']
+    writer.close()
+    reader.close()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+# 单词驻留表：python -m pytest test_word_table.py
+import gc
+import json
+
+from json_stream import StreamingRecords
+from word_list import PackedRecords, WordList
+from word_table import WordTable, intern_records, intern_word_list
+
+WORDS = [{'name': f'word{i}', 'trans': [f'释义{i}'], 'usphone': 'wɝd', 'ukphone': 'wɜːd'} for i in range(400)]
+
+
+def _write(tmp_path, name, words):
+    path = tmp_path / name
+    path.write_text(json.dumps(words, ensure_ascii=False), encoding='utf-8')
+    return str(path)
+
+
+def test_shared_records_are_counted_once():
+    table = WordTable()
+    first = intern_records(PackedRecords(WORDS), table)
+    second = intern_records(PackedRecords(WORDS[:100]), table)
+    assert len(table) == len(WORDS)
+    assert second.added_bytes == 0
+    assert first.nbytes == first.id_nbytes + table.nbytes
+    assert [second[i] for i in range(100)] == WORDS[:100]
+
+
+def test_released_dicts_free_their_records():
+    table = WordTable()
+    kept = intern_records(PackedRecords(WORDS[:100]), table)
+    dropped = intern_records(PackedRecords(WORDS), table)
+    del dropped
+    gc.collect()
+    assert len(table) == 100
+    assert [kept[i] for i in range(100)] == WORDS[:100]
+    # 释放的 id 被复用，已有词典的记录不受影响
+    intern_records(PackedRecords(WORDS[200:]), table)
+    assert [kept[i] for i in range(100)] == WORDS[:100]
+
+
+def test_intern_word_list_keeps_records():
+    table = WordTable()
+    words = intern_word_list(WordList.from_json_words(WORDS), table)
+    assert [w.to_dict() for w in words] == WORDS
+
+
+def test_streaming_records_intern_while_parsing(tmp_path):
+    table = WordTable()
+    loaded = intern_records(PackedRecords(WORDS[:300]), table)
+    records = StreamingRecords(_write(tmp_path, 'dict.json', WORDS), first_batch=10, table=table)
+    records.wait()
+    assert list(WordList(records)) == [WordList.from_json_words(WORDS)[i] for i in range(len(WORDS))]
+    assert len(table) == len(WORDS)
+    # 与已加载词典重叠的 300 个词条不重复计入
+    assert records.added_bytes == table.nbytes - loaded.added_bytes
+    buf, offsets = records.to_buffers()
+    assert list(PackedRecords.from_buffers(buf, offsets)) == WORDS
+    del records
+    gc.collect()
+    assert len(table) == 300
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# 延迟合并写入：python -m pytest test_write_behind.py
+import threading
+import time
+
+from write_behind import WriteBehind
+
+
+class Recorder:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+        self.started = threading.Event()
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        self.started.set()
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+            self.calls += 1
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_burst_is_coalesced_after_idle_delay():
+    write = Recorder()
+    writer = WriteBehind(write, interval=5.0, idle_delay=0.05)
+    for _ in range(50):
+        writer.mark_dirty()
+    assert _wait_for(lambda: write.calls == 1)
+    time.sleep(0.1)
+    assert write.calls == 1 and not writer.dirty
+    writer.close()
+
+
+def test_continuous_changes_write_every_interval():
+    write = Recorder()
+    writer = WriteBehind(write, interval=0.1, idle_delay=10.0)
+    end = time.monotonic() + 0.35
+    while time.monotonic() < end:
+        writer.mark_dirty()
+        time.sleep(0.01)
+    assert 2 <= write.calls <= 4
+    writer.close()
+
+
+def test_flush_writes_synchronously_and_skips_when_clean():
+    write = Recorder()
+    writer = WriteBehind(write, interval=10.0, idle_delay=10.0)
+    writer.flush()
+    assert write.calls == 0
+    writer.mark_dirty()
+    writer.flush()
+    assert write.calls == 1 and not writer.dirty
+    writer.close()
+    assert write.calls == 1
+
+
+def test_close_waits_for_write_in_progress():
+    write = Recorder(delay=0.2)
+    writer = WriteBehind(write, interval=10.0, idle_delay=0.01)
+    writer.mark_dirty()
+    assert write.started.wait(1.0)
+    writer.mark_dirty()
+    writer.close()
+    # 进行中的一次写完后，close 再同步写入新的改动；两次写入不重叠
+    assert write.calls == 2
+    assert write.max_active == 1
+
+
+def test_write_returning_false_is_not_counted():
+    writer = WriteBehind(lambda: False, interval=10.0, idle_delay=10.0)
+    writer.mark_dirty()
+    writer.flush()
+    assert writer.writes == 0
+    writer.close()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+# 中文释义反查：对词典中每个词条的 trans 建汉字二元组（bigram）倒排索引，单字查询用一元组。
+# 倒排表为 array('I') 词条下标，按词典用 marshal 持久化到快照目录，源文件 size / mtime 不变时直接读取。
+# 查询时先按命中的二元组数量选出候选，再按释义匹配程度排序：
+#   某个义项与查询完全相同 > 某个义项以查询开头 > 释义包含查询 > 只命中部分二元组
+import os
+import re
+import sys
+import time
+from array import array
+from collections import Counter
+
+from atomic_file import atomic_write_marshal, read_marshal
+from dict_snapshot import SNAPSHOT_DIR, snapshot_path_for
+
+INDEX_VERSION = 1
+MAX_CANDIDATES = 500
+
+_CJK_RUN_RE = re.compile(r'[぀-ヿ㐀-䶿一-鿿豈-﫿]+')
+# 义项分隔符，以及义项前的词性标记（如 "vt."、"n."）和括号注释
+_GLOSS_SPLIT_RE = re.compile(r'[；;，,、/\s]+')
+_POS_RE = re.compile(r'^(?:[a-z]+\.)+\s*|[（(][^）)]*[）)]', re.IGNORECASE)
+
+
+def grams_of(text):
+    # 返回 text 中所有汉字一元组与二元组
+    grams = set()
+    for run in _CJK_RUN_RE.findall(text):
+        grams.update(run)
+        grams.update(run[i:i + 2] for i in range(len(run) - 1))
+    return grams
+
+
+def query_grams(query):
+    # 查询用二元组；只有单个汉字时用一元组
+    grams = []
+    for run in _CJK_RUN_RE.findall(query):
+        if len(run) == 1:
+            grams.append(run)
+        else:
+            grams.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return list(dict.fromkeys(grams))
+
+
+def glosses_of(trans):
+    result = []
+    for item in trans:
+        for gloss in _GLOSS_SPLIT_RE.split(_POS_RE.sub('', item)):
+            if gloss:
+                result.append(gloss)
+    return result
+
+
+def match_tier(query, trans):
+    glosses = glosses_of(trans)
+    if query in glosses:
+        return 0
+    if any(g.startswith(query) for g in glosses):
+        return 1
+    if any(query in item for item in trans):
+        return 2
+    return 3
+
+
+class TransIndex:
+    def __init__(self, words, postings=None):
+        self.words = words
+        # gram -> array('I') 或尚未展开的 bytes
+        self._postings = postings if postings is not None else self._build(words)
+
+    @staticmethod
+    def _build(words):
+        postings = {}
+        for i in range(len(words)):
+            for gram in grams_of('；'.join(words[i].trans)):
+                lst = postings.get(gram)
+                if lst is None:
+                    postings[gram] = lst = array('I')
+                lst.append(i)
+        return postings
+
+    def __len__(self):
+        return len(self._postings)
+
+    def posting(self, gram):
+        lst = self._postings.get(gram)
+        if isinstance(lst, bytes):
+            arr = array('I')
+            arr.frombytes(lst)
+            self._postings[gram] = lst = arr
+        return lst or ()
+
+    def search(self, query, limit=20):
+        # 返回按匹配程度排序的词条下标
+        query = (query or '').strip()
+        grams = query_grams(query)
+        if not grams:
+            return []
+        hits = Counter()
+        for gram in grams:
+            hits.update(self.posting(gram))
+        if not hits:
+            return []
+        candidates = hits.most_common(MAX_CANDIDATES)
+        ranked = []
+        for i, n in candidates:
+            trans = self.words[i].trans
+            ranked.append((-n, match_tier(query, trans), sum(map(len, trans)), i))
+        ranked.sort()
+        return [r[3] for r in ranked[:limit]]
+
+    def to_data(self):
+        return {gram: (lst if isinstance(lst, bytes) else lst.tobytes()) for gram, lst in self._postings.items()}
+
+
+def index_path_for(key, snapshot_dir=SNAPSHOT_DIR):
+    return snapshot_path_for(key + '#trans', snapshot_dir)
+
+
+def load_trans_index(key, source_path, words, snapshot_dir=SNAPSHOT_DIR):
+    # key 一般为词典 url；source_path 用于判断持久化的索引是否过期（JSON 文件或 dicts.pack）
+    st = os.stat(source_path)
+    cache_path = index_path_for(key, snapshot_dir)
+    try:
+        data = read_marshal(cache_path)
+        if isinstance(data, dict) and data.get('version') == INDEX_VERSION and data.get('size') == st.st_size \
+                and data.get('mtime_ns') == st.st_mtime_ns and data.get('count') == len(words):
+            return TransIndex(words, data['postings'])
+    except Exception as e:
+        print(f"释义索引读取失败: {cache_path} - {e}")
+    index = TransIndex(words)
+    try:
+        os.makedirs(snapshot_dir, exist_ok=True)
+        atomic_write_marshal(cache_path, {'version': INDEX_VERSION, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+                                          'count': len(words), 'postings': index.to_data()})
+    except Exception as e:
+        print(f"释义索引保存失败: {e}")
+    return index
+
+
+if __name__ == '__main__':
+    from word_list import WordList
+
+    if len(sys.argv) < 3:
+        print('用法: python trans_index.py <词典 json> <中文释义>...')
+        sys.exit(1)
+    path = sys.argv[1]
+    words = WordList.from_file(path)
+    t0 = time.perf_counter()
+    index = load_trans_index(os.path.abspath(path), path, words)
+    print(f'{len(words)} 词条，{len(index)} 个索引项，加载/构建 {(time.perf_counter() - t0) * 1000:.1f} ms')
+    for query in sys.argv[2:]:
+        t0 = time.perf_counter()
+        matches = index.search(query)
+        elapsed = (time.perf_counter() - t0) * 1000
+        print(f'{query}: {elapsed:.3f} ms -> {[words[i].name for i in matches[:8]]}')
@@ -1,60 +1,432 @@
-import re
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# 把 qwerty-learner 风格的 TypeScript 词典注册表（const xxx: DictionaryResource[] = [...]）
+# 转换为 dicts_catalog.json（见 catalog.py），不再生成需要 import 的 Python 源码。
+# - 词法分析 + 递归下降解析对象/数组字面量，支持注释、单双引号/反引号字符串、尾逗号、...展开
+# - 整个目录的 .ts 文件在进程池中并行解析
+# - 按文件内容哈希跳过未改动的文件（解析结果缓存在输出文件旁的 .ts_catalog_cache.json）
+import hashlib
+import json
 import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
-def ts_to_py(ts_content: str) -> str:
-    # 去除类型声明如 `: DictionaryResource[]`
-    ts_content = re.sub(r':\s*DictionaryResource$$\d*\$$', '', ts_content)
+CACHE_FILE = '.ts_catalog_cache.json'
+CACHE_VERSION = 1
 
-    # 替换 const 变量名为 Python 风格
-    ts_content = re.sub(r'const\s+([a-zA-Z0-9_]+)', r'\1 =', ts_content)
+_TOKEN_RE = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<line_comment>//[^\n]*)
+  | (?P<block_comment>/\*.*?\*/)
+  | (?P<string>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*"|`(?:[^`\\]|\\.)*`)
+  | (?P<number>-?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?)
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<spread>\.\.\.)
+  | (?P<punct>=>|[{}\[\]():;,=.<>|&?!@*+\-/%])
+''', re.VERBOSE | re.DOTALL)
 
-    # 将 JavaScript 对象语法转为 Python 字典语法
-    lines = []
-    for line in ts_content.splitlines():
-        line = line.strip()
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+_STATEMENT_KEYWORDS = {'const', 'let', 'var', 'export', 'import', 'function', 'type', 'interface', 'enum', 'class'}
 
-        # 忽略分号和空行
-        if line.endswith(";"):
-            line = line[:-1]
+# TS 字段名 -> catalog 字段名（沿用旧转换器 languageCategory -> language_Category 的命名）
+_KEY_MAP = {'languageCategory': 'language_Category'}
 
-        # 处理 key: value → "key": value
-        line = re.sub(r'^(\s*)([a-zA-Z0-9]+):', r'\1"\2":', line)
 
-        # 特别处理驼峰命名转蛇形命名，如 languageCategory → language_category
-        line = re.sub(r'"(language)([A-Z][a-z]+)(.*?)"', r'"\1_\2\3"', line)
+class TsSyntaxError(ValueError):
+    pass
 
-        # 替换数组为 Python 列表
-        line = line.replace("[", "[").replace("]", "]")
 
-        lines.append(line)
+class Token:
+    __slots__ = ('kind', 'value', 'line', 'comment')
 
-    return "\n".join(lines)
+    def __init__(self, kind, value, line, comment=None):
+        self.kind = kind
+        self.value = value
+        self.line = line
+        self.comment = comment  # 紧挨在该 token 之前的行注释内容
 
-def convert_ts_file_to_py(input_path: str, output_dir: str):
-    with open(input_path, "r", encoding="utf-8") as f:
-        ts_data = f.read()
+    def __repr__(self):
+        return f"Token({self.kind}, {self.value!r}, line={self.line})"
 
-    py_data = ts_to_py(ts_data)
 
-    filename = os.path.splitext(os.path.basename(input_path))[0] + ".py"
-    output_path = os.path.join(output_dir, filename)
+def _unescape(body):
+    out = []
+    i = 0
+    while i < len(body):
+        ch = body[i]
+        if ch != '\\' or i + 1 >= len(body):
+            out.append(ch)
+            i += 1
+            continue
+        nxt = body[i + 1]
+        if nxt == 'u' and body[i + 2:i + 3] == '{':
+            end = body.index('}', i)
+            out.append(chr(int(body[i + 3:end], 16)))
+            i = end + 1
+        elif nxt == 'u':
+            out.append(chr(int(body[i + 2:i + 6], 16)))
+            i += 6
+        elif nxt == 'x':
+            out.append(chr(int(body[i + 2:i + 4], 16)))
+            i += 4
+        elif nxt == '\n':
+            i += 2
+        else:
+            out.append(_ESCAPES.get(nxt, nxt))
+            i += 2
+    return ''.join(out)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(py_data)
 
-    print(f"✅ 已保存到 {output_path}")
+def tokenize(source):
+    tokens = []
+    pos, line = 0, 1
+    pending_comment = None
+    while pos < len(source):
+        m = _TOKEN_RE.match(source, pos)
+        if not m:
+            raise TsSyntaxError(f"第 {line} 行无法识别的字符: {source[pos]!r}")
+        kind, text = m.lastgroup, m.group()
+        if kind == 'line_comment':
+            pending_comment = text[2:].strip()
+        elif kind == 'block_comment':
+            pass
+        elif kind == 'ws':
+            # 空行会切断注释与后续语句的关联
+            if text.count('\n') > 1:
+                pending_comment = None
+        else:
+            if kind == 'string':
+                if text[0] == '`' and '${' in text:
+                    raise TsSyntaxError(f"第 {line} 行不支持带插值的模板字符串")
+                value = _unescape(text[1:-1])
+            elif kind == 'number':
+                value = float(text) if any(c in text for c in '.eE') else int(text)
+            else:
+                value = text
+            tokens.append(Token(kind, value, line, pending_comment))
+            pending_comment = None
+        line += text.count('\n')
+        pos = m.end()
+    tokens.append(Token('eof', None, line))
+    return tokens
 
-if __name__ == "__main__":
-    import sys
 
-    if len(sys.argv) != 3:
-        print("用法: python ts_to_py_converter.py <输入.ts文件路径> <输出目录>")
-        sys.exit(1)
+class Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+        self.consts = {}     # 变量名 -> 值
+        self.comments = {}   # 变量名 -> 声明前的行注释
+
+    def peek(self, offset=0):
+        return self.tokens[min(self.pos + offset, len(self.tokens) - 1)]
+
+    def next(self):
+        tok = self.tokens[self.pos]
+        self.pos += 1
+        return tok
+
+    def at(self, kind, value=None):
+        tok = self.peek()
+        return tok.kind == kind and (value is None or tok.value == value)
+
+    def expect(self, kind, value=None):
+        tok = self.next()
+        if tok.kind != kind or (value is not None and tok.value != value):
+            want = value if value is not None else kind
+            raise TsSyntaxError(f"第 {tok.line} 行期望 {want!r}，实际为 {tok.value!r}")
+        return tok
+
+    def parse_program(self):
+        while not self.at('eof'):
+            start = self.pos
+            try:
+                if not self.parse_statement():
+                    self.pos = start
+                    self.skip_statement()
+            except TsSyntaxError:
+                # 非字面量的语句（函数调用、类型声明等）直接跳过
+                self.pos = start
+                self.skip_statement()
+        return self.consts
+
+    def parse_statement(self):
+        first = self.peek()
+        if self.at('ident', 'export'):
+            self.next()
+        if not (self.at('ident', 'const') or self.at('ident', 'let') or self.at('ident', 'var')):
+            return False
+        self.next()
+        name = self.expect('ident').value
+        if self.at('punct', ':'):
+            self.next()
+            self.skip_type()
+        self.expect('punct', '=')
+        value = self.parse_value()
+        if self.at('ident', 'as'):
+            self.next()
+            self.skip_type()
+        if self.at('punct', ';'):
+            self.next()
+        self.consts[name] = value
+        if first.comment:
+            self.comments[name] = first.comment
+        return True
+
+    def skip_type(self):
+        # 跳过类型注解直到 '='（允许 Record<string, X>、X[] 等）
+        depth = 0
+        while not self.at('eof'):
+            tok = self.peek()
+            if tok.kind == 'punct':
+                if tok.value in ('<', '(', '[', '{'):
+                    depth += 1
+                elif tok.value in ('>', ')', ']', '}'):
+                    depth -= 1
+                elif depth == 0 and tok.value in ('=', ';', ','):
+                    return
+            self.next()
+
+    def skip_statement(self):
+        depth = 0
+        first = True
+        while not self.at('eof'):
+            tok = self.peek()
+            if not first and depth == 0 and tok.kind == 'ident' and tok.value in _STATEMENT_KEYWORDS \
+                    and tok.line > self.tokens[self.pos - 1].line:
+                return
+            first = False
+            self.next()
+            if tok.kind == 'punct':
+                if tok.value in ('{', '[', '('):
+                    depth += 1
+                elif tok.value in ('}', ']', ')'):
+                    depth -= 1
+                elif tok.value == ';' and depth <= 0:
+                    return
+
+    def parse_value(self):
+        tok = self.peek()
+        if tok.kind == 'punct' and tok.value == '{':
+            return self.parse_object()
+        if tok.kind == 'punct' and tok.value == '[':
+            return self.parse_array()
+        if tok.kind in ('string', 'number'):
+            return self.next().value
+        if tok.kind == 'punct' and tok.value == '-' and self.peek(1).kind == 'number':
+            self.next()
+            return -self.next().value
+        if tok.kind == 'ident':
+            self.next()
+            if tok.value == 'true':
+                return True
+            if tok.value == 'false':
+                return False
+            if tok.value in ('null', 'undefined'):
+                return None
+            if tok.value in self.consts and not self.at('punct', '.') and not self.at('punct', '('):
+                return self.consts[tok.value]
+        raise TsSyntaxError(f"第 {tok.line} 行不是字面量: {tok.value!r}")
+
+    def parse_array(self):
+        self.expect('punct', '[')
+        items = []
+        while not self.at('punct', ']'):
+            if self.at('spread'):
+                self.next()
+                ref = self.expect('ident')
+                if ref.value not in self.consts:
+                    raise TsSyntaxError(f"第 {ref.line} 行展开了未定义的变量 {ref.value}")
+                items.extend(self.consts[ref.value])
+            else:
+                items.append(self.parse_value())
+            if not self.at('punct', ','):
+                break
+            self.next()
+        self.expect('punct', ']')
+        return items
+
+    def parse_object(self):
+        self.expect('punct', '{')
+        obj = {}
+        while not self.at('punct', '}'):
+            if self.at('spread'):
+                self.next()
+                ref = self.expect('ident')
+                obj.update(self.consts.get(ref.value) or {})
+            else:
+                key_tok = self.next()
+                if key_tok.kind not in ('ident', 'string', 'number'):
+                    raise TsSyntaxError(f"第 {key_tok.line} 行无效的键: {key_tok.value!r}")
+                key = str(key_tok.value)
+                if self.at('punct', ':'):
+                    self.next()
+                    value = self.parse_value()
+                elif key_tok.kind == 'ident' and key in self.consts:
+                    value = self.consts[key]  # 简写属性 { foo }
+                else:
+                    raise TsSyntaxError(f"第 {key_tok.line} 行缺少 ':'")
+                obj[_KEY_MAP.get(key, key)] = value
+            if not self.at('punct', ','):
+                break
+            self.next()
+        self.expect('punct', '}')
+        return obj
+
+
+def normalize_entry(entry):
+    # qwerty-learner 中 url 为 '/dicts/x.json'，本项目相对运行目录读取
+    url = entry.get('url')
+    if isinstance(url, str) and url.startswith('/'):
+        entry['url'] = '.' + url
+    return entry
+
+
+def is_dict_group(value):
+    return isinstance(value, list) and value and all(isinstance(e, dict) and 'url' in e for e in value)
+
+
+def parse_ts_source(source):
+    # 返回 [(分组名, 注释, 词典条目列表)]，只保留“词典条目数组”的常量，且跳过由其它分组展开而来的汇总数组
+    parser = Parser(tokenize(source))
+    consts = parser.parse_program()
+    groups, seen_ids = [], set()
+    for name, value in consts.items():
+        if not is_dict_group(value):
+            continue
+        ids = {id(e) for e in value}
+        if ids <= seen_ids:
+            continue
+        seen_ids |= ids
+        entries = [normalize_entry(dict(e)) for e in value]
+        groups.append((name, parser.comments.get(name), entries))
+    return groups
 
-    input_file = sys.argv[1]
-    output_folder = sys.argv[2]
 
-    if not os.path.exists(output_folder):
-        os.makedirs(output_folder)
+def _parse_file(path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha1(raw).hexdigest()
+    try:
+        return path, digest, parse_ts_source(raw.decode('utf-8')), None
+    except Exception as e:
+        return path, digest, None, str(e)
+
+
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == CACHE_VERSION:
+            return cache.get('files') or {}
+    except Exception:
+        pass
+    return {}
+
+
+def _read_text(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return ''
+
+
+def collect_ts_files(input_path):
+    if os.path.isfile(input_path):
+        return [os.path.abspath(input_path)]
+    found = []
+    for dirpath, _, filenames in os.walk(input_path):
+        for fn in filenames:
+            if fn.endswith('.ts') and not fn.endswith('.d.ts'):
+                found.append(os.path.abspath(os.path.join(dirpath, fn)))
+    return sorted(found)
+
+
+def convert_ts_to_catalog(input_path, output_path, workers=None):
+    from catalog import load_catalog, write_catalog
+
+    ts_files = collect_ts_files(input_path)
+    cache_path = os.path.join(os.path.dirname(os.path.abspath(output_path)), CACHE_FILE)
+    cache = _load_cache(cache_path)
+
+    parsed, changed = {}, []
+    for path in ts_files:
+        cached = cache.get(path)
+        if cached and cached.get('sha1') == _file_digest(path):
+            parsed[path] = cached['groups']
+        else:
+            changed.append(path)
+
+    if changed:
+        if len(changed) == 1:
+            results = [_parse_file(changed[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_parse_file, changed))
+        for path, digest, groups, error in results:
+            if error:
+                print(f"❌ 解析失败: {path} - {error}")
+                continue
+            parsed[path] = groups
+            cache[path] = {'sha1': digest, 'groups': groups}
+            print(f"✅ 已解析 {os.path.relpath(path)}（{len(groups)} 个分组）")
+
+    # 合并到现有目录：同名分组整体替换，托盘菜单 all_dicts 保持原样，新分组追加到菜单末尾
+    try:
+        existing = load_catalog(output_path) if os.path.exists(output_path) else None
+    except Exception as e:
+        print(f"现有词典目录读取失败，将重新生成: {e}")
+        existing = None
+    groups = dict(existing.groups) if existing else {}
+    menu = {}
+    if existing:
+        with open(output_path, 'r', encoding='utf-8') as f:
+            menu = json.load(f).get('all_dicts') or {}
+    known_groups = set(groups)
+    for path in ts_files:
+        for name, comment, entries in parsed.get(path) or []:
+            groups[name] = entries
+            if name not in known_groups and name not in menu.values():
+                label = comment or (entries[0].get('category') if entries else name) or name
+                if label in menu:
+                    # 菜单名已被其它分组占用（如新分组的首个分类也叫“中国考试”）：加上分组名区分，不覆盖原有项
+                    taken = label
+                    label = f'{taken}（{name}）'
+                    n = 2
+                    while label in menu:
+                        label = f'{taken}（{name} {n}）'
+                        n += 1
+                    print(f"⚠️ 菜单名 {taken} 已被分组 {menu[taken]} 使用，分组 {name} 改用 {label}")
+                menu[label] = name
+
+    before = _read_text(output_path)
+    write_catalog(groups, menu, output_path)
+    after = _read_text(output_path)
+
+    live = {p: cache[p] for p in ts_files if p in cache}
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': CACHE_VERSION, 'files': live}, f, ensure_ascii=False)
+    os.replace(tmp_path, cache_path)
+
+    total = sum(len(v) for v in groups.values())
+    status = '已更新' if before != after else '无变化'
+    print(f"{status} {output_path}：{len(groups)} 个分组，{total} 个词典（解析 {len(changed)} 个文件，跳过 {len(ts_files) - len(changed)} 个）")
+    return groups
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("用法: python ts_to_py_converter.py <.ts 文件或目录> [输出 dicts_catalog.json]")
+        sys.exit(1)
 
-    convert_ts_file_to_py(input_file, output_folder)
\ No newline at end of file
+    from catalog import catalog_path
+    convert_ts_to_catalog(sys.argv[1], sys.argv[2] if len(sys.argv) == 3 else catalog_path())
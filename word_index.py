@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# 当前词典的单词名索引：按小写 name 排序的下标数组 + bisect 做前缀查找；
+# 子串查找在所有 name 用 '\n' 拼成的一个字符串上用 str.find（C 层）扫描，再用 bisect 把偏移映射回词条。
+from array import array
+from bisect import bisect_left, bisect_right
+
+_SEP = '\n'
+
+
+class PrefixIndex:
+    def __init__(self, words):
+        n = len(words)
+        names = [(words[i].name or '').lower() for i in range(n)]
+        order = sorted(range(n), key=names.__getitem__)
+        self._keys = [names[i] for i in order]
+        self._order = array('I', order)
+        # 按原顺序拼接，子串命中按词典顺序返回
+        self._joined = _SEP.join(names)
+        self._starts = array('I')
+        pos = 0
+        for name in names:
+            self._starts.append(pos)
+            pos += len(name) + 1
+
+    def __len__(self):
+        return len(self._order)
+
+    def find_prefix(self, prefix, limit=20):
+        # 返回 name 以 prefix 开头（忽略大小写）的词条下标，按字母序
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        lo = bisect_left(self._keys, prefix)
+        hi = min(lo + limit, len(self._keys))
+        result = []
+        for k in range(lo, hi):
+            if not self._keys[k].startswith(prefix):
+                break
+            result.append(self._order[k])
+        return result
+
+    def find_substring(self, text, limit=20, exclude=()):
+        text = text.strip().lower()
+        if not text or _SEP in text:
+            return []
+        result = []
+        seen = set(exclude)
+        pos = self._joined.find(text)
+        while pos >= 0 and len(result) < limit:
+            index = bisect_right(self._starts, pos) - 1
+            if index not in seen:
+                seen.add(index)
+                result.append(index)
+            # 跳到下一个词条开头继续找，同一词条只计一次
+            next_start = self._starts[index + 1] if index + 1 < len(self._starts) else len(self._joined)
+            pos = self._joined.find(text, next_start)
+        return result
+
+    def lookup(self, text, limit=20):
+        # 前缀匹配优先，不足 limit 时用子串匹配补齐
+        matches = self.find_prefix(text, limit)
+        if len(matches) < limit:
+            matches += self.find_substring(text, limit - len(matches), exclude=matches)
+        return matches
+
+    def exact(self, name):
+        # 与 name 完全相同（忽略大小写）的第一个词条下标（原词典顺序），找不到返回 None
+        key = name.strip().lower()
+        lo = bisect_left(self._keys, key)
+        hi = bisect_right(self._keys, key, lo)
+        if lo == hi:
+            return None
+        return min(self._order[lo:hi])
+
+
+if __name__ == '__main__':
+    import sys
+    import time
+
+    from word_list import WordList
+
+    if len(sys.argv) < 3:
+        print('用法: python word_index.py <词典 json> <查询>...')
+        sys.exit(1)
+    words = WordList.from_file(sys.argv[1])
+    t0 = time.perf_counter()
+    index = PrefixIndex(words)
+    print(f'{len(index)} 词条，建索引 {(time.perf_counter() - t0) * 1000:.1f} ms')
+    for query in sys.argv[2:]:
+        t0 = time.perf_counter()
+        matches = index.lookup(query)
+        elapsed = (time.perf_counter() - t0) * 1000
+        print(f'{query!r}: {elapsed:.3f} ms -> {[words[i].name for i in matches[:8]]}')
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# 惰性词表：WordList 只保存紧凑的编码记录，访问某个下标时才生成 __slots__ 的 Word 对象
+import gc
+import json
+import os
+import subprocess
+import sys
+from array import array
+
+from compiled_dict import encode_record, decode_record, open_compiled_dict
+from dict_snapshot import load_snapshot, save_snapshot
+from json_stream import StreamingRecords
+
+
+DISPLAY_CACHE_SIZE = 4096
+
+
+def render_word(word):
+    # 窗口显示用的三行文本：单词、音标行、以“；”连接的释义
+    return word.name, f"US: /{word.usphone}/   UK: /{word.ukphone}/", '；'.join(word.trans)
+
+
+class Word:
+    __slots__ = ('name', 'trans', 'usphone', 'ukphone')
+
+    def __init__(self, name='', trans=(), usphone='', ukphone=''):
+        self.name = name
+        self.trans = trans
+        self.usphone = usphone
+        self.ukphone = ukphone
+
+    @classmethod
+    def from_dict(cls, d):
+        trans = d.get('trans') or ()
+        if isinstance(trans, str):
+            trans = (trans,)
+        return cls(d.get('name', '') or '', tuple(trans), d.get('usphone', '') or '', d.get('ukphone', '') or '')
+
+    def get(self, key, default=None):
+        # 兼容旧代码中 word.get('name', '') 的写法
+        if key in Word.__slots__:
+            return getattr(self, key)
+        return default
+
+    def to_dict(self):
+        return {'name': self.name, 'trans': list(self.trans), 'usphone': self.usphone, 'ukphone': self.ukphone}
+
+    def __eq__(self, other):
+        if not isinstance(other, Word):
+            return NotImplemented
+        return (self.name, self.trans, self.usphone, self.ukphone) == \
+            (other.name, other.trans, other.usphone, other.ukphone)
+
+    def __repr__(self):
+        return f"Word({self.name!r})"
+
+
+class PackedRecords:
+    """把 JSON 词条压成一块 bytes + 偏移数组，记录格式与 compiled_dict 相同。"""
+
+    def __init__(self, words):
+        offsets = array('I', [0])
+        buf = bytearray()
+        for w in words:
+            buf += encode_record(w)
+            offsets.append(len(buf))
+        self._buf = bytes(buf)
+        self._offsets = offsets
+
+    @classmethod
+    def from_buffers(cls, buf, offsets_bytes):
+        records = cls.__new__(cls)
+        records._buf = buf
+        records._offsets = array('I')
+        records._offsets.frombytes(offsets_bytes)
+        return records
+
+    def to_buffers(self):
+        return self._buf, self._offsets.tobytes()
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def raw_record(self, index):
+        return self._buf[self._offsets[index]:self._offsets[index + 1]]
+
+    def __getitem__(self, index):
+        return decode_record(self.raw_record(index))
+
+    @property
+    def nbytes(self):
+        return len(self._buf) + self._offsets.itemsize * len(self._offsets)
+
+
+class WordList:
+    """支持 len / 下标 / 迭代的只读序列，source 可以是 CompiledDict、PackedRecords 或 dict 列表。"""
+
+    def __init__(self, source):
+        self._source = source if source is not None else []
+        self._last = (-1, None)
+        self._display = {}  # index -> render_word 结果，超过 DISPLAY_CACHE_SIZE 时按插入顺序淘汰
+
+    def __len__(self):
+        return len(self._source)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self._source)
+        if index < 0:
+            index += n
+        # 流式解析中的词表允许访问尚未解析的下标，由 raw_record 等待解析或在解析结束后抛出 IndexError
+        if index < 0 or (index >= n and getattr(self._source, 'done', True)):
+            raise IndexError('词条下标越界')
+        # update_display / 点击发音 / 标记 通常连续访问同一下标，缓存最近一个即可
+        last_index, last_word = self._last
+        if last_index == index:
+            return last_word
+        word = Word.from_dict(self._source[index])
+        self._last = (index, word)
+        return word
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def display(self, index):
+        cached = self._display.get(index)
+        if cached is not None:
+            return cached
+        rendered = render_word(self[index])
+        if len(self._display) >= DISPLAY_CACHE_SIZE:
+            del self._display[next(iter(self._display))]
+        self._display[index] = rendered
+        return rendered
+
+    def prepare_display(self):
+        # 在加载阶段（通常是后台线程）预先生成显示文本；大词典只在访问时生成并缓存
+        if not getattr(self._source, 'done', True):
+            return
+        n = len(self)
+        if n > DISPLAY_CACHE_SIZE:
+            return
+        for i in range(n):
+            self.display(i)
+
+    @property
+    def source(self):
+        return self._source
+
+    @property
+    def nbytes(self):
+        return getattr(self._source, 'nbytes', 0)
+
+    @classmethod
+    def from_json_words(cls, words):
+        return cls(PackedRecords(words or []))
+
+    @classmethod
+    def from_file(cls, full_path, snapshot_key=None, stream_threshold=None, length_hint=None, intern_table=None):
+        # 加载顺序：编译好的 .sdd -> 持久化快照（传入 snapshot_key 时）-> 解析 JSON 并写快照
+        # 文件不小于 stream_threshold 字节时改为流式解析，后台解析完成后再写快照；
+        # 传入 intern_table 时流式解析的词条边解析边放入该 WordTable（其它方式由调用方用 intern_word_list 驻留）
+        compiled = open_compiled_dict(full_path)
+        if compiled is not None:
+            return cls(compiled)
+        if snapshot_key:
+            buffers = load_snapshot(full_path, key=snapshot_key)
+            if buffers is not None:
+                return cls(PackedRecords.from_buffers(*buffers))
+        if stream_threshold is not None and os.path.getsize(full_path) >= stream_threshold:
+            def save_when_done(records):
+                save_snapshot(full_path, *records.to_buffers(), key=snapshot_key)
+            return cls(StreamingRecords(full_path, length_hint, on_done=save_when_done if snapshot_key else None,
+                                        table=intern_table))
+        with open(full_path, 'r', encoding='utf-8') as f:
+            words = cls.from_json_words(json.load(f))
+        if snapshot_key:
+            save_snapshot(full_path, *words.source.to_buffers(), key=snapshot_key)
+        return words
+
+
+# ---------------------------------------------------------------------------
+# 内存基准：对 all_dicts 中的每个词典，分别在子进程中以 list-of-dicts 与 WordList 方式加载，
+# 比较峰值 RSS 与加载完成后的 RSS
+# 用法: python word_list.py --bench [词典根目录]
+
+def _peak_rss_kb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _current_rss_kb():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except Exception:
+        return None
+
+
+def _bench_child(mode, full_path):
+    # 没有 RSS 接口的平台（如 Windows）退回到 tracemalloc 统计的 Python 堆
+    use_tracemalloc = _peak_rss_kb() is None
+    if use_tracemalloc:
+        import tracemalloc
+        tracemalloc.start()
+    if mode == 'dicts':
+        with open(full_path, 'r', encoding='utf-8') as f:
+            words = json.load(f)
+    else:
+        words = WordList.from_file(full_path)
+        words[len(words) // 2]
+    gc.collect()
+    if use_tracemalloc:
+        current, peak = tracemalloc.get_traced_memory()
+        peak_kb, retained_kb = peak // 1024, current // 1024
+    else:
+        peak_kb, retained_kb = _peak_rss_kb(), _current_rss_kb()
+    print(json.dumps({'count': len(words), 'peak_rss_kb': peak_kb, 'retained_kb': retained_kb}))
+
+
+def run_memory_benchmark(base_dir='.'):
+    from catalog import get_catalog
+    print(f"{'词典':<28}{'词数':>7}{'dicts 峰值RSS':>14}{'WordList 峰值RSS':>17}{'dicts 保留':>11}{'WordList 保留':>14}")
+    for entry in get_catalog().iter_entries():
+        full_path = os.path.join(base_dir, entry['url'])
+        if not os.path.exists(full_path):
+            continue
+        results = {}
+        for mode in ('dicts', 'wordlist'):
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), '--bench-child', mode, full_path],
+                                 capture_output=True, text=True, encoding='utf-8')
+            try:
+                results[mode] = json.loads(out.stdout.strip().splitlines()[-1])
+            except Exception:
+                print(f"基准子进程失败: {entry['url']} - {out.stderr.strip()}")
+                break
+        if len(results) != 2:
+            continue
+        d, w = results['dicts'], results['wordlist']
+        print(f"{entry['name']:<28}{d['count']:>7}{str(d['peak_rss_kb']) + 'KB':>14}{str(w['peak_rss_kb']) + 'KB':>17}"
+              f"{str(d['retained_kb']) + 'KB':>11}{str(w['retained_kb']) + 'KB':>14}")
+
+
+# ---------------------------------------------------------------------------
+# 滚动处理耗时基准：旧 update_display 中逐次拼接 f-string / join 与预生成显示文本的对比（不含 Tk 调用）
+# 用法: python word_list.py --bench-display <词典.json>
+
+def run_display_benchmark(full_path, rounds=3):
+    import time
+
+    with open(full_path, 'r', encoding='utf-8') as f:
+        raw_words = json.load(f)
+    n = len(raw_words)
+
+    def old_handler(i):
+        word = raw_words[i]
+        name = word.get('name', '')
+        phone = f"US: /{word.get('usphone', '')}/   UK: /{word.get('ukphone', '')}/"
+        trans = '；'.join(word.get('trans', []))
+        return name, phone, trans
+
+    def timed(fn, indexes):
+        t0 = time.perf_counter()
+        for i in indexes:
+            fn(i)
+        return (time.perf_counter() - t0) / len(indexes) * 1e6
+
+    indexes = list(range(min(n, DISPLAY_CACHE_SIZE))) * rounds
+    words = WordList.from_json_words(raw_words)
+    cold = timed(words.display, list(range(min(n, DISPLAY_CACHE_SIZE))))
+    warm = timed(words.display, indexes)
+    prepared = WordList.from_json_words(raw_words)
+    t0 = time.perf_counter()
+    prepared.prepare_display()
+    prepare_ms = (time.perf_counter() - t0) * 1000
+    print(f"{os.path.basename(full_path)}（{n} 词）每次滚动的文本准备耗时：")
+    print(f"  旧: dict + f-string + join      : {timed(old_handler, indexes):6.2f} µs")
+    print(f"  新: 首次访问（解码 + 生成）      : {cold:6.2f} µs")
+    print(f"  新: 命中缓存                    : {warm:6.2f} µs")
+    print(f"  prepare_display 预生成耗时      : {prepare_ms:6.1f} ms（{'全部预生成' if n <= DISPLAY_CACHE_SIZE else '超过上限，按需生成'}）")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 4 and sys.argv[1] == '--bench-child':
+        _bench_child(sys.argv[2], sys.argv[3])
+    elif len(sys.argv) >= 3 and sys.argv[1] == '--bench-display':
+        run_display_benchmark(sys.argv[2])
+    elif len(sys.argv) >= 2 and sys.argv[1] == '--bench':
+        run_memory_benchmark(sys.argv[2] if len(sys.argv) > 2 else '.')
+    else:
+        print("用法: python word_list.py --bench [词典根目录] | --bench-display <词典.json>")
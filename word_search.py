@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# 全词典搜索：把 catalog 中的所有词典导入同一个 SQLite 数据库，并在 name / trans 上建立 FTS5 索引
+# unicode61 分词器会把连续的中文当成一个词，所以入库时在每个汉字之间插入空格，
+# 查询中文时按“逐字短语”匹配，例如 "取消" -> "取 消"
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import threading
+
+from word_list import WordList
+
+SEARCH_DB_PATH = os.path.join(tempfile.gettempdir(), 'study_desk_words.db')
+
+_CJK_RE = re.compile(r'([぀-ヿ㐀-䶿一-鿿豈-﫿])')
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dicts(
+    url TEXT PRIMARY KEY,
+    size INTEGER,
+    mtime_ns INTEGER,
+    count INTEGER
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS words USING fts5(
+    name, trans, url UNINDEXED, idx UNINDEXED, display_trans UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+def split_cjk(text):
+    return _CJK_RE.sub(r' \1 ', text)
+
+
+def has_cjk(text):
+    return bool(_CJK_RE.search(text))
+
+
+def build_match_query(query):
+    # 英文按单词前缀匹配 name；含中文时按逐字短语匹配 trans
+    query = (query or '').strip()
+    if not query:
+        return None
+    if has_cjk(query):
+        chars = [t for t in split_cjk(query).split() if _TOKEN_RE.fullmatch(t)]
+        if not chars:
+            return None
+        return 'trans : "' + ' '.join(chars) + '"'
+    tokens = _TOKEN_RE.findall(query)
+    if not tokens:
+        return None
+    return 'name : ' + ' '.join(f'"{t}"*' for t in tokens)
+
+
+class WordSearch:
+    def __init__(self, db_path=SEARCH_DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        # WAL 模式下后台导入的写事务不阻塞界面线程上的查询（回滚日志模式下查询要等到事务提交）
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def is_empty(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM dicts').fetchone()[0] == 0
+
+    def import_dict(self, url, full_path, words=None):
+        # 与上次导入时 size / mtime 相同则跳过；返回是否重新导入
+        # 从词典包导入时 full_path 为 dicts.pack，words 为包中该词典的视图
+        st = os.stat(full_path)
+        with self._lock:
+            row = self._conn.execute('SELECT size, mtime_ns FROM dicts WHERE url = ?', (url,)).fetchone()
+        if row and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+            return False
+        if words is None:
+            words = WordList.from_file(full_path)
+        rows = []
+        for i, word in enumerate(words):
+            joined = '；'.join(word.trans)
+            rows.append((word.name, split_cjk(joined), url, i, joined))
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM words WHERE url = ?', (url,))
+            self._conn.executemany(
+                'INSERT INTO words(name, trans, url, idx, display_trans) VALUES (?, ?, ?, ?, ?)', rows)
+            self._conn.execute('INSERT OR REPLACE INTO dicts(url, size, mtime_ns, count) VALUES (?, ?, ?, ?)',
+                               (url, st.st_size, st.st_mtime_ns, len(rows)))
+        return True
+
+    def prune(self, urls):
+        # 删除已不在 catalog 中的词典；返回删除的词典数
+        keep = set(urls)
+        with self._lock:
+            stale = [url for (url,) in self._conn.execute('SELECT url FROM dicts') if url not in keep]
+            if stale:
+                with self._conn:
+                    for url in stale:
+                        self._conn.execute('DELETE FROM words WHERE url = ?', (url,))
+                        self._conn.execute('DELETE FROM dicts WHERE url = ?', (url,))
+        return len(stale)
+
+    def search(self, query, limit=20):
+        match = build_match_query(query)
+        if not match:
+            return []
+        with self._lock:
+            try:
+                cur = self._conn.execute(
+                    'SELECT name, display_trans, url, idx FROM words WHERE words MATCH ? '
+                    'ORDER BY bm25(words, 10.0, 1.0), length(name) LIMIT ?', (match, limit))
+                rows = cur.fetchall()
+            except sqlite3.Error as e:
+                print(f"搜索失败: {query} - {e}")
+                return []
+        return [{'name': r[0], 'trans': r[1], 'url': r[2], 'index': int(r[3])} for r in rows]
+
+
+def build_search_db(base_dir='.', db_path=SEARCH_DB_PATH):
+    from catalog import get_catalog
+    from dict_pack import PACK_FILE, get_pack
+    pack = get_pack(os.path.join(base_dir, PACK_FILE))
+    store = WordSearch(db_path)
+    imported, skipped, missing, removed = 0, 0, 0, 0
+    urls = list(get_catalog().iter_urls(menu_only=False))
+    try:
+        for url in urls:
+            full_path = os.path.join(base_dir, url)
+            words = None
+            if not os.path.exists(full_path):
+                if pack is None or url not in pack:
+                    missing += 1
+                    continue
+                full_path, words = pack.path, WordList(pack.open_dict(url))
+            try:
+                if store.import_dict(url, full_path, words):
+                    imported += 1
+                else:
+                    skipped += 1
+            except Exception as e:
+                print(f"导入失败: {url} - {e}")
+        removed = store.prune(urls)
+    finally:
+        store.close()
+    print(f"搜索索引完成：导入 {imported}，未变化 {skipped}，缺失 {missing}，移除 {removed}")
+    return imported
+
+
+if __name__ == "__main__":
+    build_search_db(sys.argv[1] if len(sys.argv) > 1 else '.')
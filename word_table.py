@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# 全局单词驻留表：每个不同的 name + 音标 只保存一份编码记录，释义（各词典写法常有差异）单独驻留；
+# 每个词典只保留两个 array('I')（单词 id、释义 id），CET-4 / CET-6 / 考研等高度重叠的词典共享同一份数据。
+# 表项带引用计数：InternedDict 被回收（如从 DictCache 淘汰且界面不再持有）时释放它引用的表项，
+# 不再被任何词典使用的记录随之删除；每个词典的 nbytes 计入 id 数组与它首次放入表中的记录字节数。
+import os
+import sys
+import threading
+import weakref
+from array import array
+
+from compiled_dict import decode_record, FIELD_SEP
+from word_list import WordList, PackedRecords
+
+_SEP = FIELD_SEP.encode('utf-8')
+
+
+class _InternPool:
+    def __init__(self):
+        self.items = []
+        self.ids = {}
+        self.refs = array('I')
+        self.free = []          # 已释放、可复用的 id
+        self.nbytes = 0
+
+    def __len__(self):
+        return len(self.ids)
+
+    def intern(self, value):
+        # 返回 (id, 新增字节数)；已存在的记录只增加引用计数
+        item_id = self.ids.get(value)
+        if item_id is not None:
+            self.refs[item_id] += 1
+            return item_id, 0
+        if self.free:
+            item_id = self.free.pop()
+            self.items[item_id] = value
+            self.refs[item_id] = 1
+        else:
+            item_id = len(self.items)
+            self.items.append(value)
+            self.refs.append(1)
+        self.ids[value] = item_id
+        self.nbytes += len(value)
+        return item_id, len(value)
+
+    def release(self, item_id):
+        self.refs[item_id] -= 1
+        if not self.refs[item_id]:
+            value = self.items[item_id]
+            self.items[item_id] = None
+            del self.ids[value]
+            self.free.append(item_id)
+            self.nbytes -= len(value)
+
+
+class WordTable:
+    def __init__(self):
+        self._heads = _InternPool()   # name \x1f usphone \x1f ukphone
+        self._tails = _InternPool()   # trans [\x1f 其它字段]
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._heads)
+
+    @property
+    def trans_count(self):
+        return len(self._tails)
+
+    def intern_raw(self, raw):
+        # raw 为 compiled_dict 格式的编码记录，按第三个分隔符拆成 单词 / 释义 两部分；
+        # 返回 (单词 id, 释义 id, 新增字节数)
+        parts = raw.split(_SEP, 3)
+        head = _SEP.join(parts[:3])
+        tail = parts[3] if len(parts) > 3 else b''
+        with self._lock:
+            head_id, head_added = self._heads.intern(head)
+            tail_id, tail_added = self._tails.intern(tail)
+        return head_id, tail_id, head_added + tail_added
+
+    def release_ids(self, head_ids, tail_ids):
+        with self._lock:
+            for head_id in head_ids:
+                self._heads.release(head_id)
+            for tail_id in tail_ids:
+                self._tails.release(tail_id)
+
+    def raw_record(self, head_id, tail_id):
+        return self._heads.items[head_id] + _SEP + self._tails.items[tail_id]
+
+    def get(self, head_id, tail_id):
+        return decode_record(self.raw_record(head_id, tail_id))
+
+    @property
+    def nbytes(self):
+        return self._heads.nbytes + self._tails.nbytes
+
+
+class InternedDict:
+    """词典视图：只持有 WordTable 中的单词 id 与释义 id，每个词条占 8 字节；对象被回收时释放这些表项。"""
+
+    def __init__(self, table, head_ids, tail_ids, added_bytes=0):
+        self.table = table
+        self.head_ids = head_ids
+        self.tail_ids = tail_ids
+        self.added_bytes = added_bytes
+        weakref.finalize(self, table.release_ids, head_ids, tail_ids)
+
+    def __len__(self):
+        return len(self.head_ids)
+
+    def raw_record(self, index):
+        return self.table.raw_record(self.head_ids[index], self.tail_ids[index])
+
+    def __getitem__(self, index):
+        return self.table.get(self.head_ids[index], self.tail_ids[index])
+
+    @property
+    def id_nbytes(self):
+        return self.head_ids.itemsize * len(self.head_ids) * 2
+
+    @property
+    def nbytes(self):
+        # 与先加载的词典共享的记录不重复计入，本词典首次放入表中的记录计入
+        return self.id_nbytes + self.added_bytes
+
+
+def intern_records(source, table):
+    # source 为任何提供 raw_record 的记录序列（PackedRecords / CompiledDict）
+    head_ids, tail_ids = array('I'), array('I')
+    added_bytes = 0
+    for i in range(len(source)):
+        head_id, tail_id, added = table.intern_raw(source.raw_record(i))
+        head_ids.append(head_id)
+        tail_ids.append(tail_id)
+        added_bytes += added
+    return InternedDict(table, head_ids, tail_ids, added_bytes)
+
+
+def intern_word_list(words, table):
+    # 只处理内存中的 PackedRecords；流式解析的词表在解析时已驻留（StreamingRecords 的 table 参数）。
+    # mmap 的 .sdd 与 dicts.pack 中按块解压的词典不占常驻堆内存，驻留反而要在切换词典时读出全部词条，保持原样
+    source = getattr(words, 'source', None)
+    if not isinstance(source, PackedRecords):
+        return words
+    return WordList(intern_records(source, table))
+
+
+def report_dedup(base_dir='.'):
+    from catalog import get_catalog
+    table = WordTable()
+    total, packed_bytes, id_bytes, loaded = 0, 0, 0, 0
+    interned_dicts = []     # 保持引用，否则前面的词典被回收后表项会被释放
+    for url in get_catalog().iter_urls(menu_only=False):
+        full_path = os.path.join(base_dir, url)
+        if not os.path.exists(full_path):
+            continue
+        try:
+            words = WordList.from_file(full_path)
+        except Exception as e:
+            print(f"加载失败: {url} - {e}")
+            continue
+        source = words.source
+        interned = intern_records(source, table)
+        interned_dicts.append(interned)
+        loaded += 1
+        total += len(interned)
+        packed_bytes += sum(len(source.raw_record(i)) for i in range(len(source)))
+        id_bytes += interned.id_nbytes
+    if not total:
+        print("没有找到可用的词典文件")
+        return
+    unique = len(table)
+    print(f"词典数: {loaded}  词条总数: {total}")
+    print(f"去重后单词（name+音标）: {unique}  去重比: {total / unique:.2f}x")
+    print(f"去重后释义: {table.trans_count}")
+    print(f"记录字节: 各词典独立 {packed_bytes // 1024} KB -> 共享表 {table.nbytes // 1024} KB + id 数组 {id_bytes // 1024} KB")
+
+
+if __name__ == "__main__":
+    report_dedup(sys.argv[1] if len(sys.argv) > 1 else '.')
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# 延迟合并写入：调用方每次改动只标记 dirty，后台线程在改动停止 idle_delay 秒后、
+# 或距第一次未保存的改动满 interval 秒时（连续滚动也保证至少每 interval 秒落盘一次）调用一次 write。
+# flush() 在调用线程中同步写入尚未保存的改动；后台线程正在写入时先等它写完，返回时磁盘上已是最新内容。
+# 退出前调用 close()。
+import threading
+import time
+
+DEFAULT_INTERVAL = 2.0
+DEFAULT_IDLE_DELAY = 0.5
+
+
+class WriteBehind:
+    def __init__(self, write, interval=DEFAULT_INTERVAL, idle_delay=DEFAULT_IDLE_DELAY):
+        self._write = write
+        self.interval = interval
+        self.idle_delay = idle_delay
+        self.writes = 0
+        self._dirty_since = None    # 第一次未保存改动的时间
+        self._last_change = 0.0
+        self._cond = threading.Condition()
+        self._writing = False       # 有一次写入正在进行（后台线程或 flush）
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def dirty(self):
+        return self._dirty_since is not None
+
+    def mark_dirty(self):
+        now = time.monotonic()
+        with self._cond:
+            self._last_change = now
+            if self._dirty_since is None:
+                self._dirty_since = now
+                self._cond.notify()
+
+    def _due_in(self, now):
+        return min(self._last_change + self.idle_delay, self._dirty_since + self.interval) - now
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and self._dirty_since is None:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                delay = self._due_in(time.monotonic())
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                if self._writing:
+                    self._cond.wait()
+                    continue
+                self._dirty_since = None
+                self._writing = True
+            self._do_write()
+
+    def _do_write(self):
+        # 调用前已在 _cond 内把 _writing 置为 True，保证同一时刻只有一次写入
+        try:
+            if self._write() is not False:
+                self.writes += 1
+        except Exception as e:
+            print(f"延迟写入失败: {e}")
+        finally:
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
+
+    def flush(self):
+        with self._cond:
+            self._cond.wait_for(lambda: not self._writing)
+            if self._dirty_since is None:
+                return
+            self._dirty_since = None
+            self._writing = True
+        self._do_write()
+
+    def close(self):
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify()